@@ -0,0 +1,745 @@
+# =============================================================================
+# JANUS ENGINE v10.6 LENS CATALOG
+# Compiles the lens library (lenses.py) into a compact artifact with precomputed
+# indexes and serves it at runtime without importing lenses.py.
+#
+# Build:   python lens_catalog.py
+# Runtime: from lens_catalog import SORTED_LENS_NAMES, get_lens_data, ...
+#
+# The artifact stores the derived structures (eras, hierarchies, persona metadata)
+# by integer lens ID. Descriptions and primers are stored as separate blobs that are
+# only read from the (memory-mapped) artifact when a lens record is requested.
+#
+# v10.6: Hot reload. A watcher thread polls the artifact; when it changes, a complete new
+# LensCatalog snapshot (with its derived indexes) is loaded off to the side and swapped in
+# with a single assignment. Readers keep whatever snapshot they obtained from get_catalog(),
+# so a reload never mixes two catalog versions. The server never compiles: after editing
+# lenses.py, run `python lens_catalog.py` and running workers pick up the new artifact.
+#
+# v10.6: Lens relations. The build step also scores every lens pair for contrast
+# (thesis/antithesis) and complementarity (balanced Symposium sets) and stores both
+# matrices as one byte per pair, so pairings can be suggested without an API call.
+# =============================================================================
+
+import os
+import re
+import json
+import math
+import mmap
+import base64
+import heapq
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict, Counter
+from collections.abc import Mapping
+
+CATALOG_FORMAT_VERSION = 3
+CATALOG_SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lenses.py")
+CATALOG_ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lens_catalog.dat")
+LAZY_RECORD_CACHE_SIZE = 32  # Full lens records (with primers) kept in memory at once
+CATALOG_WATCH_INTERVAL = 2.0  # Seconds between checks for a changed lens library or artifact
+
+
+def _sha256(data: bytes):
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_source_checksum(source_path=CATALOG_SOURCE_PATH):
+    """Checksum of the lens library source, used to detect a stale artifact."""
+    with open(source_path, "rb") as f:
+        return _sha256(f.read())
+
+
+# -----------------------------------------------------------------------------
+# 1. BUILD STEP
+# -----------------------------------------------------------------------------
+
+def compile_catalog(artifact_path=CATALOG_ARTIFACT_PATH, source_path=CATALOG_SOURCE_PATH):
+    """
+    Compiles lenses.py into the catalog artifact.
+
+    Layout (UTF-8):
+        line 1: header JSON (format, source checksum, checksum of everything after line 1)
+        line 2: index JSON (names, derived structures by lens ID, blob offsets, relation matrices)
+        rest:   concatenated JSON blobs (per lens: description, then heavy fields)
+
+    Returns: the artifact bytes (also written atomically to artifact_path unless it is None).
+    """
+    # Only the offline build step pays for importing the source module
+    import lenses
+
+    lens_names = list(lenses.SORTED_LENS_NAMES)
+    lens_ids = {name: i for i, name in enumerate(lens_names)}
+    persona_names = list(lenses.SORTED_PERSONA_NAMES)
+    persona_ids = {name: i for i, name in enumerate(persona_names)}
+
+    def to_ids(names):
+        return [lens_ids[name] for name in names if name in lens_ids]
+
+    # Category tables, so persona metadata and lens eras are stored as small integers
+    disciplines = list(lenses.LENSES_HIERARCHY)
+    functions = list(lenses.LENSES_FUNCTIONAL)
+    era_table = list(lenses.ERA_ORDER)
+    for data in lenses.LENS_DEFINITIONS.values():
+        era_table.extend(era for era in data.get("eras", []) if era not in era_table)
+
+    def to_positions(values, table):
+        return sorted(table.index(value) for value in values if value in table)
+
+    body = bytearray()
+    blobs = []
+    records = []
+    for name in lens_names:
+        data = lenses.LENS_DEFINITIONS[name]
+        description = json.dumps(data.get("description")).encode("utf-8")
+        heavy = json.dumps({
+            "conceptual_primer": data.get("conceptual_primer"),
+            "sub_primers": data.get("sub_primers"),
+        }).encode("utf-8")
+        blobs.append([len(body), len(description), len(body) + len(description), len(heavy)])
+        body += description + heavy
+        records.append([data.get("prompt_name"), data.get("requires_nuance", False), [era_table.index(era) for era in data.get("eras", [])]])
+
+    persona_metadata = {
+        name: [to_positions(meta["disciplines"], disciplines), to_positions(meta["functions"], functions),
+               to_positions(meta["eras"], era_table), to_ids(meta["lenses"])]
+        for name, meta in lenses.PERSONA_METADATA.items()
+    }
+
+    index = {
+        "lenses": lens_names,
+        "records": records,
+        "blobs": blobs,
+        "eras": list(lenses.ERA_ORDER),
+        "era_table": era_table,
+        "hierarchy": {k: to_ids(v) for k, v in lenses.LENSES_HIERARCHY.items()},
+        "functional": {k: to_ids(v) for k, v in lenses.LENSES_FUNCTIONAL.items()},
+        "by_era": {k: to_ids(v) for k, v in lenses.LENSES_BY_ERA.items()},
+        "geographic": {k: to_ids(v) for k, v in lenses.LENSES_GEOGRAPHIC.items()},
+        "persona_pool": {k: [persona_ids[p] for p in v if p in persona_ids] for k, v in lenses.PERSONA_POOL.items()},
+        "personas": persona_names,
+        "persona_metadata": [persona_metadata[name] for name in persona_names],
+        # PERSONA_METADATA's own order (by persona ID), which the Library lists personas in
+        "persona_metadata_order": [persona_ids[name] for name in lenses.PERSONA_METADATA],
+        "relations": compute_lens_relations(lens_names, lenses.LENS_DEFINITIONS, lenses.LENSES_HIERARCHY,
+                                            lenses.LENSES_FUNCTIONAL, lenses.ERA_ORDER),
+    }
+
+    payload = json.dumps(index, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n" + bytes(body)
+    header = {
+        "format": CATALOG_FORMAT_VERSION,
+        "source_checksum": get_source_checksum(source_path),
+        "checksum": _sha256(payload),
+    }
+    artifact = json.dumps(header).encode("utf-8") + b"\n" + payload
+
+    if artifact_path:
+        # Write atomically so concurrent readers never see a partial artifact
+        tmp_path = f"{artifact_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(artifact)
+        os.replace(tmp_path, artifact_path)
+    return artifact
+
+
+# -----------------------------------------------------------------------------
+# 2. LENS INDEX (Bitset-based Cascading Filters)
+# Assigns integer IDs to every lens and persona and stores each category as a bitset
+# (a Python int) of member IDs, so cascading filters reduce to bitwise ANDs.
+# -----------------------------------------------------------------------------
+
+# Sentinel values used by the filter dropdowns to mean "no restriction"
+NO_FILTER_VALUES = {"All Disciplines", "All Functions", "All Eras", "All Regions", "(AI Decides)", "(No Persona)", "(No Lens Selected)", None}
+
+class LensIndex:
+    """
+    Precomputed index over the lens catalog.
+
+    Lens IDs follow the sorted lens names and persona IDs follow the sorted persona names,
+    so decoding a bitset in ascending bit order yields an alphabetized list.
+    """
+
+    def __init__(self, lens_names, persona_names, hierarchy, functional, by_era, geographic, persona_metadata, era_order):
+        self.era_order = list(era_order)
+
+        self.lens_names = list(lens_names)
+        self.lens_ids = {name: i for i, name in enumerate(self.lens_names)}
+        self.all_lenses = (1 << len(self.lens_names)) - 1
+
+        self.persona_names = list(persona_names)
+        self.persona_ids = {name: i for i, name in enumerate(self.persona_names)}
+        self.all_personas = (1 << len(self.persona_names)) - 1
+
+        # Category -> lens bitset (dict order matches the source structures)
+        self.discipline_bits = self._lens_bits(hierarchy)
+        self.function_bits = self._lens_bits(functional)
+        self.era_bits = self._lens_bits(by_era)
+        self.region_bits = self._lens_bits(geographic)
+        self.persona_lens_bits = self._lens_bits({name: meta['lenses'] for name, meta in persona_metadata.items()})
+
+        # Category -> persona bitset (mirrors the per-persona attribute sets in the persona metadata)
+        self.persona_discipline_bits = self._persona_bits(persona_metadata, 'disciplines')
+        self.persona_function_bits = self._persona_bits(persona_metadata, 'functions')
+        self.persona_era_bits = self._persona_bits(persona_metadata, 'eras')
+        self.lens_persona_bits = self._persona_bits(persona_metadata, 'lenses')
+
+        # Lens -> categories (reverse lookups, in source order)
+        self.lens_disciplines = self._reverse(self.discipline_bits)
+        self.lens_functions = self._reverse(self.function_bits)
+        self.lens_eras = self._reverse(self.era_bits)
+        self.lens_regions = self._reverse(self.region_bits)
+
+    def _lens_bits(self, structure):
+        bits = {}
+        for category, lenses in structure.items():
+            mask = 0
+            for lens_name in lenses:
+                lens_id = self.lens_ids.get(lens_name)
+                if lens_id is not None:
+                    mask |= 1 << lens_id
+            bits[category] = mask
+        return bits
+
+    def _persona_bits(self, persona_metadata, attribute):
+        bits = {}
+        for persona_name, meta in persona_metadata.items():
+            persona_bit = 1 << self.persona_ids[persona_name]
+            for value in meta[attribute]:
+                bits[value] = bits.get(value, 0) | persona_bit
+        return bits
+
+    def _reverse(self, category_bits):
+        reverse = {name: [] for name in self.lens_names}
+        for category, mask in category_bits.items():
+            for lens_name in self.decode(mask):
+                reverse[lens_name].append(category)
+        return reverse
+
+    @staticmethod
+    def _decode(mask, names):
+        result = []
+        while mask:
+            low_bit = mask & -mask
+            result.append(names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return result
+
+    def decode(self, mask):
+        """Returns the (alphabetized) lens names contained in a lens bitset."""
+        return self._decode(mask, self.lens_names)
+
+    def decode_personas(self, mask):
+        """Returns the (alphabetized) persona names contained in a persona bitset."""
+        return self._decode(mask, self.persona_names)
+
+    def lens_mask(self, discipline=None, function=None, era=None, region=None, persona=None):
+        """Returns the bitset of lenses matching every given filter ('All ...' values are ignored)."""
+        mask = self.all_lenses
+        for value, bits in ((discipline, self.discipline_bits), (function, self.function_bits),
+                            (era, self.era_bits), (region, self.region_bits), (persona, self.persona_lens_bits)):
+            if value not in NO_FILTER_VALUES:
+                mask &= bits.get(value, 0)
+        return mask
+
+    def persona_mask(self, discipline=None, function=None, era=None, lens=None):
+        """Returns the bitset of personas matching every given filter ('All ...' values are ignored)."""
+        mask = self.all_personas
+        for value, bits in ((discipline, self.persona_discipline_bits), (function, self.persona_function_bits),
+                            (era, self.persona_era_bits), (lens, self.lens_persona_bits)):
+            if value not in NO_FILTER_VALUES:
+                mask &= bits.get(value, 0)
+        return mask
+
+    def filter_lenses(self, discipline=None, function=None, era=None, region=None, persona=None):
+        """Returns the alphabetized lens names matching every given filter."""
+        return self.decode(self.lens_mask(discipline, function, era, region, persona))
+
+    def cascade(self, discipline, function, era, persona=None, lens=None):
+        """
+        Computes the cascading dropdown options: each dropdown is restricted by all OTHER selections.
+
+        Returns: dict with 'disciplines', 'functions', 'eras' (each led by its "All ..." option,
+        eras in chronological order), and the alphabetized 'lenses' and 'personas' lists.
+        """
+        disc_mask = self.lens_mask(discipline=discipline)
+        func_mask = self.lens_mask(function=function)
+        era_mask = self.lens_mask(era=era)
+        persona_mask = self.lens_mask(persona=persona)
+
+        without_discipline = func_mask & era_mask & persona_mask
+        without_function = disc_mask & era_mask & persona_mask
+        without_era = disc_mask & func_mask & persona_mask
+
+        return {
+            'disciplines': ["All Disciplines"] + sorted(name for name, bits in self.discipline_bits.items() if bits & without_discipline),
+            'functions': ["All Functions"] + sorted(name for name, bits in self.function_bits.items() if bits & without_function),
+            'eras': ["All Eras"] + [name for name in self.era_order if self.era_bits.get(name, 0) & without_era],
+            'lenses': self.decode(without_discipline & disc_mask),
+            'personas': self.decode_personas(self.persona_mask(discipline, function, era, lens)),
+        }
+
+
+# -----------------------------------------------------------------------------
+# 3. LENS RELATIONS (Offline Contrast & Complementarity Matrices)
+# Every lens pair is scored once at build time from descriptions, functional tiers,
+# disciplines and eras. Each matrix is the upper triangle of the lens×lens table,
+# quantized to one byte (0-255) per pair.
+# -----------------------------------------------------------------------------
+
+RELATION_KINDS = ("contrast", "complementarity")
+RELATION_PRIMER_CHARS = 1500  # Primer characters (after the description) used for text similarity
+RELATION_SIMILARITY_PERCENTILE = 0.95  # Pairs at or above this text similarity count as fully related
+
+_RELATION_STOPWORDS = frozenset({
+    "that", "this", "with", "from", "into", "their", "they", "them", "these", "those", "which", "what",
+    "when", "where", "while", "have", "been", "were", "will", "would", "could", "should", "does",
+    "than", "then", "also", "such", "both", "each", "other", "more", "most", "only", "over", "upon",
+    "about", "through", "between", "within", "work", "works", "lens", "analysis", "analyze",
+})
+
+def _relation_terms(text):
+    return [word for word in re.findall(r"[a-z]{4,}", text.lower()) if word not in _RELATION_STOPWORDS]
+
+def _jaccard(a, b):
+    union = a | b
+    return len(a & b) / len(union) if union else 0.0
+
+def compute_lens_relations(lens_names, definitions, hierarchy, functional, era_order):
+    """
+    Scores every lens pair and returns {kind: base64 upper-triangle matrix}.
+
+    contrast:        shared ground (same discipline or related vocabulary) times a divergent
+                     approach (distant eras, different tier, different vocabulary). High scores
+                     make good thesis/antithesis pairs.
+    complementarity: low redundancy (different tier, discipline and vocabulary, spread in time).
+                     High scores make balanced Symposium sets.
+    """
+    n = len(lens_names)
+    lens_ids = {name: i for i, name in enumerate(lens_names)}
+
+    # Unit-length TF-IDF vectors over each description and the opening of its primer
+    term_counts = []
+    for name in lens_names:
+        data = definitions[name]
+        text = f"{data.get('description') or ''} {(data.get('conceptual_primer') or '')[:RELATION_PRIMER_CHARS]}"
+        term_counts.append(Counter(_relation_terms(text)))
+    document_frequency = Counter(term for counts in term_counts for term in counts)
+    vectors = []
+    for counts in term_counts:
+        weights = {term: (1 + math.log(tf)) * math.log((1 + n) / (1 + document_frequency[term])) for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vectors.append({term: w / norm for term, w in weights.items()})
+
+    def memberships(structure):
+        sets = [set() for _ in lens_names]
+        for category, names in structure.items():
+            for name in names:
+                if name in lens_ids:
+                    sets[lens_ids[name]].add(category)
+        return sets
+
+    disciplines = memberships(hierarchy)
+    tiers = memberships(functional)
+    era_positions = {era: i for i, era in enumerate(era_order)}
+    era_span = max(len(era_order) - 1, 1)
+    era_centres = []
+    for name in lens_names:
+        positions = [era_positions[era] for era in definitions[name].get("eras", []) if era in era_positions]
+        era_centres.append(sum(positions) / len(positions) if positions else None)
+
+    similarities = []
+    for i in range(n):
+        for j in range(i + 1, n):
+            a, b = vectors[i], vectors[j]
+            if len(a) > len(b):
+                a, b = b, a
+            similarities.append(sum(w * b.get(term, 0.0) for term, w in a.items()))
+    # Raw cosines are small and uneven across the library; rescale against a high percentile
+    ceiling = (sorted(similarities)[int(RELATION_SIMILARITY_PERCENTILE * (len(similarities) - 1))] if similarities else 0.0) or 1.0
+
+    contrast = bytearray()
+    complementarity = bytearray()
+    pair = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            related = min(similarities[pair] / ceiling, 1.0)
+            pair += 1
+            shared_discipline = _jaccard(disciplines[i], disciplines[j])
+            same_tier = 1.0 if tiers[i] & tiers[j] else 0.0
+            if era_centres[i] is None or era_centres[j] is None:
+                era_gap = 0.5
+            else:
+                era_gap = abs(era_centres[i] - era_centres[j]) / era_span
+
+            ground = 0.35 + 0.65 * max(shared_discipline, related)
+            divergence = 0.35 * era_gap + 0.35 * (1 - related) + 0.30 * (1 - same_tier)
+            contrast.append(round(255 * ground * divergence))
+            complementarity.append(round(255 * (0.35 * (1 - same_tier) + 0.30 * (1 - shared_discipline)
+                                                + 0.20 * (1 - related) + 0.15 * era_gap)))
+
+    return {
+        "contrast": base64.b64encode(bytes(contrast)).decode("ascii"),
+        "complementarity": base64.b64encode(bytes(complementarity)).decode("ascii"),
+    }
+
+
+class LensRelations:
+    """
+    Pair lookups and suggestions over the quantized relation matrices. Scores are returned
+    in [0, 1]. `candidates` restricts suggestions to a subset (e.g., lenses pre-ranked for a work).
+    """
+
+    def __init__(self, lens_names, matrices):
+        self.lens_names = lens_names
+        self._ids = {name: i for i, name in enumerate(lens_names)}
+        self._n = len(lens_names)
+        self._matrices = {kind: base64.b64decode(matrices[kind]) for kind in RELATION_KINDS}
+        for kind, matrix in self._matrices.items():
+            if len(matrix) != self._n * (self._n - 1) // 2:
+                raise CatalogError(f"Relation matrix '{kind}' does not match the lens count.")
+        self._top_pairs = {}
+
+    def _cell(self, matrix, i, j):
+        if i > j:
+            i, j = j, i
+        return matrix[i * (2 * self._n - i - 1) // 2 + (j - i - 1)]
+
+    def _candidate_ids(self, candidates):
+        if candidates is None:
+            return list(range(self._n))
+        return [self._ids[name] for name in dict.fromkeys(candidates) if name in self._ids]
+
+    def score(self, kind, lens_a, lens_b):
+        """Returns the pair score in [0, 1] (0.0 for unknown lenses or a lens paired with itself)."""
+        i, j = self._ids.get(lens_a), self._ids.get(lens_b)
+        if i is None or j is None or i == j:
+            return 0.0
+        return self._cell(self._matrices[kind], i, j) / 255
+
+    def suggest_pairs(self, kind="contrast", limit=5, candidates=None, anchor=None):
+        """
+        Returns the top `limit` pairs as (lens_a, lens_b, score). With `anchor`, lens A is fixed
+        and the best partners for it are returned; otherwise each lens appears in at most one
+        pair, so the suggestions are not all variations on one strong lens.
+        """
+        cache_key = (kind, limit)
+        if candidates is None and anchor is None and cache_key in self._top_pairs:
+            return self._top_pairs[cache_key]
+
+        matrix = self._matrices[kind]
+        ids = self._candidate_ids(candidates)
+        if anchor is not None:
+            a = self._ids.get(anchor)
+            if a is None:
+                return []
+            best = heapq.nlargest(limit, ((self._cell(matrix, a, b), -a, -b) for b in ids if b != a))
+        else:
+            best, used = [], set()
+            for value, a, b in sorted(((self._cell(matrix, a, b), -a, -b) for x, a in enumerate(ids) for b in ids[x + 1:]), reverse=True):
+                if len(best) >= limit:
+                    break
+                if a not in used and b not in used:
+                    best.append((value, a, b))
+                    used.update((a, b))
+        pairs = [(self.lens_names[-a], self.lens_names[-b], value / 255) for value, a, b in best]
+
+        if candidates is None and anchor is None:
+            self._top_pairs[cache_key] = pairs
+        return pairs
+
+    def suggest_set(self, size, kind="complementarity", candidates=None, seed=()):
+        """
+        Greedily builds a set of `size` lenses with strong pairwise scores: starts from `seed`
+        (or the best pair) and repeatedly adds the lens whose weakest link to the set is
+        strongest, breaking ties by its total score and then by candidate order.
+        """
+        matrix = self._matrices[kind]
+        ids = self._candidate_ids(candidates)
+        chosen = [self._ids[name] for name in dict.fromkeys(seed) if name in self._ids][:size]
+        if not chosen and size >= 2:
+            best = self.suggest_pairs(kind, limit=1, candidates=candidates)
+            if best:
+                chosen = [self._ids[best[0][0]], self._ids[best[0][1]]]
+
+        while len(chosen) < size:
+            best_key, best_id = None, None
+            for position, candidate in enumerate(ids):
+                if candidate in chosen:
+                    continue
+                links = [self._cell(matrix, candidate, member) for member in chosen] or [0]
+                key = (min(links), sum(links), -position)
+                if best_key is None or key > best_key:
+                    best_key, best_id = key, candidate
+            if best_id is None:
+                break
+            chosen.append(best_id)
+        return [self.lens_names[i] for i in chosen]
+
+
+# -----------------------------------------------------------------------------
+# 4. RUNTIME CATALOG (Lazy Loading)
+# -----------------------------------------------------------------------------
+
+class CatalogError(Exception):
+    """Raised when a catalog artifact is missing, stale or corrupt."""
+
+
+class LensCatalog:
+    """
+    An immutable snapshot of one catalog artifact. The header and index are decoded eagerly;
+    the blob section is memory-mapped, so descriptions and primers are only paged in from the
+    file when requested. The mapping keeps the snapshot's own file alive, so a snapshot stays
+    valid after the artifact on disk has been replaced.
+    """
+
+    def __init__(self, artifact_path=CATALOG_ARTIFACT_PATH, source_checksum=None, artifact_bytes=None):
+        self.artifact_path = artifact_path
+        self._lock = threading.Lock()
+        self._descriptions = {}
+        self._records = OrderedDict()
+
+        if artifact_bytes is not None:
+            # Compiled in memory (the artifact could not be written), so there is no file to map
+            raw = artifact_bytes
+        else:
+            with open(artifact_path, "rb") as f:
+                raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_end = raw.find(b"\n")
+        index_end = raw.find(b"\n", header_end + 1)
+        if header_end < 0 or index_end < 0:
+            raise CatalogError("Catalog artifact is truncated.")
+        header = json.loads(raw[:header_end])
+        if header.get("format") != CATALOG_FORMAT_VERSION:
+            raise CatalogError(f"Unsupported catalog format: {header.get('format')}")
+        with memoryview(raw)[header_end + 1:] as payload:  # Hash the mapping in place, without copying it
+            payload_checksum = _sha256(payload)
+        if header.get("checksum") != payload_checksum:
+            raise CatalogError("Catalog checksum mismatch (artifact is corrupt).")
+        if source_checksum and header.get("source_checksum") != source_checksum:
+            raise CatalogError("Catalog artifact is stale (lenses.py has changed).")
+
+        self._blob_data = raw  # The mapped artifact; only blob ranges are read from it after this point
+        self.checksum = header["checksum"]
+        self.version = self.checksum[:12]
+        self.source_checksum = header["source_checksum"]
+        self._body_offset = index_end + 1
+        index = json.loads(raw[header_end + 1:index_end])
+
+        self.lens_names = index["lenses"]
+        self.era_order = index["eras"]
+        self._blobs = dict(zip(self.lens_names, index["blobs"]))
+        era_table = index["era_table"]
+        self._light = {
+            name: {"prompt_name": prompt_name, "requires_nuance": requires_nuance, "eras": [era_table[i] for i in eras]}
+            for name, (prompt_name, requires_nuance, eras) in zip(self.lens_names, index["records"])
+        }
+
+        def to_names(ids):
+            return [self.lens_names[i] for i in ids]
+
+        self.hierarchy = {k: to_names(v) for k, v in index["hierarchy"].items()}
+        self.functional = {k: to_names(v) for k, v in index["functional"].items()}
+        self.by_era = {k: to_names(v) for k, v in index["by_era"].items()}
+        self.geographic = {k: to_names(v) for k, v in index["geographic"].items()}
+
+        self.persona_names = index["personas"]
+        self.persona_pool = {k: [self.persona_names[i] for i in v] for k, v in index["persona_pool"].items()}
+        discipline_table = list(self.hierarchy)
+        function_table = list(self.functional)
+        persona_records = index["persona_metadata"]
+        self.persona_metadata = {
+            self.persona_names[i]: {
+                "disciplines": {discipline_table[d] for d in persona_records[i][0]},
+                "functions": {function_table[f] for f in persona_records[i][1]},
+                "eras": {era_table[e] for e in persona_records[i][2]},
+                "lenses": to_names(persona_records[i][3]),
+            }
+            for i in index["persona_metadata_order"]
+        }
+
+        self.index = LensIndex(self.lens_names, self.persona_names, self.hierarchy, self.functional,
+                               self.by_era, self.geographic, self.persona_metadata, self.era_order)
+        self.relations = LensRelations(self.lens_names, index["relations"])
+
+    def _read_blob(self, offset, length):
+        start = self._body_offset + offset
+        return json.loads(self._blob_data[start:start + length])
+
+    def get_description(self, lens_name):
+        """Returns a lens description (descriptions are small and stay cached once read)."""
+        if lens_name not in self._blobs:
+            return None
+        if lens_name not in self._descriptions:
+            offset, length, _, _ = self._blobs[lens_name]
+            self._descriptions[lens_name] = self._read_blob(offset, length)
+        return self._descriptions[lens_name]
+
+    def get_lens_data(self, lens_name):
+        """Retrieves the full data object for a lens, materializing primers on demand."""
+        if lens_name not in self._blobs:
+            return None
+        with self._lock:
+            record = self._records.get(lens_name)
+            if record is not None:
+                self._records.move_to_end(lens_name)
+                return record
+
+        _, _, heavy_offset, heavy_length = self._blobs[lens_name]
+        record = {"description": self.get_description(lens_name), **self._read_blob(heavy_offset, heavy_length), **self._light[lens_name]}
+        with self._lock:
+            self._records[lens_name] = record
+            while len(self._records) > LAZY_RECORD_CACHE_SIZE:
+                self._records.popitem(last=False)
+        return record
+
+
+class LazyLensDefinitions(Mapping):
+    """Read-only LENS_DEFINITIONS view over a catalog; records load on first access."""
+
+    def __init__(self, catalog):
+        self._catalog = catalog
+
+    def __getitem__(self, lens_name):
+        record = self._catalog.get_lens_data(lens_name)
+        if record is None:
+            raise KeyError(lens_name)
+        return record
+
+    def __iter__(self):
+        return iter(self._catalog.lens_names)
+
+    def __len__(self):
+        return len(self._catalog.lens_names)
+
+    def __contains__(self, lens_name):
+        return lens_name in self._catalog._blobs
+
+
+def load_catalog(artifact_path=CATALOG_ARTIFACT_PATH, source_path=CATALOG_SOURCE_PATH):
+    """
+    Loads the prebuilt catalog artifact. The runtime never compiles (importing lenses.py and scoring
+    every lens pair is the offline build step's job): a missing or corrupt artifact raises CatalogError,
+    and an artifact older than lenses.py is still served, with a warning to rebuild it.
+    """
+    try:
+        catalog = LensCatalog(artifact_path)
+    except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+        raise CatalogError(f"Lens catalog artifact unavailable ({e}). Build it with `python lens_catalog.py`.") from e
+    if os.path.exists(source_path) and catalog.source_checksum != get_source_checksum(source_path):
+        logging.warning(f"Lens catalog {catalog.version} is older than lenses.py. Rebuild it with `python lens_catalog.py`.")
+    return catalog
+
+
+# -----------------------------------------------------------------------------
+# 5. HOT RELOAD
+# -----------------------------------------------------------------------------
+
+_CATALOG = None
+_reload_lock = threading.Lock()
+_watcher_started = False
+_watched_signature = None
+
+def _file_signature(artifact_path=CATALOG_ARTIFACT_PATH):
+    """(mtime, size) of the artifact; None if it does not exist."""
+    try:
+        stat = os.stat(artifact_path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+def reload_catalog():
+    """
+    Loads the artifact again if it changed (the offline build step replaced it), then atomically
+    swaps it in. Returns the current catalog (the new one if it changed).
+    """
+    global _CATALOG, _watched_signature
+    with _reload_lock:
+        signature = _file_signature()
+        if signature == _watched_signature:
+            return _CATALOG
+
+        # Don't retry a broken artifact until it changes again
+        _watched_signature = signature
+        new_catalog = load_catalog()
+        if new_catalog.checksum != _CATALOG.checksum:
+            previous_version = _CATALOG.version
+            _CATALOG = new_catalog
+            logging.info(f"Lens catalog reloaded (version {previous_version} -> {new_catalog.version}, {len(new_catalog.lens_names)} lenses).")
+        return _CATALOG
+
+def _watch_catalog():
+    while True:
+        time.sleep(CATALOG_WATCH_INTERVAL)
+        try:
+            if _file_signature() != _watched_signature:
+                reload_catalog()
+        except Exception as e:
+            # A missing or corrupt artifact must never take down the watcher; the current snapshot stays live
+            logging.warning(f"Lens catalog reload failed ({e}). Keeping version {_CATALOG.version}.")
+
+def _start_watcher():
+    global _CATALOG, _watcher_started, _watched_signature
+    with _reload_lock:
+        if _watcher_started:
+            return
+        # Loaded on first use rather than at import, so the build step runs without an existing artifact
+        _watched_signature = _file_signature()
+        _CATALOG = load_catalog()
+        _watcher_started = True
+    threading.Thread(target=_watch_catalog, name="lens-catalog-watcher", daemon=True).start()
+
+def get_catalog():
+    """
+    Returns the current catalog snapshot. Code that combines several structures should
+    call this once and read everything from the returned snapshot.
+    """
+    if not _watcher_started:
+        _start_watcher()
+    return _CATALOG
+
+
+# -----------------------------------------------------------------------------
+# 6. PUBLIC API (mirrors the names exported by lenses.py)
+# Names resolve against the current snapshot on every import (PEP 562), so
+# `from lens_catalog import SORTED_LENS_NAMES` inside a page or function picks up reloads.
+# -----------------------------------------------------------------------------
+
+_SNAPSHOT_ATTRIBUTES = {
+    "SORTED_LENS_NAMES": "lens_names",
+    "ERA_ORDER": "era_order",
+    "LENSES_HIERARCHY": "hierarchy",
+    "LENSES_FUNCTIONAL": "functional",
+    "LENSES_BY_ERA": "by_era",
+    "LENSES_GEOGRAPHIC": "geographic",
+    "PERSONA_POOL": "persona_pool",
+    "PERSONA_METADATA": "persona_metadata",
+    "SORTED_PERSONA_NAMES": "persona_names",
+    "LENS_INDEX": "index",
+    "LENS_RELATIONS": "relations",
+}
+
+def __getattr__(name):
+    catalog = get_catalog()
+    if name in _SNAPSHOT_ATTRIBUTES:
+        return getattr(catalog, _SNAPSHOT_ATTRIBUTES[name])
+    if name == "LENS_DEFINITIONS":
+        return LazyLensDefinitions(catalog)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_lens_data(lens_keyword):
+    """Retrieves the data object for a given lens keyword."""
+    return get_catalog().get_lens_data(lens_keyword)
+
+def get_lens_description(lens_keyword):
+    """Retrieves only the description of a lens (without loading its primers)."""
+    return get_catalog().get_description(lens_keyword)
+
+
+if __name__ == "__main__":
+    compile_catalog()
+    catalog = LensCatalog(CATALOG_ARTIFACT_PATH, source_checksum=get_source_checksum())
+    print(f"Compiled {len(catalog.lens_names)} lenses and {len(catalog.persona_names)} personas "
+          f"into {CATALOG_ARTIFACT_PATH} ({os.path.getsize(CATALOG_ARTIFACT_PATH):,} bytes, checksum {catalog.checksum[:12]}).")
@@ -1734,4 +1734,5 @@ for structure in _structures_to_check:
         for lens_name in lenses:
             if lens_name not in _all_defined_lenses:
                 # This is a development-time check to catch migration errors.
-                print(f"LENS LIBRARY ERROR: Lens '{lens_name}' found in category '{category}' but is not present in LENS_DEFINITIONS.")
\ No newline at end of file
+                print(f"LENS LIBRARY ERROR: Lens '{lens_name}' found in category '{category}' but is not present in LENS_DEFINITIONS.")
+
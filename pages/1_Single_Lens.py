@@ -6,6 +6,8 @@ from utils import WorkInput
 # v10.0.15: Centralize reset logic
 def reset_analysis_state():
     utils.reset_page_state('single_lens')
+    st.session_state.single_sweep_result = None
+    st.session_state.single_zeitgeist_batch_result = None
 
 # v9.4b: Callback specifically for Zeitgeist toggle activation
 # v10.1: Updated to clear new filter widgets
@@ -26,6 +28,136 @@ def handle_zeitgeist_toggle():
         if 'single_geographic_filter' in st.session_state:
             st.session_state.single_geographic_filter = "All Regions"
 
+# v10.6: Lens Sweep mode (one work through the whole catalog or a filtered subset)
+def render_lens_sweep(work_input):
+    """Sweep configuration, execution and ranked results."""
+    from lens_catalog import LENSES_HIERARCHY, LENSES_FUNCTIONAL, ERA_ORDER, LENSES_GEOGRAPHIC
+
+    st.caption("Filter the catalog (or leave every filter on 'All' to sweep all lenses).")
+    sweep_col1, sweep_col2 = st.columns(2)
+    with sweep_col1:
+        discipline = st.selectbox("**Discipline:**", ["All Disciplines"] + sorted(LENSES_HIERARCHY), key="single_sweep_discipline")
+        era = st.selectbox("**Historical Era:**", ["All Eras"] + list(ERA_ORDER), key="single_sweep_era")
+    with sweep_col2:
+        function = st.selectbox("**Function Tier:**", ["All Functions"] + sorted(LENSES_FUNCTIONAL), key="single_sweep_function")
+        region = st.selectbox("**Geographic Region:**", ["All Regions"] + sorted(LENSES_GEOGRAPHIC), key="single_sweep_region")
+
+    sweep_lenses = utils.get_sweep_lenses(discipline, function, era, region)
+    if not sweep_lenses:
+        st.info("No lenses match these filters.")
+        return
+
+    st.markdown("---")
+    st.header(f"Analysis | Lens Sweep ({len(sweep_lenses)} lenses)")
+
+    # v10.6: Every lens is a full paid pipeline, so show the estimated cost and confirm large sweeps
+    estimate = utils.estimate_sweep_calls(len(sweep_lenses), st.session_state.get("analysis_mode", utils.MODE_ADAPTIVE))
+    st.caption(
+        f"Estimated cost: up to {estimate['total']:,} API calls ({estimate['pro']:,} Gemini Pro, "
+        f"{estimate['flash']:,} Flash-Lite, including up to {estimate['hedges']:,} hedged specialist calls).",
+        help=utils.get_tooltip("sweep_cost")
+    )
+    sweep_confirmed = True
+    if len(sweep_lenses) > utils.SWEEP_CONFIRM_THRESHOLD:
+        # Keyed by the sweep size, so changing the filters asks for confirmation again
+        sweep_confirmed = st.checkbox(
+            f"I understand this sweep makes up to {estimate['total']:,} paid API calls.",
+            key=f"single_sweep_confirm_{len(sweep_lenses)}"
+        )
+    if st.button(f"Run Lens Sweep ({len(sweep_lenses)} lenses)", type="primary", width="stretch", disabled=not sweep_confirmed):
+        reset_analysis_state()
+        st.subheader("📄 Results (as they complete)")
+        results_display = st.container()
+        try:
+            sweep_result = utils.run_lens_sweep_pipeline(work_input, sweep_lenses, results_display)
+        finally:
+            if not st.session_state.single_sweep_result:
+                work_input.cleanup_gemini_file()
+        if sweep_result:
+            st.session_state.single_sweep_result = sweep_result
+            st.rerun()  # Re-render the results in ranking order
+
+    sweep_result = st.session_state.single_sweep_result
+    if not sweep_result:
+        return
+
+    st.markdown("---")
+    st.subheader(f"🏆 Most Productive Lenses ({len(sweep_result['analyses'])} analyzed)")
+    st.caption(utils.get_tooltip("lens_sweep"))
+    for position, (lens_name, score) in enumerate(sweep_result["ranking"][:utils.SWEEP_TOP_LENSES], 1):
+        st.markdown(f"{position}. **{lens_name}** ({score:.2f})")
+    if sweep_result["failed"]:
+        st.warning("No result for: " + ", ".join(sweep_result["failed"]))
+
+    st.subheader("📄 All Sweep Results")
+    for lens_name, score in sweep_result["ranking"]:
+        with st.expander(f"{lens_name} ({score:.2f})"):
+            st.markdown(sweep_result["analyses"][lens_name])
+
+    import datetime
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    st.download_button(
+        label="📥 Download Sweep as Markdown",
+        data=utils.format_sweep_report(sweep_result, work_input),
+        file_name=f"janus_lens_sweep_{timestamp}.md",
+        mime="text/markdown",
+        use_container_width=True,
+        key="download_sweep_md"
+    )
+    st.markdown("---")
+    utils.display_metadata(work_input, label=work_input.get_display_title())
+
+# v10.6: Zeitgeist Batch mode (one witness per historical moment, sharing one preparation)
+def render_zeitgeist_batch(work_input, witnesses):
+    """Zeitgeist batch execution and era-ordered results."""
+    st.markdown("---")
+    st.header(f"Analysis | Zeitgeist Across Eras ({len(witnesses)} moments)")
+    if st.button(f"Simulate {len(witnesses)} Historical Moments", type="primary", width="stretch"):
+        reset_analysis_state()
+        st.subheader("📄 Witnesses (as they complete)")
+        results_display = st.container()
+        st.subheader("🕰️ Reception Across Eras")
+        comparison_display = st.container()
+        try:
+            batch_result = utils.run_zeitgeist_batch_pipeline(work_input, witnesses, results_display, stream_container=comparison_display)
+        finally:
+            if not st.session_state.single_zeitgeist_batch_result:
+                work_input.cleanup_gemini_file()
+        if batch_result:
+            st.session_state.single_zeitgeist_batch_result = batch_result
+            st.rerun()  # Re-render the witnesses in chronological order
+
+    batch_result = st.session_state.single_zeitgeist_batch_result
+    if not batch_result:
+        return
+
+    st.markdown("---")
+    if batch_result["comparison"]:
+        st.subheader("🕰️ Reception Across Eras")
+        st.markdown(batch_result["comparison"])
+    if batch_result["failed"]:
+        st.warning("No simulation for: " + ", ".join(batch_result["failed"]))
+
+    st.subheader(f"📄 Witnesses ({len(batch_result['analyses'])} simulated, chronological)")
+    for witness in batch_result["witnesses"]:
+        if witness["moment"] in batch_result["analyses"]:
+            with st.expander(witness["moment"]):
+                st.caption(f"Witness: {witness['zeitgeist_persona']}")
+                st.markdown(batch_result["analyses"][witness["moment"]])
+
+    import datetime
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    st.download_button(
+        label="📥 Download Zeitgeist Batch as Markdown",
+        data=utils.format_zeitgeist_batch_report(batch_result, work_input),
+        file_name=f"janus_zeitgeist_eras_{timestamp}.md",
+        mime="text/markdown",
+        use_container_width=True,
+        key="download_zeitgeist_batch_md"
+    )
+    st.markdown("---")
+    utils.display_metadata(work_input, label=work_input.get_display_title())
+
 # --- PAGE SETUP ---
 # v10.2: Update page title
 PAGE_TITLE = "Janus | Single Lens"
@@ -66,6 +198,10 @@ if 'single_lens_strategy' not in st.session_state:
     st.session_state.single_lens_strategy = None
 if 'single_lens_selection_method' not in st.session_state:
     st.session_state.single_lens_selection_method = utils.SELECT_MANUAL
+if 'single_sweep_result' not in st.session_state:
+    st.session_state.single_sweep_result = None
+if 'single_zeitgeist_batch_result' not in st.session_state:
+    st.session_state.single_zeitgeist_batch_result = None
 
 # v10.1: Handle Library Pre-selection (MUST happen before any widgets are created)
 if 'library_selected_lens' in st.session_state:
@@ -75,6 +211,8 @@ if 'library_selected_lens' in st.session_state:
         st.session_state.single_zeitgeist_active = False
     else:
         st.session_state.single_zeitgeist_active = False
+    # v10.6: Leave Lens Sweep mode so the pre-selected lens is shown
+    st.session_state.single_sweep_active = False
     # Reset filters to ensure pre-selected lens is visible
     st.session_state.single_discipline_filter = "All Disciplines"
     st.session_state.single_function_filter = "All Functions"
@@ -97,7 +235,8 @@ if st.session_state.get("run_refinement_on_next_load"):
             refined_result = utils.generate_refined_analysis(
                 st.session_state.work_input_single,
                 st.session_state.single_lens_result,
-                instruction
+                instruction,
+                stream_container=refinement_area
             )
 
             if refined_result:
@@ -133,6 +272,12 @@ if not work_is_ready:
     st.info("👆 Please upload a file or enter text above to proceed with configuration.")
     st.stop()  # Stop rendering here until work is provided
 
+# v10.6: Lens Sweep replaces the single-lens configuration while active
+st.markdown("---")
+if st.toggle("🧭 Lens Sweep (Whole Catalog)", key="single_sweep_active", help=utils.get_tooltip("lens_sweep")):
+    render_lens_sweep(work_a)
+    st.stop()
+
 # --- STEP 2: CONFIGURATION & LENS SELECTION (Only appears after work is ready) ---
 st.markdown("---")
 with st.expander("🔬 Configuration & Lens Selection", expanded=True):
@@ -171,20 +316,47 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
         selection['persona'] = None
 
         st.subheader("🕰️ Define the Zeitgeist")
-        z_col1, z_col2 = st.columns(2)
-        with z_col1:
-            # We update the selection dictionary by reading the widget state after interaction
-            st.text_area(
-                "Historical Context:", height=150, key="single_z_context",
-                placeholder="e.g., 'Vienna, 1905. The height of modernism...'"
-            )
-            selection['zeitgeist_context'] = st.session_state.single_z_context
-        with z_col2:
-            st.text_area(
-                "Witness Persona:", height=150, key="single_z_persona",
-                placeholder="e.g., 'A middle-aged, conservative art critic...'"
+        # v10.6: Batch mode simulates several historical moments over one shared preparation
+        zeitgeist_batch = st.toggle("🗓️ Batch Across Eras", key="single_zeitgeist_batch", help=utils.get_tooltip("zeitgeist_batch"))
+        if zeitgeist_batch:
+            import pandas as pd
+            st.caption("One witness per row (prefilled with one per era). Edit the contexts and personas, untick rows to skip them, or add your own moments.")
+            witness_table = st.data_editor(
+                pd.DataFrame([
+                    {"Include": True, "Moment": witness["moment"], "Historical Context": witness["zeitgeist_context"], "Witness Persona": witness["zeitgeist_persona"]}
+                    for witness in utils.default_zeitgeist_witnesses()
+                ]),
+                num_rows="dynamic",
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Include": st.column_config.CheckboxColumn(width="small", default=True),
+                    "Moment": st.column_config.TextColumn(help="Unique label; era names are ordered chronologically"),
+                    "Historical Context": st.column_config.TextColumn(width="large"),
+                    "Witness Persona": st.column_config.TextColumn(width="large"),
+                },
+                key="single_zeitgeist_batch_table"
             )
-            selection['zeitgeist_persona'] = st.session_state.single_z_persona
+            zeitgeist_witnesses = [
+                {"moment": str(row["Moment"]).strip(), "zeitgeist_context": str(row["Historical Context"]).strip(), "zeitgeist_persona": str(row["Witness Persona"]).strip()}
+                for row in witness_table.to_dict("records")
+                if row["Include"] and all(isinstance(row[column], str) and row[column].strip() for column in ("Moment", "Historical Context", "Witness Persona"))
+            ]
+        else:
+            z_col1, z_col2 = st.columns(2)
+            with z_col1:
+                # We update the selection dictionary by reading the widget state after interaction
+                st.text_area(
+                    "Historical Context:", height=150, key="single_z_context",
+                    placeholder="e.g., 'Vienna, 1905. The height of modernism...'"
+                )
+                selection['zeitgeist_context'] = st.session_state.single_z_context
+            with z_col2:
+                st.text_area(
+                    "Witness Persona:", height=150, key="single_z_persona",
+                    placeholder="e.g., 'A middle-aged, conservative art critic...'"
+                )
+                selection['zeitgeist_persona'] = st.session_state.single_z_persona
 
     else:
         # STANDARD LENS SELECTION UI
@@ -196,7 +368,7 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
 
         if selection_method == utils.SELECT_MANUAL:
             # v10.2: Cascading Filter System with Persona Integration
-            from lenses import LENSES_HIERARCHY, LENSES_FUNCTIONAL, LENSES_BY_ERA, ERA_ORDER, SORTED_LENS_NAMES, SORTED_PERSONA_NAMES, PERSONA_METADATA, get_lens_data
+            from lens_catalog import SORTED_LENS_NAMES, SORTED_PERSONA_NAMES, LENS_INDEX
 
             # v10.2: Scope toggle
             st.radio(
@@ -246,65 +418,13 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
             # v10.2: Calculate available options for ALL FIVE dropdowns
             # Rule: A dropdown should not restrict itself - each shows options based on OTHER selections
 
-            available_disciplines = set(["All Disciplines"])
-            available_functions = set(["All Functions"])
-            available_eras = set(["All Eras"])
-            available_lenses = []
-            available_personas = []
-
-            # For each lens, check if it matches the OTHER filters (not including current_lens)
-            for lens_name in SORTED_LENS_NAMES:
-                disc_match = (current_discipline == "All Disciplines" or lens_name in LENSES_HIERARCHY.get(current_discipline, []))
-                func_match = (current_function == "All Functions" or lens_name in LENSES_FUNCTIONAL.get(current_function, []))
-                era_match = (current_era == "All Eras" or lens_name in LENSES_BY_ERA.get(current_era, []))
-
-                # Check if lens matches selected persona (if any)
-                persona_match = True
-                if current_persona and current_persona not in ["(AI Decides)", "(No Persona)"]:
-                    persona_match = lens_name in PERSONA_METADATA[current_persona]['lenses']
-
-                # If matches discipline + function + era + persona, add to available lenses
-                if disc_match and func_match and era_match and persona_match:
-                    available_lenses.append(lens_name)
-
-                # For filter dropdowns: if lens matches OTHER TWO filters + persona, add its categories
-                if func_match and era_match and persona_match:
-                    for cat, lenses in LENSES_HIERARCHY.items():
-                        if lens_name in lenses:
-                            available_disciplines.add(cat)
-
-                if disc_match and era_match and persona_match:
-                    for tier, lenses in LENSES_FUNCTIONAL.items():
-                        if lens_name in lenses:
-                            available_functions.add(tier)
-
-                if disc_match and func_match and persona_match:
-                    lens_data = get_lens_data(lens_name)
-                    if lens_data:
-                        for era in lens_data.get('eras', []):
-                            available_eras.add(era)
-
-            # For each persona, check if it matches the OTHER filters (not including current_persona)
-            for persona_name in SORTED_PERSONA_NAMES:
-                persona_meta = PERSONA_METADATA[persona_name]
-
-                disc_match = (current_discipline == "All Disciplines" or current_discipline in persona_meta['disciplines'])
-                func_match = (current_function == "All Functions" or current_function in persona_meta['functions'])
-                era_match = (current_era == "All Eras" or current_era in persona_meta['eras'])
-
-                # Check if persona matches selected lens (if any)
-                lens_match = True
-                if current_lens and current_lens != "(No Lens Selected)":
-                    lens_match = current_lens in persona_meta['lenses']
-
-                # If matches all filters + lens, add to available personas
-                if disc_match and func_match and era_match and lens_match:
-                    available_personas.append(persona_name)
-
-            # Convert to sorted lists
-            available_disciplines = ["All Disciplines"] + sorted([d for d in available_disciplines if d != "All Disciplines"])
-            available_functions = ["All Functions"] + sorted([f for f in available_functions if f != "All Functions"])
-            available_eras_list = ["All Eras"] + [e for e in ERA_ORDER if e in available_eras]
+            # v10.6: Options are computed with bitwise ANDs over the precomputed LensIndex
+            cascade = LENS_INDEX.cascade(current_discipline, current_function, current_era, persona=current_persona, lens=current_lens)
+            available_disciplines = cascade['disciplines']
+            available_functions = cascade['functions']
+            available_eras_list = cascade['eras']
+            available_lenses = cascade['lenses']
+            available_personas = cascade['personas']
 
             # Step 2: Render filter dropdowns with restricted options
             # v10.5: Restructured layout - Row 1: Discipline + Function, Row 2: Era + Geography
@@ -318,7 +438,7 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
                     current_discipline = "All Disciplines"
 
                 # Show count inline with label
-                from lenses import LENSES_HIERARCHY
+                from lens_catalog import LENSES_HIERARCHY
                 total_disciplines = len(LENSES_HIERARCHY)
                 filtered_count = len([d for d in available_disciplines if d != "All Disciplines"])
                 if filtered_count < total_disciplines:
@@ -340,7 +460,7 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
                     current_function = "All Functions"
 
                 # Show count inline with label
-                from lenses import LENSES_FUNCTIONAL
+                from lens_catalog import LENSES_FUNCTIONAL
                 total_functions = len(LENSES_FUNCTIONAL)
                 filtered_count = len([f for f in available_functions if f != "All Functions"])
                 if filtered_count < total_functions:
@@ -365,7 +485,7 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
                     current_era = "All Eras"
 
                 # Show count inline with label
-                from lenses import ERA_ORDER
+                from lens_catalog import ERA_ORDER
                 total_eras = len(ERA_ORDER)
                 filtered_count = len([e for e in available_eras_list if e != "All Eras"])
                 if filtered_count < total_eras:
@@ -383,7 +503,7 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
 
             with filter_row2_col2:
                 # v10.5: Geographic filter
-                from lenses import LENSES_GEOGRAPHIC
+                from lens_catalog import LENSES_GEOGRAPHIC
                 geographic_regions = ["All Regions"] + sorted(list(LENSES_GEOGRAPHIC.keys()))
                 current_geographic = st.session_state.get("single_geographic_filter", "All Regions")
 
@@ -489,7 +609,9 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
     # Determine if configuration is complete (validation inside expander)
     is_configured = False
     if selection['is_zeitgeist']:
-        if selection['zeitgeist_context'] and selection['zeitgeist_persona']:
+        if st.session_state.get("single_zeitgeist_batch", False):
+            is_configured = bool(zeitgeist_witnesses)
+        elif selection['zeitgeist_context'] and selection['zeitgeist_persona']:
             is_configured = True
     elif selection_method == utils.SELECT_SMART:
         is_configured = True
@@ -545,6 +667,11 @@ with st.expander("🔬 Configuration & Lens Selection", expanded=True):
 if not is_configured:
     st.stop()  # Stop rendering if config not complete
 
+# v10.6: Zeitgeist Batch replaces the single simulation while active
+if selection['is_zeitgeist'] and st.session_state.get("single_zeitgeist_batch", False):
+    render_zeitgeist_batch(work_a, zeitgeist_witnesses)
+    st.stop()
+
 # Construct header text
 if selection['is_zeitgeist']:
     header_text = "Analysis | Zeitgeist Simulation Mode"
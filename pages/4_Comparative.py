@@ -32,9 +32,28 @@ def handle_comparative_mode_change():
 def reset_comparative_state():
     """Reset analysis results and cleanup files."""
     utils.reset_page_state('comparative')
+    st.session_state.comparative_corpus_result = None
     st.session_state.work_input_comparative_a.cleanup_gemini_file()
     st.session_state.work_input_comparative_b.cleanup_gemini_file()
 
+# v10.6: Reset results only, keeping uploads (Corpus Mode toggle and size)
+def reset_comparative_results():
+    """Reset analysis results without cleaning up files."""
+    st.session_state.comparative_state = 'config'
+    st.session_state.comparative_result = None
+    st.session_state.comparative_strategies = None
+    st.session_state.comparative_analyses = None
+    st.session_state.comparative_corpus_result = None
+
+# v10.6: Corpus mode works beyond A and B
+def get_corpus_works():
+    """Returns Work A, Work B and the additional corpus works currently in use."""
+    extra_count = max(0, st.session_state.comparative_corpus_size - 2)
+    extra_works = st.session_state.work_input_comparative_extra
+    while len(extra_works) < extra_count:
+        extra_works.append(WorkInput())
+    return [st.session_state.work_input_comparative_a, st.session_state.work_input_comparative_b] + extra_works[:extra_count]
+
 
 # --- PAGE SETUP ---
 # v10.2: Update page title
@@ -82,6 +101,16 @@ if 'comparative_strategies' not in st.session_state:
 if 'comparative_analyses' not in st.session_state:
     st.session_state.comparative_analyses = None
 
+# v10.6: Corpus mode (all pairs of 3+ works under one lens)
+if 'comparative_corpus_mode' not in st.session_state:
+    st.session_state.comparative_corpus_mode = False
+if 'comparative_corpus_size' not in st.session_state:
+    st.session_state.comparative_corpus_size = 3
+if 'work_input_comparative_extra' not in st.session_state:
+    st.session_state.work_input_comparative_extra = []
+if 'comparative_corpus_result' not in st.session_state:
+    st.session_state.comparative_corpus_result = None
+
 # v10.1: Handle Library Pre-selection (MUST happen before any widgets are created)
 if 'library_selected_lens' in st.session_state:
     preselected_lens = st.session_state.library_selected_lens
@@ -109,7 +138,8 @@ if st.session_state.get("run_comparative_refinement"):
                 st.session_state.work_input_comparative_a,
                 st.session_state.work_input_comparative_b,
                 st.session_state.comparative_result,
-                instruction
+                instruction,
+                stream_container=refinement_area
             )
             if refined_result:
                 st.session_state.comparative_result = refined_result
@@ -120,6 +150,7 @@ if st.session_state.get("run_comparative_refinement"):
 selection = st.session_state.comparative_selection
 analysis_mode = st.session_state.comparative_analysis_mode
 selection_method = st.session_state.comparative_selection_method
+corpus_mode = st.session_state.comparative_corpus_mode
 
 work_a = st.session_state.work_input_comparative_a
 work_b = st.session_state.work_input_comparative_b
@@ -134,21 +165,45 @@ if not st.session_state.get("api_key"):
 st.header("📄 Input Works for Comparison")
 st.caption("Upload your creative works or enter text to begin")
 
-col_a, col_b = st.columns(2)
-
-with col_a:
-    st.markdown("### 🏛️ Work A")
-    utils.handle_input_ui(work_a, st.container(border=True), "work_a", on_change_callback=reset_comparative_state)
-
-with col_b:
-    st.markdown("### 🏛️ Work B")
-    utils.handle_input_ui(work_b, st.container(border=True), "work_b", on_change_callback=reset_comparative_state)
+# v10.6: Corpus mode compares every pair of 3+ works
+corpus_col, corpus_size_col = st.columns([3, 1])
+with corpus_col:
+    corpus_mode = st.toggle(
+        "📚 Corpus Mode (All Pairs)",
+        key="comparative_corpus_mode",
+        on_change=reset_comparative_results,
+        help=utils.get_tooltip("corpus_mode")
+    )
+if corpus_mode:
+    with corpus_size_col:
+        st.number_input(
+            "Works:",
+            min_value=3,
+            max_value=utils.CORPUS_MAX_WORKS,
+            key="comparative_corpus_size",
+            on_change=reset_comparative_results
+        )
+    input_works = get_corpus_works()
+else:
+    input_works = [work_a, work_b]
+
+for row_start in range(0, len(input_works), 2):
+    input_columns = st.columns(2)
+    for column, index in zip(input_columns, range(row_start, min(row_start + 2, len(input_works)))):
+        with column:
+            label = utils.corpus_work_label(index)
+            st.markdown(f"### 🏛️ {label}")
+            # Work A and B keep their original widget keys
+            utils.handle_input_ui(input_works[index], st.container(border=True), label.lower().replace(" ", "_"), on_change_callback=reset_comparative_state)
 
 # Check if works are ready
-works_are_ready = work_a.is_ready() and work_b.is_ready()
+works_are_ready = all(work.is_ready() for work in input_works)
 
 if not works_are_ready:
-    st.info("👆 Please upload files or enter text for both works above to proceed with configuration.")
+    if corpus_mode:
+        st.info("👆 Please upload files or enter text for every work above to proceed with configuration.")
+    else:
+        st.info("👆 Please upload files or enter text for both works above to proceed with configuration.")
     st.stop()  # Stop rendering here until both works are provided
 
 # --- STEP 2: CONFIGURATION & FRAMEWORK SELECTION (Only appears after works are ready) ---
@@ -244,7 +299,7 @@ with st.expander("🔬 Configuration & Framework Selection", expanded=True):
                     st.session_state.comparative_persona_select = "(AI Decides)"
 
             # v10.2: Cascading Filter System with Persona Integration
-            from lenses import SORTED_LENS_NAMES, PERSONA_METADATA, SORTED_PERSONA_NAMES
+            from lens_catalog import SORTED_LENS_NAMES, SORTED_PERSONA_NAMES
 
             # Reset button
             col_clear1, col_clear2 = st.columns([4, 1])
@@ -277,68 +332,15 @@ with st.expander("🔬 Configuration & Framework Selection", expanded=True):
 
             # v10.2: Bidirectional cascading logic (matching Single Lens)
             # Rule: Each dropdown filters based on ALL OTHER selections (not including itself)
-            from lenses import LENSES_HIERARCHY, LENSES_FUNCTIONAL, LENSES_BY_ERA, get_lens_data
-
-            available_disciplines = set(["All Disciplines"])
-            available_functions = set(["All Functions"])
-            available_eras = set(["All Eras"])
-            available_lenses = []
-            available_personas = []
-
-            # For each lens, check if it matches the OTHER filters (not including current_lens)
-            for lens_name in SORTED_LENS_NAMES:
-                disc_match = (current_discipline == "All Disciplines" or lens_name in LENSES_HIERARCHY.get(current_discipline, []))
-                func_match = (current_function == "All Functions" or lens_name in LENSES_FUNCTIONAL.get(current_function, []))
-                era_match = (current_era == "All Eras" or lens_name in LENSES_BY_ERA.get(current_era, []))
-
-                # Check if lens matches selected persona (if any)
-                persona_match = True
-                if current_persona and current_persona not in ["(AI Decides)", "(No Persona)"]:
-                    persona_match = lens_name in PERSONA_METADATA[current_persona]['lenses']
-
-                # If matches discipline + function + era + persona, add to available lenses
-                if disc_match and func_match and era_match and persona_match:
-                    available_lenses.append(lens_name)
-
-                # For filter dropdowns: if lens matches OTHER TWO filters + persona, add its categories
-                if func_match and era_match and persona_match:
-                    for cat, lenses in LENSES_HIERARCHY.items():
-                        if lens_name in lenses:
-                            available_disciplines.add(cat)
-
-                if disc_match and era_match and persona_match:
-                    for tier, lenses in LENSES_FUNCTIONAL.items():
-                        if lens_name in lenses:
-                            available_functions.add(tier)
-
-                if disc_match and func_match and persona_match:
-                    lens_data = get_lens_data(lens_name)
-                    if lens_data:
-                        for era in lens_data.get('eras', []):
-                            available_eras.add(era)
-
-            # For each persona, check if it matches the OTHER filters (not including current_persona)
-            for persona_name in SORTED_PERSONA_NAMES:
-                persona_meta = PERSONA_METADATA[persona_name]
-
-                disc_match = (current_discipline == "All Disciplines" or current_discipline in persona_meta['disciplines'])
-                func_match = (current_function == "All Functions" or current_function in persona_meta['functions'])
-                era_match = (current_era == "All Eras" or current_era in persona_meta['eras'])
-
-                # Check if persona matches selected lens (if any)
-                lens_match = True
-                if current_lens and current_lens != "(No Lens Selected)":
-                    lens_match = current_lens in persona_meta['lenses']
-
-                # If matches all filters + lens, add to available personas
-                if disc_match and func_match and era_match and lens_match:
-                    available_personas.append(persona_name)
-
-            # Convert to sorted lists
-            available_disciplines = ["All Disciplines"] + sorted([d for d in available_disciplines if d != "All Disciplines"])
-            available_functions = ["All Functions"] + sorted([f for f in available_functions if f != "All Functions"])
-            from lenses import ERA_ORDER
-            available_eras_list = ["All Eras"] + [e for e in ERA_ORDER if e in available_eras]
+            from lens_catalog import LENSES_HIERARCHY, LENSES_FUNCTIONAL, ERA_ORDER, LENS_INDEX
+
+            # v10.6: Options are computed with bitwise ANDs over the precomputed LensIndex
+            cascade = LENS_INDEX.cascade(current_discipline, current_function, current_era, persona=current_persona, lens=current_lens)
+            available_disciplines = cascade['disciplines']
+            available_functions = cascade['functions']
+            available_eras_list = cascade['eras']
+            available_lenses = cascade['lenses']
+            available_personas = cascade['personas']
 
             # Render filter dropdowns with inline counts
             # v10.5: Restructured layout - Row 1: Discipline + Function, Row 2: Era + Geography
@@ -414,7 +416,7 @@ with st.expander("🔬 Configuration & Framework Selection", expanded=True):
 
             with filter_row2_col2:
                 # v10.5: Geographic filter
-                from lenses import LENSES_GEOGRAPHIC
+                from lens_catalog import LENSES_GEOGRAPHIC
                 geographic_regions = ["All Regions"] + sorted(list(LENSES_GEOGRAPHIC.keys()))
                 current_geographic = st.session_state.get("comparative_geographic_filter", "All Regions")
 
@@ -529,6 +531,11 @@ if analysis_mode == MODE_ZEITGEIST:
         header_text = "Analysis | Zeitgeist Simulation (Common Context)"
 elif analysis_mode == MODE_STANDARD:
     if selection_method == utils.SELECT_SMART:
+        # v10.6: The Comparative Strategist bridges exactly two works
+        if corpus_mode:
+            st.markdown("---")
+            st.info("Smart Selection compares exactly two works. Choose a lens manually for Corpus Mode.")
+            st.stop()
         is_configured = True
         header_text = "Analysis | Smart Selection"
     elif selection_method == utils.SELECT_MANUAL:
@@ -568,6 +575,8 @@ if not is_configured:
     st.stop()  # Stop rendering if config not complete
 
 # Construct header text
+if corpus_mode:
+    header_text += f" | Corpus ({len(input_works)} works)"
 st.header(header_text)
 
 # Execution Button
@@ -590,29 +599,41 @@ if st.button(button_label, type="primary", width="stretch"):
     strategy_display = st.container()
 
     try:
-        synthesis_text, analysis_a_text, analysis_b_text, strategy_a, strategy_b = utils.run_comparative_analysis_pipeline(
-            work_a=work_a,
-            work_b=work_b,
-            selection_method=selection_method,
-            manual_lens_config=selection,
-            strategy_container=strategy_display
-        )
-
-        if synthesis_text:
-            # v10.2: Update session state
-            st.session_state.comparative_result = synthesis_text
-            st.session_state.comparative_state = 'executed'
-            st.session_state.comparative_strategies = (strategy_a, strategy_b)
-            st.session_state.comparative_analyses = (analysis_a_text, analysis_b_text)
+        if corpus_mode:
+            # v10.6: One analysis per work, one synthesis per pair
+            corpus_result = utils.run_corpus_comparative_pipeline(input_works, selection, strategy_container=strategy_display)
+            if corpus_result:
+                st.session_state.comparative_result = utils.format_corpus_report(corpus_result, input_works)
+                st.session_state.comparative_state = 'executed'
+                st.session_state.comparative_corpus_result = corpus_result
+                st.session_state.comparative_strategies = None
+                st.session_state.comparative_analyses = None
+            else:
+                st.error("The corpus comparison did not complete successfully.")
         else:
-            # The pipeline function will show specific errors.
-            st.error("The comparative analysis pipeline did not complete successfully.")
+            synthesis_text, analysis_a_text, analysis_b_text, strategy_a, strategy_b = utils.run_comparative_analysis_pipeline(
+                work_a=work_a,
+                work_b=work_b,
+                selection_method=selection_method,
+                manual_lens_config=selection,
+                strategy_container=strategy_display
+            )
+
+            if synthesis_text:
+                # v10.2: Update session state
+                st.session_state.comparative_result = synthesis_text
+                st.session_state.comparative_state = 'executed'
+                st.session_state.comparative_strategies = (strategy_a, strategy_b)
+                st.session_state.comparative_analyses = (analysis_a_text, analysis_b_text)
+            else:
+                # The pipeline function will show specific errors.
+                st.error("The comparative analysis pipeline did not complete successfully.")
 
     finally:
         # v10.2: Only cleanup if execution failed
         if st.session_state.comparative_state != 'executed':
-            work_a.cleanup_gemini_file()
-            work_b.cleanup_gemini_file()
+            for work_input in input_works:
+                work_input.cleanup_gemini_file()
 
 
 # --- DISPLAY RESULTS FROM SESSION STATE ---
@@ -665,8 +686,18 @@ if st.session_state.comparative_state == 'executed' and st.session_state.compara
 
     # v10.2: Display metadata AFTER result
     st.markdown("---")
-    utils.display_metadata(work_a, label=f"Work A: {work_a.get_display_title()}")
-    utils.display_metadata(work_b, label=f"Work B: {work_b.get_display_title()}")
+    for index, work_input in enumerate(input_works):
+        utils.display_metadata(work_input, label=f"{utils.corpus_work_label(index)}: {work_input.get_display_title()}")
+
+    # v10.6: Per-work analyses of a corpus comparison
+    corpus_result = st.session_state.comparative_corpus_result
+    if corpus_result:
+        st.markdown("---")
+        st.subheader("Source Analyses (Reference)")
+        for index, result in enumerate(corpus_result["analyses"]):
+            if result and index < len(input_works):
+                with st.expander(f"View Raw Analysis {utils.corpus_work_label(index)}: {input_works[index].get_display_title()}"):
+                    st.markdown(result[0])
 
     # Display the raw analyses for reference
     if st.session_state.comparative_analyses:
@@ -679,8 +710,8 @@ if st.session_state.comparative_state == 'executed' and st.session_state.compara
             st.markdown(analysis_b_text)
 
 # v10.2: REFINEMENT LOOP
-# This section is only displayed after execution completes
-if st.session_state.comparative_state == 'executed' and st.session_state.comparative_result:
+# This section is only displayed after execution completes (v10.6: pairwise comparisons only)
+if st.session_state.comparative_state == 'executed' and st.session_state.comparative_result and not st.session_state.comparative_corpus_result:
     st.markdown("---")
     st.subheader("🔄 Refinement Loop")
     with st.container(border=True):
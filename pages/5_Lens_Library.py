@@ -1,7 +1,17 @@
 import streamlit as st
 import pandas as pd
+import math
 import utils
-from lenses import LENS_DEFINITIONS, PERSONA_POOL, SORTED_LENS_NAMES, get_lens_data
+from lens_catalog import get_catalog
+
+# --- CONSTANTS ---
+# v10.6: Entries rendered per page (each entry is several widgets, so reruns scale with this, not the catalog)
+LIBRARY_PAGE_SIZE = 25
+
+# --- CALLBACKS ---
+def change_library_page(delta):
+    """v10.6: Moves the page cursor (clamped when the page renders)."""
+    st.session_state.library_page = max(0, st.session_state.get('library_page', 0) + delta)
 
 # --- PAGE SETUP ---
 PAGE_TITLE = "Janus | Lens Library"
@@ -32,11 +42,17 @@ else:
 st.markdown("---")
 
 # v10.2: Build unified entry database (cached to avoid rebuilding on every rerun)
-@st.cache_data
-def get_cached_entries():
+# v10.6: Keyed by catalog version so a hot-reloaded catalog rebuilds the entries
+# v10.6: cache_resource - the indexed entries are read-only, so reruns share one instance instead of unpickling a copy
+@st.cache_resource
+def get_cached_entries(catalog_version):
     return utils.get_all_entries()
 
-all_entries = get_cached_entries()
+all_entries = get_cached_entries(get_catalog().version)
+
+# v10.2: Initialize expanded state tracking
+if 'library_expanded_entries' not in st.session_state:
+    st.session_state.library_expanded_entries = set()
 
 # v10.2: Handle jump-to-entry from 🔍 buttons
 # Track all entries that should be temporarily visible in a list (to maintain order)
@@ -59,10 +75,12 @@ if 'library_search_target' in st.session_state:
     st.session_state.library_most_recent_jump = target_name
 
     # Auto-expand this entry
-    target_entry = next((e for e in all_entries if e['name'] == target_name), None)
+    target_entry = all_entries.get(target_name)
     if target_entry:
         entry_key = f"{target_entry['type']}_{target_entry['name']}"
         st.session_state.library_expanded_entries.add(entry_key)
+    # v10.6: Navigation entries are listed first, so show the first page
+    st.session_state.library_page = 0
     # Clear the target
     del st.session_state.library_search_target
 
@@ -73,7 +91,7 @@ if st.session_state.library_jump_entries:
         count = len(st.session_state.library_jump_entries)
         if count == 1:
             entry_name = st.session_state.library_jump_entries[0]
-            target_entry = next((e for e in all_entries if e['name'] == entry_name), None)
+            target_entry = all_entries.get(entry_name)
             if target_entry:
                 st.info(f"📍 Showing 1 navigation entry: **{target_entry['icon']} {target_entry['name']}**")
         else:
@@ -127,47 +145,60 @@ st.markdown("---")
 filtered_entries = utils.search_library_entries(all_entries, search_query, selected_types)
 
 # v10.2: Build final list with jump entries at the top in reverse chronological order
-jump_entries_list = []
-non_jump_entries = []
-
-if st.session_state.library_jump_entries:
-    # Separate jump entries from regular entries
-    for entry in filtered_entries:
-        if entry['name'] in st.session_state.library_jump_entries:
-            jump_entries_list.append(entry)
-        else:
-            non_jump_entries.append(entry)
+# v10.6: Jump positions by name, so membership and ordering are O(1) lookups
+jump_positions = {name: position for position, name in enumerate(st.session_state.library_jump_entries)}
 
-    # Add jump entries that aren't already in filtered results
-    for jump_entry_name in st.session_state.library_jump_entries:
-        if not any(e['name'] == jump_entry_name for e in jump_entries_list):
-            target_entry = next((e for e in all_entries if e['name'] == jump_entry_name), None)
-            if target_entry:
-                jump_entries_list.append(target_entry)
-
-    # Sort jump entries by their position in the jump list (maintains chronological order)
-    jump_entries_list = sorted(jump_entries_list,
-                                key=lambda e: st.session_state.library_jump_entries.index(e['name']))
+if jump_positions:
+    # Jump entries in navigation order (most recent first), whether or not they match the filters
+    jump_entries_list = [all_entries.get(name) for name in st.session_state.library_jump_entries if all_entries.get(name)]
+    non_jump_entries = [entry for entry in filtered_entries if entry['name'] not in jump_positions]
 
-    # Sort non-jump entries normally
-    type_order = {'lens': 1, 'persona': 2, 'discipline': 3, 'function': 4, 'era': 5}
-    non_jump_entries = sorted(non_jump_entries, key=lambda e: (type_order.get(e['type'], 99), e['name']))
+    # Sort non-jump entries normally (v10.6: search results keep their relevance ranking)
+    if not search_query:
+        type_order = {'lens': 1, 'persona': 2, 'discipline': 3, 'function': 4, 'era': 5}
+        non_jump_entries = sorted(non_jump_entries, key=lambda e: (type_order.get(e['type'], 99), e['name']))
 
     # Combine: jump entries first, then regular entries
     filtered_entries = jump_entries_list + non_jump_entries
-else:
-    # No jump entries - just sort normally
+elif not search_query:
+    # No jump entries - just sort normally (v10.6: search results keep their relevance ranking)
     type_order = {'lens': 1, 'persona': 2, 'discipline': 3, 'function': 4, 'era': 5}
     filtered_entries = sorted(filtered_entries, key=lambda e: (type_order.get(e['type'], 99), e['name']))
 
 # v10.2: Display results count
 total_count = len(all_entries)
 filtered_count = len(filtered_entries)
-st.markdown(f"**Showing {filtered_count} of {total_count} entries**")
 
-# v10.2: Initialize expanded state tracking
-if 'library_expanded_entries' not in st.session_state:
-    st.session_state.library_expanded_entries = set()
+# v10.6: Stable page cursor - kept across reruns (expanding entries, jumps within the page)
+# and reset only when the search or type filters change
+page_count = max(1, math.ceil(filtered_count / LIBRARY_PAGE_SIZE))
+view_signature = (search_query, tuple(selected_types))
+if st.session_state.get('library_view_signature') != view_signature:
+    st.session_state.library_view_signature = view_signature
+    st.session_state.library_page = 0
+current_page = min(st.session_state.get('library_page', 0), page_count - 1)
+st.session_state.library_page = current_page
+page_start = current_page * LIBRARY_PAGE_SIZE
+page_entries = filtered_entries[page_start:page_start + LIBRARY_PAGE_SIZE]
+
+if page_count > 1:
+    st.markdown(f"**Showing {page_start + 1}–{page_start + len(page_entries)} of {filtered_count} matching entries** ({total_count} total)")
+else:
+    st.markdown(f"**Showing {filtered_count} of {total_count} entries**")
+
+def render_page_controls(position):
+    """v10.6: Previous/next controls for the entry list."""
+    if page_count <= 1:
+        return
+    prev_col, label_col, next_col = st.columns([1, 3, 1])
+    with prev_col:
+        st.button("◀ Previous", key=f"library_prev_{position}", disabled=current_page == 0,
+                  on_click=change_library_page, args=(-1,), use_container_width=True)
+    with label_col:
+        st.markdown(f"<div style='text-align: center'>Page {current_page + 1} of {page_count}</div>", unsafe_allow_html=True)
+    with next_col:
+        st.button("Next ▶", key=f"library_next_{position}", disabled=current_page >= page_count - 1,
+                  on_click=change_library_page, args=(1,), use_container_width=True)
 
 # v10.2: Helper function to sanitize entry names for HTML IDs
 def sanitize_for_html_id(text):
@@ -178,13 +209,14 @@ def sanitize_for_html_id(text):
     return sanitized
 
 # v10.2: Render entry content with anchors
-if filtered_entries:
-    for idx, entry in enumerate(filtered_entries):
+# v10.6: Only the current page is rendered; entry bodies are built only for expanded entries
+if page_entries:
+    render_page_controls("top")
+    for idx, entry in enumerate(page_entries):
         entry_type = entry['type']
         entry_name = entry['name']
         entry_icon = entry['icon']
         entry_description = entry['description']
-        entry_related = entry['related']
 
         # Create unique key for this entry
         entry_key = f"{entry_type}_{entry_name}"
@@ -196,7 +228,7 @@ if filtered_entries:
         st.markdown(f'<div id="anchor_{sanitized_key}"></div>', unsafe_allow_html=True)
 
         # Check if this is a temporarily shown jump entry
-        is_jump_entry = entry_name in st.session_state.library_jump_entries
+        is_jump_entry = entry_name in jump_positions
 
         # Create collapsible button with container (highlight if most recent jump)
         with st.container(border=True):
@@ -208,7 +240,7 @@ if filtered_entries:
                         st.markdown("🔵 **← Just navigated here**")
                     else:
                         # Show position in navigation history
-                        position = st.session_state.library_jump_entries.index(entry_name) + 1
+                        position = jump_positions[entry_name] + 1
                         st.markdown(f"📍 **Navigation #{position}**")
                 with ind_col2:
                     if st.button("✕", key=f"dismiss_{entry_key}", help=f"Remove {entry_name} from navigation"):
@@ -259,34 +291,39 @@ if filtered_entries:
                                 st.session_state.library_search_target = item
                                 st.rerun()
 
+                # v10.6: Related entries come from the precomputed relationship graph (only linkable entries get a 🔍)
+                neighbors_by_type = {}
+                for neighbor in all_entries.neighbors(entry):
+                    neighbors_by_type.setdefault(neighbor['type'], []).append(neighbor['name'])
+
                 # Related lenses
-                render_related_items(entry_related['lenses'], '📖', 'Lenses')
+                render_related_items(neighbors_by_type.get('lens', []), '📖', 'Lenses')
 
                 # Related personas
-                render_related_items(entry_related['personas'], '🎭', 'Personas')
+                render_related_items(neighbors_by_type.get('persona', []), '🎭', 'Personas')
 
                 # Related disciplines
-                render_related_items(entry_related['disciplines'], '🏛️', 'Disciplines')
+                render_related_items(neighbors_by_type.get('discipline', []), '🏛️', 'Disciplines')
 
                 # Related functions
-                render_related_items(entry_related['functions'], '⚙️', 'Functions')
+                render_related_items(neighbors_by_type.get('function', []), '⚙️', 'Functions')
 
                 # Related eras
-                render_related_items(entry_related['eras'], '📅', 'Eras')
+                render_related_items(neighbors_by_type.get('era', []), '📅', 'Eras')
 
                 # v10.2: Perspective Cart Actions (only for lenses)
                 if entry_type == 'lens':
                     st.markdown("---")
                     # Check if lens already in perspectives
                     is_in_cart = any(p.get('lens') == entry_name for p in st.session_state.library_perspectives)
-                    cart_full = len(st.session_state.library_perspectives) >= 6
+                    cart_full = len(st.session_state.library_perspectives) >= utils.SYMPOSIUM_MAX_PERSPECTIVES
 
                     if is_in_cart:
                         st.button("✓ Already in Perspectives", key=f"cart_{entry_name}", disabled=True, use_container_width=True)
                     elif cart_full:
-                        st.button("Cart Full (6/6)", key=f"cart_{entry_name}", disabled=True, use_container_width=True)
+                        st.button(f"Cart Full ({utils.SYMPOSIUM_MAX_PERSPECTIVES}/{utils.SYMPOSIUM_MAX_PERSPECTIVES})", key=f"cart_{entry_name}", disabled=True, use_container_width=True)
                     else:
-                        if st.button(f"+ Add to Perspectives ({perspective_count}/6)", key=f"cart_{entry_name}", use_container_width=True):
+                        if st.button(f"+ Add to Perspectives ({perspective_count}/{utils.SYMPOSIUM_MAX_PERSPECTIVES})", key=f"cart_{entry_name}", use_container_width=True):
                             # Add minimal perspective structure (will be enhanced in Phase 3)
                             st.session_state.library_perspectives.append({
                                 'lens': entry_name,
@@ -298,6 +335,7 @@ if filtered_entries:
                             st.toast(f"✅ Added {entry_name} to perspectives!", icon="📖")
                             st.rerun()
 
+    render_page_controls("bottom")
 else:
     st.info("No entries found matching your search and filter criteria.")
 
@@ -352,7 +390,7 @@ st.caption("💡 **Tip:** Click on any entry to see its description and related
 # v10.2: Scroll to most recent jump target if it exists
 if st.session_state.library_most_recent_jump:
     # Find the entry to get its key
-    target_entry = next((e for e in all_entries if e['name'] == st.session_state.library_most_recent_jump), None)
+    target_entry = all_entries.get(st.session_state.library_most_recent_jump)
     if target_entry:
         entry_key = f"{target_entry['type']}_{sanitize_for_html_id(target_entry['name'])}"
         anchor_id = f"anchor_{entry_key}"
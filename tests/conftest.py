@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app is run as a script directory (streamlit run Home.py), not an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
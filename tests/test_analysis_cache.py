@@ -0,0 +1,83 @@
+import io
+
+import utils
+from utils import WorkInput, analysis_cache_key, get_cached_analysis, store_cached_analysis
+
+LENS = {'lens': "Formalism", 'persona': None, 'is_zeitgeist': False}
+
+
+class FakeUpload(io.BytesIO):
+    """Mimics Streamlit's UploadedFile (a BytesIO with name, size, type and file_id)."""
+
+    def __init__(self, data, file_id, name="scan.png"):
+        super().__init__(data)
+        self.file_id, self.name, self.size, self.type = file_id, name, len(data), "image/png"
+
+
+def text_work(text):
+    return WorkInput(title="Poem", modality=utils.M_TEXT, data=text)
+
+
+def test_key_changes_with_content_lens_and_mode():
+    key = analysis_cache_key(text_work("a rose"), LENS, utils.MODE_ADAPTIVE, None)
+    assert analysis_cache_key(text_work("a rose"), dict(reversed(list(LENS.items()))), utils.MODE_ADAPTIVE, None) == key
+    assert analysis_cache_key(text_work("a rose!"), LENS, utils.MODE_ADAPTIVE, None) != key
+    assert analysis_cache_key(text_work("a rose"), {**LENS, 'lens': "Absurdism"}, utils.MODE_ADAPTIVE, None) != key
+    assert analysis_cache_key(text_work("a rose"), LENS, utils.MODE_DEEP_DIVE, None) != key
+    assert analysis_cache_key(text_work("a rose"), LENS, utils.MODE_ADAPTIVE, "Complex") != key
+
+
+def test_media_is_fingerprinted_by_content_not_name_and_size():
+    work = WorkInput(modality=utils.M_IMAGE)
+    work.uploaded_file_obj = FakeUpload(b"first export", "upload-1")
+    original = work.content_fingerprint()
+    work.uploaded_file_obj = FakeUpload(b"other export", "upload-2")  # Same name and size
+    assert work.content_fingerprint() != original
+    work.uploaded_file_obj = FakeUpload(b"first export", "upload-3")  # Same bytes uploaded again
+    assert work.content_fingerprint() == original
+
+
+def test_media_fingerprint_survives_freeing_the_file_object():
+    work = WorkInput(modality=utils.M_IMAGE)
+    upload = FakeUpload(b"frame data", "upload-4")
+    work.uploaded_file_obj = upload
+    work.uploaded_file_digest = utils.get_upload_digest(upload)
+    before = work.content_fingerprint()
+    work.uploaded_file_obj = None  # Freed once the file is on Gemini's servers
+    assert work.content_fingerprint() == before
+
+
+def test_store_drops_entries_for_earlier_content_and_bounds_the_cache():
+    work = text_work("first draft")
+    old_key = analysis_cache_key(work, LENS, utils.MODE_ADAPTIVE, None)
+    store_cached_analysis(work, old_key, ("old", {}))
+    work.data = "second draft"
+    keys = [analysis_cache_key(work, {**LENS, 'lens': f"Lens {i}"}, utils.MODE_ADAPTIVE, None)
+            for i in range(utils.ANALYSIS_CACHE_MAX_ENTRIES + 2)]
+    for i, key in enumerate(keys):
+        store_cached_analysis(work, key, (f"analysis {i}", {}))
+    assert old_key not in work.analysis_cache
+    assert list(work.analysis_cache) == keys[2:]
+    assert get_cached_analysis(work, keys[-1]) == (f"analysis {len(keys) - 1}", {})
+
+
+def test_reuse_can_be_turned_off():
+    work = text_work("a rose")
+    key = analysis_cache_key(work, LENS, utils.MODE_ADAPTIVE, None)
+    store_cached_analysis(work, key, ("cached", {}))
+    utils.st.session_state["reuse_perspectives"] = False
+    try:
+        assert get_cached_analysis(work, key) is None
+    finally:
+        del utils.st.session_state["reuse_perspectives"]
+    assert get_cached_analysis(work, key) == ("cached", {})
+
+
+def test_session_objects_from_before_the_reuse_caches_still_work():
+    work = text_work("a rose")
+    for attribute in ("analysis_cache", "triage_cache", "uploaded_file_digest"):
+        delattr(work, attribute)
+    key = analysis_cache_key(work, LENS, utils.MODE_ADAPTIVE, None)
+    assert get_cached_analysis(work, key) is None
+    store_cached_analysis(work, key, ("cached", {}))
+    assert get_cached_analysis(work, key) == ("cached", {})
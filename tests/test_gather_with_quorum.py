@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from utils import gather_with_quorum
+
+
+async def finish_after(delay, value):
+    await asyncio.sleep(delay)
+    return value
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_full_quorum_waits_for_every_result_in_input_order():
+    coroutines = [finish_after(0.03, "slow"), finish_after(0.0, "fast"), finish_after(0.01, "middle")]
+    results, excluded = run(gather_with_quorum(coroutines, 1.0, grace_seconds=0))
+    assert results == ["slow", "fast", "middle"]
+    assert excluded == []
+
+
+def test_stragglers_past_the_grace_window_are_excluded_and_cancelled():
+    cancelled = []
+
+    async def straggler():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario():
+        coroutines = [finish_after(0, "a"), straggler(), finish_after(0, "b"), finish_after(0, "c")]
+        outcome = await gather_with_quorum(coroutines, 0.75, grace_seconds=0.01)
+        await asyncio.sleep(0)  # Let the cancellation be delivered
+        return outcome
+
+    results, excluded = run(scenario())
+    assert results == ["a", None, "b", "c"]
+    assert excluded == [1]
+    assert cancelled == [True]
+
+
+def test_late_results_within_the_grace_window_are_kept():
+    coroutines = [finish_after(0, "a"), finish_after(0, "b"), finish_after(0.02, "late")]
+    results, excluded = run(gather_with_quorum(coroutines, 0.5, grace_seconds=1))
+    assert results == ["a", "b", "late"]
+    assert excluded == []
+
+
+def test_zero_grace_returns_as_soon_as_the_quorum_is_met():
+    coroutines = [finish_after(0, "a"), finish_after(0.5, "slow"), finish_after(0.5, "slower")]
+    results, excluded = run(gather_with_quorum(coroutines, 0.3, grace_seconds=0))
+    assert results == ["a", None, None]
+    assert excluded == [1, 2]
+
+
+def test_error_strings_count_toward_the_quorum():
+    # Specialists report failures as "[Error ...]" strings rather than raising; those are
+    # completed results, so a quorum reached by errors still closes the swarm.
+    coroutines = [finish_after(0, "[Error: Specialist failed]"), finish_after(0, "[Error: Timed out]"), finish_after(10, "report")]
+    results, excluded = run(gather_with_quorum(coroutines, 0.6, grace_seconds=0))
+    assert results == ["[Error: Specialist failed]", "[Error: Timed out]", None]
+    assert excluded == [2]
+
+
+def test_quorum_is_at_least_one_and_rounds_up():
+    coroutines = [finish_after(0, "a"), finish_after(10, "b"), finish_after(10, "c")]
+    results, excluded = run(gather_with_quorum(coroutines, 0.0, grace_seconds=0))
+    assert results == ["a", None, None]
+
+    coroutines = [finish_after(0, "a"), finish_after(0.01, "b"), finish_after(10, "c")]
+    results, excluded = run(gather_with_quorum(coroutines, 0.34, grace_seconds=0))  # ceil(1.02) = 2
+    assert results == ["a", "b", None]
+    assert excluded == [2]
+
+
+def test_no_coroutines():
+    assert run(gather_with_quorum([], 0.8)) == ([], [])
+
+
+def test_accepts_already_running_tasks():
+    async def scenario():
+        futures = [asyncio.ensure_future(finish_after(0, "a")), asyncio.ensure_future(finish_after(0, "b"))]
+        return await gather_with_quorum(futures, 1.0, grace_seconds=0)
+
+    assert run(scenario()) == (["a", "b"], [])
+
+
+def test_cancelling_the_gather_cancels_every_task():
+    cancelled = []
+
+    async def worker():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario():
+        gather = asyncio.ensure_future(gather_with_quorum([worker(), worker()], 1.0))
+        await asyncio.sleep(0.01)
+        gather.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await gather
+        await asyncio.sleep(0)
+
+    run(scenario())
+    assert cancelled == [True, True]
@@ -0,0 +1,100 @@
+import json
+
+from utils import IncrementalTaskParser
+
+
+def feed_all(parser, chunks):
+    tasks = []
+    for chunk in chunks:
+        tasks.extend(parser.feed(chunk))
+    return tasks
+
+
+def test_tasks_are_emitted_as_soon_as_each_string_closes():
+    parser = IncrementalTaskParser()
+    assert parser.feed('{"persona_instruction": "Be terse", "analytical_tasks": ["First') == []
+    assert parser.feed(' task", "Sec') == ["First task"]
+    assert parser.feed('ond task"') == ["Second task"]
+    assert parser.feed(']}') == []
+    assert parser.finished
+    assert parser.tasks == ["First task", "Second task"]
+
+
+def test_task_split_at_every_position_matches_full_parse():
+    response = json.dumps({
+        "framework_name": "Formalism",
+        "analytical_tasks": ["Imagery of light", "Meter and rhythm", "Closing couplet"],
+    })
+    expected = json.loads(response)["analytical_tasks"]
+    for split in range(len(response) + 1):
+        parser = IncrementalTaskParser()
+        assert feed_all(parser, [response[:split], response[split:]]) == expected
+
+
+def test_single_character_chunks():
+    response = '{"analytical_tasks": ["a", "b c", ""]}'
+    parser = IncrementalTaskParser()
+    assert feed_all(parser, list(response)) == ["a", "b c", ""]
+    assert parser.finished
+
+
+def test_escaped_quotes_and_backslashes():
+    tasks = ['The "unreliable" narrator', 'Path C:\\poems\\', 'Line\nbreak and \\"nested\\"']
+    response = json.dumps({"analytical_tasks": tasks})
+    parser = IncrementalTaskParser()
+    # Split inside the escape sequences, not just between tasks
+    chunks = [response[i:i + 3] for i in range(0, len(response), 3)]
+    assert feed_all(parser, chunks) == tasks
+
+
+def test_escape_split_across_chunks_does_not_close_the_string():
+    parser = IncrementalTaskParser()
+    assert parser.feed('{"analytical_tasks": ["say \\') == []
+    assert parser.feed('"hi\\"') == []
+    assert parser.feed('"]') == ['say "hi"']
+
+
+def test_truncated_response_keeps_only_completed_tasks():
+    parser = IncrementalTaskParser()
+    tasks = feed_all(parser, ['{"analytical_tasks": ["Complete one", "Complete two", "Cut off mid'])
+    assert tasks == ["Complete one", "Complete two"]
+    assert not parser.finished
+    assert parser.tasks == ["Complete one", "Complete two"]
+
+
+def test_key_split_across_chunks():
+    parser = IncrementalTaskParser()
+    assert parser.feed('{"analytical_ta') == []
+    assert parser.feed('sks"') == []
+    assert parser.feed(' : [ "Only"') == ["Only"]
+
+
+def test_no_tasks_key_yields_nothing():
+    parser = IncrementalTaskParser()
+    assert feed_all(parser, ['{"persona_instruction": "x"}']) == []
+    assert parser.position is None
+
+
+def test_unexpected_array_content_stops_incremental_parsing():
+    parser = IncrementalTaskParser()
+    assert feed_all(parser, ['{"analytical_tasks": ["ok", {"task": "object"}, "later"]}']) == ["ok"]
+    assert parser.finished
+
+
+def test_empty_array():
+    parser = IncrementalTaskParser()
+    assert feed_all(parser, ['{"analytical_tasks": []}']) == []
+    assert parser.finished
+
+
+def test_feeding_after_the_array_closes_is_ignored():
+    parser = IncrementalTaskParser()
+    parser.feed('{"analytical_tasks": ["a"]')
+    assert parser.feed(', "other": ["b"]}') == []
+    assert parser.tasks == ["a"]
+
+
+def test_invalid_escape_stops_incremental_parsing_without_raising():
+    parser = IncrementalTaskParser()
+    assert feed_all(parser, ['{"analytical_tasks": ["ok", "bad \\x escape", "later"]}']) == ["ok"]
+    assert parser.finished
@@ -0,0 +1,71 @@
+import itertools
+
+import lens_catalog
+from lens_catalog import LensIndex
+
+HIERARCHY = {"Philosophy": ["Absurdism", "Stoicism"], "Literary Theory": ["Formalism", "Absurdism"]}
+FUNCTIONAL = {"Tier 2": ["Formalism"], "Tier 3": ["Absurdism", "Stoicism"]}
+BY_ERA = {"Ancient": ["Stoicism"], "Modern": ["Absurdism", "Formalism"]}
+GEOGRAPHIC = {"Western Europe": ["Absurdism", "Formalism", "Stoicism"], "Russia": ["Formalism"]}
+PERSONA_METADATA = {
+    "Seneca": {"disciplines": {"Philosophy"}, "functions": {"Tier 3"}, "eras": {"Ancient"}, "lenses": ["Stoicism"]},
+    "Albert Camus": {"disciplines": {"Philosophy", "Literary Theory"}, "functions": {"Tier 3"}, "eras": {"Modern"}, "lenses": ["Absurdism"]},
+    "Viktor Shklovsky": {"disciplines": {"Literary Theory"}, "functions": {"Tier 2"}, "eras": {"Modern"}, "lenses": ["Formalism"]},
+}
+
+
+def make_index():
+    return LensIndex(["Absurdism", "Formalism", "Stoicism"], sorted(PERSONA_METADATA), HIERARCHY, FUNCTIONAL,
+                     BY_ERA, GEOGRAPHIC, PERSONA_METADATA, ["Ancient", "Modern"])
+
+
+def test_filters_intersect_and_decode_alphabetically():
+    index = make_index()
+    assert index.filter_lenses() == ["Absurdism", "Formalism", "Stoicism"]
+    assert index.filter_lenses(discipline="Philosophy") == ["Absurdism", "Stoicism"]
+    assert index.filter_lenses(discipline="Philosophy", era="Modern") == ["Absurdism"]
+    assert index.filter_lenses(function="Tier 2", region="Russia") == ["Formalism"]
+    assert index.filter_lenses(persona="Seneca") == ["Stoicism"]
+    assert index.filter_lenses(discipline="Unknown") == []
+
+
+def test_no_filter_values_are_ignored():
+    index = make_index()
+    assert index.filter_lenses("All Disciplines", "All Functions", "All Eras", "All Regions", "(AI Decides)") == index.filter_lenses()
+
+
+def test_reverse_lookups_follow_source_order():
+    index = make_index()
+    assert index.lens_disciplines["Absurdism"] == ["Philosophy", "Literary Theory"]
+    assert index.lens_eras["Stoicism"] == ["Ancient"]
+
+
+def test_cascade_restricts_each_dropdown_by_the_other_selections():
+    cascade = make_index().cascade("Philosophy", "All Functions", "Modern")
+    assert cascade["disciplines"] == ["All Disciplines", "Literary Theory", "Philosophy"]  # Restricted by era only
+    assert cascade["functions"] == ["All Functions", "Tier 3"]
+    assert cascade["eras"] == ["All Eras", "Ancient", "Modern"]  # Chronological, restricted by discipline only
+    assert cascade["lenses"] == ["Absurdism"]
+    assert cascade["personas"] == ["Albert Camus"]
+
+
+def test_persona_mask_matches_metadata():
+    index = make_index()
+    assert index.decode_personas(index.persona_mask(function="Tier 3")) == ["Albert Camus", "Seneca"]
+    assert index.decode_personas(index.persona_mask(lens="Formalism")) == ["Viktor Shklovsky"]
+
+
+def test_catalog_index_matches_brute_force_filtering():
+    catalog = lens_catalog.get_catalog()
+    index = catalog.index
+    disciplines = [None] + list(catalog.hierarchy)[:4]
+    functions = [None] + list(catalog.functional)
+    eras = [None] + catalog.era_order[:3]
+    for discipline, function, era in itertools.product(disciplines, functions, eras):
+        expected = [
+            name for name in catalog.lens_names
+            if (discipline is None or name in catalog.hierarchy[discipline])
+            and (function is None or name in catalog.functional[function])
+            and (era is None or name in catalog.by_era.get(era, []))
+        ]
+        assert index.filter_lenses(discipline, function, era) == expected
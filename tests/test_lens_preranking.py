@@ -0,0 +1,53 @@
+import lens_catalog
+import utils
+from utils import WorkInput
+
+
+def catalog_text(lens_names):
+    catalog = lens_catalog.get_catalog()
+    return "\n".join(catalog.get_description(lens_name) for lens_name in lens_names)
+
+
+def test_retriever_ranks_a_lens_first_for_its_own_description():
+    catalog = lens_catalog.get_catalog()
+    retriever = utils._build_lens_retriever(catalog)
+    for lens_name in catalog.lens_names[::40]:
+        ranked = retriever.rank(catalog.get_description(lens_name))
+        assert ranked[0][0] == lens_name
+        scores = [score for _, score in ranked]
+        assert scores == sorted(scores, reverse=True)
+
+
+def test_retriever_returns_nothing_without_known_terms():
+    retriever = utils._build_lens_retriever(lens_catalog.get_catalog())
+    assert retriever.rank("") == []
+    assert retriever.rank("qqqq zzzz") == []
+
+
+def test_media_works_are_not_pre_ranked_on_their_title():
+    work = WorkInput(title="The Starry Night", modality=utils.M_IMAGE)
+    assert utils.get_selection_query_text(work) is None
+    assert utils.preselect_lens_candidates(None) is None
+
+
+def test_text_query_includes_title_and_body():
+    work = WorkInput(title="Ozymandias", modality=utils.M_TEXT, data="I met a traveller from an antique land")
+    query_text = utils.get_selection_query_text(work)
+    assert query_text.startswith("Ozymandias\n")
+    assert "antique land" in query_text
+    assert utils.get_selection_query_text(WorkInput(title="Empty", modality=utils.M_TEXT, data="")) is None
+
+
+def test_thin_queries_offer_the_full_catalog():
+    assert utils.preselect_lens_candidates("A short poem about the sea") is None
+
+
+def test_rich_queries_keep_every_function_tier():
+    catalog = lens_catalog.get_catalog()
+    candidates = utils.preselect_lens_candidates(catalog_text(catalog.lens_names[:12]))
+    assert candidates is not None
+    assert len(candidates) >= utils.SMART_SELECTION_CANDIDATES
+    assert len(set(candidates)) == len(candidates)
+    for tier_name in catalog.functional:
+        tier_lenses = [name for name in candidates if tier_name in catalog.index.lens_functions.get(name, [])]
+        assert len(tier_lenses) >= min(utils.SMART_SELECTION_MIN_PER_TIER, len(catalog.functional[tier_name]))
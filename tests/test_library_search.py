@@ -0,0 +1,64 @@
+import utils
+from utils import LibrarySearchIndex
+
+
+class StubCatalog:
+    """Serves sub_primers for the test lenses."""
+
+    SUB_PRIMERS = {"Stoicism": {"Virtue": "Living according to nature and reason."}}
+
+    def get_lens_data(self, lens_name):
+        return {"sub_primers": self.SUB_PRIMERS.get(lens_name)}
+
+
+def entry(entry_type, name, description, tags=()):
+    return {"type": entry_type, "name": name, "description": description, "tags": {name.lower(), *tags}}
+
+
+ENTRIES = [
+    entry("lens", "Absurdism", "Meaning sought in an indifferent universe.", {"philosophy"}),
+    entry("lens", "Stoicism", "Ethics of endurance and self-command.", {"philosophy", "ancient"}),
+    entry("lens", "Formalism", "Attention to device, form and defamiliarization.", {"literary theory"}),
+    entry("persona", "Albert Camus", "Historical figure associated with Absurdism", {"absurdism", "philosophy"}),
+]
+
+
+def make_index():
+    return LibrarySearchIndex(ENTRIES, StubCatalog())
+
+
+def test_entry_named_by_the_query_ranks_first():
+    results = make_index().search("absurdism")
+    assert results[0] == ("lens", "Absurdism")
+    assert ("persona", "Albert Camus") in results
+
+
+def test_every_query_term_must_match():
+    index = make_index()
+    assert index.search("philosophy ancient") == [("lens", "Stoicism")]
+    assert index.search("philosophy nonexistentterm") == []
+
+
+def test_prefix_matches_support_search_as_you_type():
+    assert make_index().search("defamil") == [("lens", "Formalism")]
+
+
+def test_typos_match_fuzzily():
+    assert make_index().search("stoicsm")[0] == ("lens", "Stoicism")
+
+
+def test_sub_primers_are_searchable():
+    assert make_index().search("virtue") == [("lens", "Stoicism")]
+
+
+def test_types_filter_and_empty_queries():
+    index = make_index()
+    assert index.search("absurdism", types={"persona"}) == [("persona", "Albert Camus")]
+    assert index.search("") == []
+    assert index.search(None) == []
+
+
+def test_catalog_search_finds_lenses_by_name():
+    index = utils.get_library_search_index()
+    assert index.search("absurdism")[0] == ("lens", "Absurdism")
+    assert index.search("absurdsm")[0] == ("lens", "Absurdism")
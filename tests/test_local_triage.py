@@ -0,0 +1,73 @@
+import pytest
+
+import utils
+from utils import extract_triage_features, local_text_triage, score_triage_features
+
+PLAIN_SENTENCES = (
+    "We went to the shop and we got some milk and some bread for the house. "
+    "Then we went back home and we had a cup of tea with it. "
+)
+
+DENSE_PROSE = (
+    "Luminous, the drowned cathedral breathes like a wounded animal, its vaulted ribs shimmering as if "
+    "remembering fire, while obsidian swallows circle ancient bells whose tongues, like exiled prophets, "
+    "murmur forgotten liturgies into brackish silence, and memory itself becomes a cartographer of ruin, "
+    "mapping grief like constellations across vanished horizons"
+)
+
+DICKINSON = """Because I could not stop for Death –
+He kindly stopped for me –
+The Carriage held but just Ourselves –
+And Immortality.
+
+We slowly drove – He knew no haste
+And I had put away
+My labor and my leisure too,
+For His Civility –"""
+
+
+def test_long_plain_prose_is_decided_simple_locally():
+    text = PLAIN_SENTENCES * 12
+    assert extract_triage_features(text)["word_count"] >= utils.LOCAL_TRIAGE_MIN_WORDS
+    classification, score, _ = local_text_triage(text)
+    assert classification == "Simple"
+    assert score <= utils.LOCAL_TRIAGE_SIMPLE_THRESHOLD
+
+
+def test_short_text_is_never_rated_simple():
+    text = " ".join(PLAIN_SENTENCES.split()[:40])
+    classification, score, _ = local_text_triage(text)
+    assert score <= utils.LOCAL_TRIAGE_SIMPLE_THRESHOLD  # Would have been Simple on score alone
+    assert classification is None
+
+
+def test_verse_is_never_rated_simple():
+    verse = "\n".join(["We went to the shop and we got some milk,", "and some bread for the house and then we"] * 20)
+    features = extract_triage_features(verse)
+    assert features["word_count"] >= utils.LOCAL_TRIAGE_MIN_WORDS
+    assert features["median_line_length"] <= utils.LOCAL_TRIAGE_VERSE_MAX_LINE_CHARS
+    assert local_text_triage(verse)[0] is None
+
+
+def test_short_poem_escalates_to_the_triage_analyst():
+    assert local_text_triage(DICKINSON)[0] != "Simple"
+
+
+def test_dense_figurative_text_is_decided_complex_regardless_of_length():
+    classification, score, _ = local_text_triage(DENSE_PROSE)
+    assert classification == "Complex"
+    assert score >= utils.LOCAL_TRIAGE_COMPLEX_THRESHOLD
+
+
+def test_empty_text_has_no_verdict():
+    assert local_text_triage("") == (None, None, None)
+    assert local_text_triage(None) == (None, None, None)
+
+
+def test_score_is_bounded():
+    extreme = {"lexical_density": 5, "avg_sentence_length": 500, "figurative_rate": 50,
+               "line_irregularity": 9, "vocabulary_richness": 90}
+    assert score_triage_features(extreme) == pytest.approx(1.0)
+    minimal = {"lexical_density": 0, "avg_sentence_length": 0, "figurative_rate": 0,
+               "line_irregularity": 0, "vocabulary_richness": 0}
+    assert score_triage_features(minimal) == 0.0
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+import utils
+from utils import HedgeBudget, WorkInput, execute_specialist_hedged
+
+MODEL = "test-model"
+P90 = 0.05
+
+
+@pytest.fixture
+def run_hedged(monkeypatch):
+    """Runs one hedged specialist whose primary and hedge requests take (delay, result) in order."""
+    monkeypatch.setitem(utils._SPECIALIST_LATENCIES, MODEL, utils.collections.deque([P90] * 10))
+
+    def run(*behaviors):
+        calls = iter(behaviors)
+
+        async def fake_specialist(*args):
+            delay, result = next(calls)
+            await asyncio.sleep(delay)
+            return result
+
+        monkeypatch.setattr(utils, "execute_specialist", fake_specialist)
+        work = WorkInput(title="Poem", data="text")
+        result = asyncio.run(execute_specialist_hedged(None, work, "task", None, model=MODEL, hedge_budget=HedgeBudget(10)))
+        return result, work.metadata
+
+    return run
+
+
+def test_hedge_win_records_a_lower_bound_on_the_time_saved(run_hedged):
+    result, metadata = run_hedged((1.0, "primary"), (0.02, "hedge"))
+    assert result == "hedge"
+    assert (metadata["hedge_requests"], metadata["hedge_wins"]) == (1, 1)
+    # The primary was cancelled after ~P90 + 0.02s; the hedge took ~0.02s
+    assert P90 * 0.8 <= metadata["hedge_time_saved"] < 0.5
+
+
+def test_failed_hedge_does_not_win_or_save_time(run_hedged):
+    result, metadata = run_hedged((0.15, "primary"), (0.0, "[Error 429]"))
+    assert result == "primary"
+    assert metadata["hedge_wins"] == 0
+    assert metadata["hedge_time_saved"] == 0.0
+
+
+def test_both_failing_returns_an_error_report(run_hedged):
+    result, metadata = run_hedged((0.15, "[Error a]"), (0.0, "[Error b]"))
+    assert result.startswith("[Error")
+    assert metadata["hedge_wins"] == 0
+
+
+def test_fast_primary_is_not_hedged(run_hedged):
+    result, metadata = run_hedged((0.0, "primary"))
+    assert result == "primary"
+    assert metadata["hedge_requests"] == 0
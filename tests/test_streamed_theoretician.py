@@ -0,0 +1,57 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import utils
+from utils import WorkInput, execute_adaptive_theoretician
+
+
+class StatusLog:
+    def write(self, *args, **kwargs):
+        pass
+
+
+def streaming_client(text, chunk_size=7):
+    """A client whose generate_content_stream yields `text` in small chunks."""
+    async def generate_content_stream(**kwargs):
+        async def chunks():
+            for start in range(0, len(text), chunk_size):
+                yield SimpleNamespace(text=text[start:start + chunk_size], usage_metadata=None)
+        return chunks()
+
+    return SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content_stream=generate_content_stream)))
+
+
+def run_streamed(text):
+    dispatched = []
+    result = asyncio.run(execute_adaptive_theoretician(
+        streaming_client(text), WorkInput(title="Poem", data="A short poem."), {'lens': None, 'persona': None},
+        StatusLog(), model=utils.MODEL_FLASH, on_task=lambda index, task: dispatched.append((index, task)),
+    ))
+    return result, dispatched
+
+
+def test_valid_plan_is_dispatched_while_streaming_and_returned():
+    plan = {"analytical_tasks": ["Imagery", "Meter"], "persona_instruction": "Speak as a formalist."}
+    (tasks, persona_instruction, framework_name), dispatched = run_streamed(json.dumps(plan))
+    assert tasks == ["Imagery", "Meter"]
+    assert persona_instruction == "Speak as a formalist."
+    assert framework_name == "General Analysis"
+    assert dispatched == [(0, "Imagery"), (1, "Meter")]
+
+
+def test_plan_without_persona_instruction_is_rejected():
+    result, dispatched = run_streamed(json.dumps({"analytical_tasks": ["Imagery"]}))
+    assert result == (None, None, None)
+
+
+def test_non_string_tasks_are_never_dispatched_and_the_plan_is_rejected():
+    plan = {"persona_instruction": "x", "analytical_tasks": ["Imagery", {"task": "Meter"}, 3]}
+    result, dispatched = run_streamed(json.dumps(plan))
+    assert result == (None, None, None)
+    assert dispatched == [(0, "Imagery")]
+
+
+def test_unparseable_response_is_rejected():
+    result, _ = run_streamed('{"analytical_tasks": ["Imagery"')
+    assert result == (None, None, None)
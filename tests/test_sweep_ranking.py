@@ -0,0 +1,59 @@
+import collections
+import math
+
+import pytest
+
+import utils
+from utils import rank_sweep_results
+
+
+def brute_force_ranking(analyses, relevance):
+    """All-pairs cosine over the full term vectors, the reference the indexed ranking must match."""
+    vectors = {}
+    for lens_name, text in analyses.items():
+        counts = collections.Counter(utils._retrieval_terms(text))
+        weights = {term: 1 + math.log(tf) for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vectors[lens_name] = {term: w / norm for term, w in weights.items()}
+    max_relevance = max(relevance.get(name, 0.0) for name in analyses) or 1.0
+    ranking = []
+    for lens_name, vector in vectors.items():
+        closest = max((sum(w * other.get(term, 0.0) for term, w in vector.items())
+                       for other_name, other in vectors.items() if other_name != lens_name), default=0.0)
+        ranking.append((lens_name, 0.5 * relevance.get(lens_name, 0.0) / max_relevance + 0.5 * (1.0 - closest)))
+    return sorted(ranking, key=lambda item: (-item[1], item[0]))
+
+
+ANALYSES = {
+    "Marxist": "labor capital class struggle production labor wages factory",
+    "Feminist": "gender patriarchy voice silence domestic labor gender",
+    "Economic": "capital wages labor production market factory prices",
+    "Ecocritical": "river forest soil climate seasons animals",
+    "Empty": "",
+}
+
+
+def test_matches_brute_force_when_vectors_fit_the_cap():
+    relevance = {"Marxist": 0.4, "Feminist": 0.1, "Economic": 0.2}
+    expected = brute_force_ranking(ANALYSES, relevance)
+    actual = rank_sweep_results(ANALYSES, relevance)
+    assert [name for name, _ in actual] == [name for name, _ in expected]
+    for (_, score), (_, expected_score) in zip(actual, expected):
+        assert score == pytest.approx(expected_score)
+
+
+def test_overlapping_analyses_are_less_distinctive():
+    scores = dict(rank_sweep_results(ANALYSES, {}))
+    assert scores["Ecocritical"] == pytest.approx(0.5)
+    assert scores["Marxist"] < scores["Feminist"] < scores["Ecocritical"]
+
+
+def test_single_analysis_is_fully_distinctive():
+    assert rank_sweep_results({"Only": "labor capital"}, {"Only": 0.3}) == [("Only", 1.0)]
+
+
+def test_vectors_are_capped_to_their_heaviest_terms(monkeypatch):
+    monkeypatch.setattr(utils, "SWEEP_DISTINCTIVENESS_TERMS", 1)
+    analyses = {"A": "labor labor labor shared", "B": "capital capital capital shared"}
+    # Only each analysis's heaviest term survives, so the shared minor term no longer counts
+    assert dict(rank_sweep_results(analyses, {})) == {"A": 0.5, "B": 0.5}
@@ -0,0 +1,25 @@
+import pytest
+
+from utils import group_symposium_panels
+
+
+def make_results(count):
+    return [({'lens': f"Lens {i}"}, f"Analysis {i}") for i in range(count)]
+
+
+@pytest.mark.parametrize("count", range(1, 25))
+def test_panels_cover_every_analysis_once_in_selection_order(count):
+    panels = group_symposium_panels(make_results(count), panel_size=5)
+    flattened = [idx for panel in panels for idx, _, _ in panel]
+    assert flattened == list(range(count))
+    assert all(len(panel) <= 5 for panel in panels)
+
+
+@pytest.mark.parametrize("count, sizes", [(8, [4, 4]), (11, [3, 4, 4]), (24, [4, 5, 5, 5, 5]), (5, [5])])
+def test_panels_are_near_equal(count, sizes):
+    assert [len(panel) for panel in group_symposium_panels(make_results(count), panel_size=5)] == sizes
+
+
+def test_entries_keep_their_config_and_text():
+    panels = group_symposium_panels(make_results(3), panel_size=5)
+    assert panels == [[(0, {'lens': "Lens 0"}, "Analysis 0"), (1, {'lens': "Lens 1"}, "Analysis 1"), (2, {'lens': "Lens 2"}, "Analysis 2")]]
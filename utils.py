@@ -7,11 +7,21 @@ import time
 import logging
 import json
 import asyncio
+import concurrent.futures
 import random
 import functools
-from pydantic import BaseModel, Field
+import hashlib
+import math
+import bisect
+import re
+import collections
+import collections.abc
+from pydantic import BaseModel, Field, ValidationError
 # v10.0: Updated imports (Removed PERSONA_STYLE_GUIDES as it's deprecated)
-from lenses import SORTED_LENS_NAMES, LENSES_HIERARCHY, LENSES_FUNCTIONAL, LENSES_BY_ERA, PERSONA_POOL, get_lens_data
+# v10.6: Lens data is served from the compiled catalog artifact (lens_catalog.py) instead of importing lenses.py
+# Catalog structures are read as lens_catalog.<NAME> at call time so hot reloads are picked up.
+import lens_catalog
+from lens_catalog import get_catalog, get_lens_data, get_lens_description
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO)
@@ -177,6 +187,73 @@ SELECT_MANUAL = "Manual Selection"
 SELECT_SMART = "Smart Selection (Let Janus Choose)"
 SELECTION_MODES = (SELECT_MANUAL, SELECT_SMART)
 
+# v10.6: Request hedging for the Specialist Swarm
+# A specialist that runs past the running p90 latency for its model gets a duplicate request.
+HEDGE_LATENCY_PERCENTILE = 0.9
+HEDGE_MIN_SAMPLES = 5  # Latency samples required before hedging is enabled for a model
+HEDGE_HISTORY_SIZE = 200  # Recent latency samples kept per model
+HEDGE_MAX_FRACTION = 0.25  # At most 25% of a swarm's specialists may be hedged (caps extra spend)
+
+# v10.6: Quorum-based early synthesis
+# Fraction of specialists that must report before the Master Synthesizer may start, per analysis mode.
+SWARM_QUORUM_BY_MODE = {
+    MODE_ADAPTIVE: 0.8,
+    MODE_SURFACE_SCRAPE: 0.8,
+    MODE_DEEP_DIVE: 1.0,  # Deep Dive waits for every specialist by default
+}
+SWARM_QUORUM_GRACE_SECONDS = 10  # Extra wait for late reports once the quorum is reached
+
+# v10.6: Local heuristic Triage for text works (opt-in: the thresholds are hand-set, not calibrated
+# against the Triage Analyst). Scores at or below SIMPLE (or at or above COMPLEX) are decided locally;
+# anything between escalates to the API.
+LOCAL_TRIAGE_SIMPLE_THRESHOLD = 0.25
+LOCAL_TRIAGE_COMPLEX_THRESHOLD = 0.70
+LOCAL_TRIAGE_MIN_WORDS = 300            # Shorter texts are never rated Simple locally (the features depend on length)
+LOCAL_TRIAGE_VERSE_MIN_LINES = 4        # Texts laid out in at least this many lines...
+LOCAL_TRIAGE_VERSE_MAX_LINE_CHARS = 60  # ...with a median line this short are treated as verse (never Simple locally)
+
+# v10.6: Local lens pre-ranking for Smart Selection
+SMART_SELECTION_CANDIDATES = 30         # Top-K lenses sent to the Analyst-in-Chief / Comparative Strategist
+SMART_SELECTION_MIN_PER_TIER = 3        # Each function tier keeps at least this many candidates
+SMART_SELECTION_DESCRIPTION_CHARS = 140 # Description length per candidate in the prompt
+SMART_SELECTION_QUERY_CHARS = 20000     # Portion of a text work used for ranking
+SMART_SELECTION_MIN_QUERY_TERMS = 40    # Fewer distinct terms than this: offer the full catalog instead
+
+# v10.6: Background proactive upload (media is uploaded while the user configures the analysis)
+PROACTIVE_UPLOAD_WORKERS = 4            # Concurrent background uploads per server process
+PROACTIVE_UPLOAD_POLL_SECONDS = 2       # How often the upload status fragment checks for completion
+
+# v10.6: Offline pairing suggestions (precomputed lens relation matrices in the catalog)
+PAIRING_SUGGESTION_COUNT = 3            # Thesis/antithesis pairs offered on the Dialectical page
+
+# v10.6: Corpus comparative mode (every pair of works under one lens)
+CORPUS_MAX_WORKS = 8                    # Works per corpus (28 pairs)
+CORPUS_ANALYSIS_CONCURRENCY = 3         # Full single-lens pipelines in flight at once (each runs its own swarm)
+CORPUS_SYNTHESIS_CONCURRENCY = 4        # Pairwise comparative syntheses in flight at once
+
+# v10.6: Lens Sweep (one work through the whole catalog or a filtered subset)
+SWEEP_MAX_CONCURRENT_ANALYSES = 4       # Global limit on analyses in flight during a sweep
+SWEEP_PROGRESS_HEIGHT = 320             # Height (px) of the scrollable per-lens progress area
+SWEEP_TOP_LENSES = 10                   # Lenses highlighted by the relevance ranking
+SWEEP_CONFIRM_THRESHOLD = 10            # Sweeps of more lenses than this require explicit cost confirmation
+SWEEP_DISTINCTIVENESS_TERMS = 200       # Top terms per analysis kept when comparing sweep results
+
+# v10.6: Large Symposia (analyses bounded in flight, hierarchical synthesis past the threshold)
+SYMPOSIUM_MAX_PERSPECTIVES = 24         # Upper bound for manual and Smart Selection symposia
+MAX_CONCURRENT_PERSPECTIVES = 6         # Perspective pipelines in flight at once (each runs its own swarm)
+SYMPOSIUM_PANEL_THRESHOLD = 8           # Larger symposia are synthesized through sub-panels
+SYMPOSIUM_PANEL_SIZE = 5                # Target perspectives per sub-panel
+SYMPOSIUM_PANEL_CONCURRENCY = 4         # Sub-panel briefs generated at once
+SYMPOSIUM_BRIEF_WORDS = 350             # Target length of each participant's condensed position
+
+# v10.6: Incremental recomputation (stored analyses reused while their dependency fingerprint is unchanged)
+ANALYSIS_CACHE_MAX_ENTRIES = 32         # Stored analyses kept per work (oldest dropped first)
+UPLOAD_DIGEST_CACHE_SIZE = 64           # Content digests of uploaded files kept per server process
+
+# v10.6: Zeitgeist batch (one witness per historical moment, sharing one preparation)
+ZEITGEIST_BATCH_CONCURRENCY = 4         # Witness simulations in flight at once
+ZEITGEIST_DEFAULT_WITNESS = "An educated, culturally engaged contemporary of this era, responding with its knowledge, values and prejudices"
+
 # v9.4b: LENS_ZEITGEIST constant removed. Zeitgeist is now handled via configuration flags (is_zeitgeist).
 
 # --- TOOLTIP DEFINITIONS ---
@@ -213,6 +290,19 @@ TOOLTIPS = {
 
     # Technical / Performance
     "context_caching": "Stores uploaded file on Gemini's servers temporarily for faster multi-lens analysis. Significantly reduces costs and latency for Symposium/Dialectical modes with 3+ lenses.",
+    "swarm_quorum": "Share of specialists that must report before synthesis begins. Late reports get a short grace window and are then dropped (and recorded) so one slow call cannot hold up the whole analysis.",
+    "local_triage": "Text works only. Skips the Triage API call when local heuristics are confident. Short texts and verse are always escalated to the Triage Analyst, and the heuristics are not calibrated against it, so borderline works may be routed differently.",
+    "speculative_theoretician": "Adaptive mode only. Starts the low-cost Flash-Lite strategy alongside Triage. If the work is rated Simple it is used immediately (saving a full round trip); if Complex it is discarded and the Pro strategy runs.",
+    "request_hedging": "When a specialist runs slower than 90% of recent calls, a duplicate request is sent and whichever finishes first is used. Limited to a quarter of each swarm to cap extra cost.",
+    "lens_preranking": "Smart Selection first ranks the lens library against the work locally and offers the AI only the best-matching candidates (with short descriptions) instead of the whole catalog. Works without text to rank on (e.g. untitled media) still receive the full list.",
+    "pairing_suggestions": "Suggests contrasting thesis/antithesis pairs instantly from a lens-contrast matrix precomputed with the catalog (shared subject, divergent era, tier and vocabulary). Uses the lenses most relevant to the work when pre-ranking is on. No API call.",
+    "reuse_perspectives": "When re-executing a Dialectical, Symposium or Comparative analysis, perspectives whose inputs are unchanged (work content, lens configuration, analysis mode, rigor and model routing) reuse their stored analysis; only changed perspectives and the final synthesis are recomputed. Turn off to regenerate every perspective.",
+    "symposium_panels": f"Symposia with more than {SYMPOSIUM_PANEL_THRESHOLD} perspectives are synthesized hierarchically: perspectives are grouped into sub-panels of about {SYMPOSIUM_PANEL_SIZE}, each panel is condensed into a brief in parallel, and the final dialogue is written from the briefs.",
+    "zeitgeist_batch": "Simulates the same work as perceived in several historical moments (by default one witness per era) with one upload, context cache and Triage shared by all witnesses, then compares the receptions in chronological order.",
+    "lens_sweep": "Runs this work through every lens in the catalog (or the lenses matching the filters) with one upload, one context cache and one Triage shared by all of them. Results appear as they complete and are then ranked locally by relevance to the work and distinctiveness from the other analyses.",
+    "sweep_cost": "Every lens is a full analysis (Theoretician, specialist swarm and Pro synthesis), so a sweep costs roughly 9 to 14 API calls per lens. The estimate is an upper bound for the current analysis mode, including the extra specialist calls hedging may add. Narrow the sweep with the filters to reduce it.",
+    "corpus_mode": "Compare every pair in a set of works through the same lens. Each work is analyzed once per lens and rigor level (results are reused across pairs and re-runs); only the comparative synthesis runs per pair.",
+    "balanced_set_suggestions": "Suggests a balanced set of lenses instantly from a lens-complementarity matrix precomputed with the catalog, covering different tiers, disciplines and eras. Lenses already chosen are kept. No API call.",
     "rigor_level": "Complexity assessment from Triage. Determines which model (Flash-Lite or Pro) is used for analysis stages in Adaptive mode.",
 
     # UI Elements
@@ -278,11 +368,24 @@ class WorkInput:
             "total_input_tokens": 0,
             "total_output_tokens": 0,
             "cached_content_tokens": 0,
-            "api_calls": 0
+            "api_calls": 0,
+            # v10.6: Request hedging metrics (Specialist Swarm)
+            "specialist_calls": 0,
+            "hedge_requests": 0,
+            "hedge_wins": 0,
+            "hedge_time_saved": 0.0
         }
         # Video processing options
         self.video_mode = V_MODE_FULL
         self.keyframe_interval = 10 # Default interval in seconds
+        # v10.6: Background proactive upload (concurrent.futures.Future resolving to (file, state name))
+        self.upload_future = None
+        self.upload_started_at = None
+        self.upload_error = None
+        # v10.6: Reusable single-lens analyses (keyed by their dependency fingerprint, see analysis_cache_key)
+        self.analysis_cache = {}
+        self.triage_cache = None  # (content fingerprint, complexity)
+        self.uploaded_file_digest = None  # SHA-1 of the uploaded file's bytes (kept when the Gemini file is cleaned up)
 
     def is_ready(self):
         if self.modality == M_TEXT:
@@ -295,6 +398,67 @@ class WorkInput:
     def get_display_title(self):
         return self.title if self.title else "(Untitled)"
 
+    def content_fingerprint(self):
+        """Identifies the current content (text digest, or file content digest and video options for media)."""
+        if self.modality == M_TEXT:
+            return hashlib.sha1((self.data or "").encode("utf-8")).hexdigest()
+        file_digest = getattr(self, "uploaded_file_digest", None)  # Absent on session objects from before v10.6
+        if file_digest is None and self.uploaded_file_obj is not None:
+            file_digest = get_upload_digest(self.uploaded_file_obj)
+        if file_digest is None:
+            # The file metadata is cleared with the Gemini file (cleanup_gemini_file); the widget's file object is not
+            file_name = self.uploaded_file_name or getattr(self.uploaded_file_obj, "name", None)
+            file_size = self.uploaded_file_size or getattr(self.uploaded_file_obj, "size", None)
+            file_digest = f"{file_name}:{file_size}"
+        return f"{self.modality}:{file_digest}:{self.video_mode}:{self.keyframe_interval}"
+
+    # v10.6: Background proactive upload
+    def start_background_upload(self, client):
+        """Submits the upload of the current file to the background executor (no-op if not needed)."""
+        if self.gemini_file_ref is not None or self.uploaded_file_obj is None or self.upload_future is not None:
+            return
+        mime_type = resolve_upload_mime_type(self.uploaded_file_obj)
+        if not mime_type:
+            # Reported by the regular upload path on execution
+            self.upload_error = "Could not determine the file type (MIME type)."
+            return
+        self.upload_error = None
+        self.upload_started_at = time.time()
+        self.upload_future = UPLOAD_EXECUTOR.submit(upload_and_wait_for_processing, client, self.uploaded_file_obj, mime_type)
+
+    def upload_pending(self):
+        return self.upload_future is not None and not self.upload_future.done()
+
+    def collect_background_upload(self):
+        """
+        Applies a finished background upload to this WorkInput (script thread only).
+        Returns the Gemini file reference, or None if there is none (yet).
+        """
+        future = self.upload_future
+        if future is None or not future.done():
+            return self.gemini_file_ref
+        self.upload_future = None
+        try:
+            uploaded_file, state_name = future.result()
+        except Exception as e:
+            self.upload_error = str(e)
+            logging.warning(f"Proactive upload failed: {e}")
+            return None
+        if state_name != "ACTIVE":
+            self.upload_error = f"File processing ended in state {state_name}."
+            logging.warning(f"Proactive upload failed: {self.upload_error}")
+            return None
+        self.gemini_file_ref = uploaded_file
+        # Free memory: File is now on Gemini's servers, we only need the reference
+        self.uploaded_file_obj = None
+        return uploaded_file
+
+    def wait_for_background_upload(self):
+        """Blocks until a pending background upload settles, then applies it."""
+        if self.upload_future is not None:
+            concurrent.futures.wait([self.upload_future])
+        return self.collect_background_upload()
+
     def cleanup_gemini_file(self):
         # v10.1: Migrated to google-genai SDK
         # v10.2: Also cleanup context cache if present
@@ -304,6 +468,12 @@ class WorkInput:
         # Always clear local references, even if deletion fails
         cache_ref_to_delete = self.cache_ref
         file_ref_to_delete = self.gemini_file_ref
+        # v10.6: A background upload still in flight is discarded (its file is deleted once it lands)
+        upload_to_discard = self.upload_future
+        self.upload_future = None
+        self.upload_error = None
+        if upload_to_discard is not None and upload_to_discard.cancel():
+            upload_to_discard = None
 
         # Clear local references immediately to prevent stale reference bugs
         self.cache_ref = None
@@ -322,6 +492,9 @@ class WorkInput:
             logging.warning("Client initialization failed - cleared local references but couldn't delete from Gemini servers")
             return
 
+        if upload_to_discard is not None:
+            upload_to_discard.add_done_callback(functools.partial(_delete_discarded_upload, client))
+
         # Try to delete cache
         if cache_ref_to_delete:
             try:
@@ -371,6 +544,10 @@ def upload_to_gemini(work_input: WorkInput):
     Handles uploading media files (Image/Audio/Video) to the Gemini API.
     Utilizes caching within the WorkInput object.
     """
+    # v10.6: Join a proactive upload still running in the background instead of uploading again
+    if work_input.upload_future is not None:
+        work_input.wait_for_background_upload()
+
     # Check if already uploaded
     if work_input.gemini_file_ref:
         # File already uploaded, skip re-upload
@@ -388,47 +565,14 @@ def upload_to_gemini(work_input: WorkInput):
         return None
 
     # 1. Determine MIME type
-    mime_type = work_input.uploaded_file_obj.type
-    file_name = work_input.uploaded_file_obj.name
-
-    if not mime_type or mime_type == "application/octet-stream":
-        # Fallback
-        guessed_mime, _ = mimetypes.guess_type(file_name)
-        if guessed_mime:
-            mime_type = guessed_mime
-
+    mime_type = resolve_upload_mime_type(work_input.uploaded_file_obj)
     if not mime_type:
         st.error("Could not determine the file type (MIME type).")
         return None
 
-    # Pass Streamlit's UploadedFile directly (no temp storage, no memory copy)
     try:
-        # 2. Prepare file for upload - Streamlit's UploadedFile is already seekable and binary
-        work_input.uploaded_file_obj.seek(0)
-
-        # 3. Upload directly to Gemini using UploadedFile (no BytesIO copy needed)
-        uploaded_file = client.files.upload(
-            file=work_input.uploaded_file_obj,
-            config={'mime_type': mime_type}
-        )
-
-        # 4. Poll for Processing (happens on Gemini's servers, not in Streamlit RAM)
-        start_time = time.time()
-        POLL_INTERVAL = 5
-        TIMEOUT = 600 # 10 minutes timeout
-
-        def get_state_name(file_obj):
-             return getattr(file_obj.state, 'name', str(file_obj.state))
-
-        current_state_name = get_state_name(uploaded_file)
-
-        while current_state_name == "PROCESSING":
-            if time.time() - start_time > TIMEOUT:
-                raise TimeoutError("File processing timed out.")
-
-            time.sleep(POLL_INTERVAL)
-            uploaded_file = client.files.get(name=uploaded_file.name)
-            current_state_name = get_state_name(uploaded_file)
+        # 2-4. Upload and poll for processing (v10.6: shared with the background proactive upload)
+        uploaded_file, current_state_name = upload_and_wait_for_processing(client, work_input.uploaded_file_obj, mime_type)
 
         # 5. Final State Check
         if current_state_name == "FAILED":
@@ -464,6 +608,79 @@ def upload_to_gemini(work_input: WorkInput):
         logging.error(f"File upload error: {e}")
         return None
 
+# v10.6: Content digests of uploaded files, keyed by the uploader's file_id (an upload's bytes never change)
+_UPLOAD_DIGESTS = collections.OrderedDict()
+
+def get_upload_digest(uploaded_file_obj):
+    """SHA-1 of an uploaded file's bytes, hashed once per upload (a new file with the same name and size differs)."""
+    file_id = uploaded_file_obj.file_id
+    digest = _UPLOAD_DIGESTS.get(file_id)
+    if digest is None:
+        with uploaded_file_obj.getbuffer() as buffer:  # Hash in place, without copying the file
+            digest = hashlib.sha1(buffer).hexdigest()
+        _UPLOAD_DIGESTS[file_id] = digest
+        while len(_UPLOAD_DIGESTS) > UPLOAD_DIGEST_CACHE_SIZE:
+            _UPLOAD_DIGESTS.popitem(last=False)
+    return digest
+
+def resolve_upload_mime_type(uploaded_file_obj):
+    """Returns the MIME type of an uploaded file, guessing from its name if the browser didn't send one."""
+    mime_type = uploaded_file_obj.type
+    if not mime_type or mime_type == "application/octet-stream":
+        # Fallback
+        guessed_mime, _ = mimetypes.guess_type(uploaded_file_obj.name)
+        if guessed_mime:
+            mime_type = guessed_mime
+    return mime_type
+
+def upload_and_wait_for_processing(client, uploaded_file_obj, mime_type):
+    """
+    Uploads a file to the Gemini File API and polls until processing has finished.
+    Makes no Streamlit calls, so it can also run on the background upload executor.
+
+    Returns: (file reference, final state name). Raises TimeoutError if processing takes too long.
+    """
+    # Pass Streamlit's UploadedFile directly (no temp storage, no memory copy)
+    # Streamlit's UploadedFile is already seekable and binary
+    uploaded_file_obj.seek(0)
+    uploaded_file = client.files.upload(
+        file=uploaded_file_obj,
+        config={'mime_type': mime_type}
+    )
+
+    # Poll for Processing (happens on Gemini's servers, not in Streamlit RAM)
+    start_time = time.time()
+    POLL_INTERVAL = 5
+    TIMEOUT = 600 # 10 minutes timeout
+
+    def get_state_name(file_obj):
+         return getattr(file_obj.state, 'name', str(file_obj.state))
+
+    current_state_name = get_state_name(uploaded_file)
+
+    while current_state_name == "PROCESSING":
+        if time.time() - start_time > TIMEOUT:
+            raise TimeoutError("File processing timed out.")
+
+        time.sleep(POLL_INTERVAL)
+        uploaded_file = client.files.get(name=uploaded_file.name)
+        current_state_name = get_state_name(uploaded_file)
+
+    return uploaded_file, current_state_name
+
+# v10.6: Background proactive upload. Uploads run on a small thread pool and are tracked as
+# futures on the WorkInput; the script thread applies the result (WorkInput.collect_background_upload).
+UPLOAD_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=PROACTIVE_UPLOAD_WORKERS, thread_name_prefix="gemini-upload")
+
+def _delete_discarded_upload(client, future):
+    """Done-callback for a background upload whose WorkInput moved on: deletes the orphaned file."""
+    try:
+        uploaded_file, _ = future.result()
+        client.files.delete(name=uploaded_file.name)
+        logging.info(f"Cleaned up discarded background upload: {uploaded_file.name}")
+    except Exception as e:
+        logging.warning(f"Could not clean up discarded background upload: {e}")
+
 @retry_with_backoff(max_retries=3, base_delay=2)
 async def upload_to_gemini_async(work_input: WorkInput, status_container):
     # v10.1: Migrated to google-genai SDK with native async support
@@ -473,6 +690,13 @@ async def upload_to_gemini_async(work_input: WorkInput, status_container):
     Handles uploading media files (Image/Audio/Video) to the Gemini API.
     Utilizes caching within the WorkInput object.
     """
+    # v10.6: Await a proactive upload still running in the background instead of uploading again
+    if work_input.upload_future is not None:
+        if work_input.upload_pending():
+            status_container.write("Waiting for the background upload to finish...")
+            await asyncio.wait([asyncio.wrap_future(work_input.upload_future)])
+        work_input.collect_background_upload()
+
     if work_input.gemini_file_ref:
         status_container.write("Using cached file reference.")
         return work_input.gemini_file_ref
@@ -488,14 +712,7 @@ async def upload_to_gemini_async(work_input: WorkInput, status_container):
         st.error("Failed to initialize API client.")
         return None
 
-    mime_type = work_input.uploaded_file_obj.type
-    file_name = work_input.uploaded_file_obj.name
-
-    if not mime_type or mime_type == "application/octet-stream":
-        guessed_mime, _ = mimetypes.guess_type(file_name)
-        if guessed_mime:
-            mime_type = guessed_mime
-
+    mime_type = resolve_upload_mime_type(work_input.uploaded_file_obj)
     if not mime_type:
         st.error("Could not determine the file type (MIME type).")
         return None
@@ -653,9 +870,52 @@ def invalidate_cache_if_mode_changed(work_input: WorkInput, current_mode: str, a
             return True
     return False
 
+# v10.6: Background context caching
+async def await_context_cache(cache_task):
+    """
+    Waits for a context cache being created concurrently and returns its name,
+    or None if creation failed (callers then proceed uncached).
+    The task is shielded so a cancelled waiter (e.g., a specialist dropped by the quorum)
+    does not cancel cache creation for the others.
+    """
+    try:
+        cache = await asyncio.shield(cache_task)
+    except asyncio.CancelledError:
+        if not cache_task.cancelled():
+            raise
+        return None
+    except Exception as e:
+        logging.warning(f"Context cache unavailable: {e}. Proceeding without cache.")
+        return None
+    return cache.name if cache else None
+
+async def create_context_cache_in_background(client, work_input: WorkInput, model: str, status_container, analysis_mode=None, work_label=None):
+    """
+    Wraps create_context_cache_async for use as a concurrent task: never raises, and closes
+    the status container once the cache is created or skipped. Returns the cache or None.
+    """
+    label_suffix = f" for {work_label}" if work_label else ""
+    try:
+        cache = await create_context_cache_async(client, work_input, model, status_container, analysis_mode=analysis_mode)
+    except Exception as e:
+        logging.warning(f"Cache setup failed{label_suffix}: {e}. Proceeding without cache.")
+        cache = None
+    if cache:
+        status_container.update(label=f"Context cache created{label_suffix}", state="complete")
+    else:
+        status_container.update(label=f"Cache creation skipped{label_suffix} (proceeding without caching)", state="complete")
+    return cache
+
 # --- UTILITY FUNCTIONS ---
 
 # v10.2: Backward compatibility helper
+def ensure_reuse_caches(work_input: WorkInput):
+    """Ensures the v10.6 reuse caches exist on WorkInput (for backward compatibility with old session objects)."""
+    if not hasattr(work_input, 'analysis_cache'):
+        work_input.analysis_cache = {}
+    if not hasattr(work_input, 'triage_cache'):
+        work_input.triage_cache = None
+
 def ensure_metadata(work_input: WorkInput):
     """Ensures metadata dict exists on WorkInput (for backward compatibility with old session objects)."""
     if not hasattr(work_input, 'metadata'):
@@ -663,7 +923,11 @@ def ensure_metadata(work_input: WorkInput):
             "total_input_tokens": 0,
             "total_output_tokens": 0,
             "cached_content_tokens": 0,
-            "api_calls": 0
+            "api_calls": 0,
+            "specialist_calls": 0,
+            "hedge_requests": 0,
+            "hedge_wins": 0,
+            "hedge_time_saved": 0.0
         }
 
 # v10.2: Metadata tracking helper
@@ -700,6 +964,40 @@ def accumulate_metadata(work_input: WorkInput, response):
     except Exception as e:
         logging.error(f"✗ Failed to extract metadata: {e}", exc_info=True)
 
+# v10.6: Shared incremental renderer for streamed generations
+async def stream_generate_content(client, contents, works: list, stream_container=None, model=MODEL_PRO):
+    """
+    Streams a generation through client.aio, rendering the text word-by-word into stream_container (if provided).
+    Usage metadata from the final chunk is accumulated on every WorkInput in works.
+
+    Returns:
+        The full generated text.
+    """
+    full_text = ""
+    placeholder = stream_container.empty() if stream_container is not None else None
+    chunk = None
+
+    async for chunk in await client.aio.models.generate_content_stream(
+        model=model,
+        contents=contents
+    ):
+        if chunk.text:
+            full_text += chunk.text
+            if placeholder is not None:
+                placeholder.markdown(full_text)
+
+    # Accumulate metadata from final chunk
+    if chunk is not None and hasattr(chunk, 'usage_metadata'):
+        # Create a pseudo-response object for metadata accumulation
+        class StreamResponse:
+            def __init__(self, usage_metadata, text):
+                self.usage_metadata = usage_metadata
+                self.text = text
+        for work_input in works:
+            accumulate_metadata(work_input, StreamResponse(chunk.usage_metadata, full_text))
+
+    return full_text
+
 def display_metadata(work_input: WorkInput, label="Analysis Complete"):
     """
     Displays API usage metadata in an expander for the given WorkInput.
@@ -748,6 +1046,17 @@ def display_metadata(work_input: WorkInput, label="Analysis Complete"):
             else:
                 st.metric("Cached Tokens", "0", delta="No cache used", delta_color="off")
 
+        # v10.6: Request hedging metrics (only shown if any specialist was hedged)
+        hedge_requests = metadata.get("hedge_requests", 0)
+        if hedge_requests > 0:
+            specialist_calls = max(1, metadata.get("specialist_calls", 0))
+            st.caption(
+                f"⚡ Request Hedging: {hedge_requests}/{specialist_calls} specialists hedged "
+                f"({hedge_requests / specialist_calls:.0%} hedge rate), "
+                f"{metadata.get('hedge_wins', 0)} won by the duplicate, "
+                f"≥{metadata.get('hedge_time_saved', 0.0):.1f}s of tail latency saved"
+            )
+
 # v10.2: Export utility function
 def create_export_content(
     result_text: str,
@@ -829,6 +1138,12 @@ def create_export_content(
             f"**Cached Tokens:** {metadata['cached_content_tokens']:,}"
         ])
 
+        # v10.6: Request hedging metrics
+        if metadata.get("hedge_requests", 0) > 0:
+            lines.append(
+                f"**Hedged Specialists:** {metadata['hedge_requests']}/{metadata.get('specialist_calls', 0)} ({metadata.get('hedge_wins', 0)} won by duplicate, ≥{metadata.get('hedge_time_saved', 0.0):.1f}s saved)"
+            )
+
         # For Comparative, add Work B metadata
         if work_input_b:
             ensure_metadata(work_input_b)
@@ -908,6 +1223,12 @@ def create_export_content(
             f"Cached Tokens: {metadata['cached_content_tokens']:,}"
         ])
 
+        # v10.6: Request hedging metrics
+        if metadata.get("hedge_requests", 0) > 0:
+            lines.append(
+                f"Hedged Specialists: {metadata['hedge_requests']}/{metadata.get('specialist_calls', 0)} ({metadata.get('hedge_wins', 0)} won by duplicate, ≥{metadata.get('hedge_time_saved', 0.0):.1f}s saved)"
+            )
+
         # For Comparative, add Work B metadata
         if work_input_b:
             ensure_metadata(work_input_b)
@@ -969,13 +1290,145 @@ def get_modality_instructions(work_input: WorkInput):
             """
     return ""
 
+# --- SMART SELECTION: LOCAL LENS PRE-RANKING (v10.6) ---
+
+_STEM_SUFFIXES = ("ations", "ation", "ically", "ical", "ments", "ment", "ness", "ists", "isms", "ist", "ism", "ity", "ies", "ing", "ed", "es", "al", "ic", "s", "y")
+
+def _stem(term):
+    """Crude suffix stripping so e.g. 'feminist', 'feminism' and 'feminists' share a term."""
+    for suffix in _STEM_SUFFIXES:
+        if term.endswith(suffix) and len(term) - len(suffix) >= 4:
+            return term[:-len(suffix)]
+    return term
+
+def _retrieval_terms(text):
+    return [_stem(term) for term in re.findall(r"[a-z]+", text.lower()) if len(term) > 2 and term not in _FUNCTION_WORDS]
+
+class LensRetriever:
+    """
+    TF-IDF retrieval over one catalog snapshot. Each lens document is its name, description,
+    sub-primers and disciplines; a work is scored against every lens by cosine similarity
+    using an inverted index.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        documents = {}
+        for lens_name in catalog.lens_names:
+            data = catalog.get_lens_data(lens_name) or {}
+            parts = [lens_name, lens_name, data.get("description") or ""]  # Name counted twice
+            for title, text in (data.get("sub_primers") or {}).items():
+                parts.extend((title, text))
+            parts.extend(catalog.index.lens_disciplines.get(lens_name, []))
+            documents[lens_name] = collections.Counter(_retrieval_terms(" ".join(parts)))
+
+        document_frequency = collections.Counter(term for counts in documents.values() for term in counts)
+        self.idf = {term: math.log((1 + len(documents)) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+        self.postings = collections.defaultdict(list)  # term -> [(lens_name, normalized weight)]
+        for lens_name, counts in documents.items():
+            weights = {term: (1 + math.log(tf)) * self.idf[term] for term, tf in counts.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, weight in weights.items():
+                self.postings[term].append((lens_name, weight / norm))
+
+    def rank(self, text):
+        """Returns [(lens_name, score)] for lenses sharing any term with the text, best first."""
+        counts = collections.Counter(term for term in _retrieval_terms(text) if term in self.idf)
+        if not counts:
+            return []
+        query = {term: (1 + math.log(tf)) * self.idf[term] for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in query.values()))
+        scores = collections.defaultdict(float)
+        for term, weight in query.items():
+            for lens_name, lens_weight in self.postings[term]:
+                scores[lens_name] += weight / norm * lens_weight
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+@functools.lru_cache(maxsize=2)
+def _build_lens_retriever(catalog):
+    return LensRetriever(catalog)
+
+def get_selection_query_text(work_input: WorkInput):
+    """
+    The text used to pre-rank lenses for a work: its title plus the work itself. None for works
+    without a text body (media), whose title alone says too little to restrict the catalog on.
+    """
+    if work_input.modality != M_TEXT or not work_input.data:
+        return None
+    return "\n".join([work_input.title or "", work_input.data[:SMART_SELECTION_QUERY_CHARS]])
+
+def preselect_lens_candidates(query_text, top_k=SMART_SELECTION_CANDIDATES):
+    """
+    Returns a short list of candidate lenses for Smart Selection, or None when the text gives
+    too little signal to rank on (the caller then offers the full catalog).
+
+    The top-K lenses by similarity are topped up so every function tier has at least
+    SMART_SELECTION_MIN_PER_TIER candidates, keeping contrasting and holistic choices available.
+    """
+    if not query_text or len(set(_retrieval_terms(query_text))) < SMART_SELECTION_MIN_QUERY_TERMS:
+        return None
+    catalog = get_catalog()
+    ranked = _build_lens_retriever(catalog).rank(query_text)
+    if len(ranked) < top_k:
+        return None
+
+    candidates = [lens_name for lens_name, _ in ranked[:top_k]]
+    for tier_name in catalog.functional:
+        tier_candidates = [lens_name for lens_name in candidates if tier_name in catalog.index.lens_functions.get(lens_name, [])]
+        for lens_name, _ in ranked[top_k:]:
+            if len(tier_candidates) >= SMART_SELECTION_MIN_PER_TIER:
+                break
+            if tier_name in catalog.index.lens_functions.get(lens_name, []) and lens_name not in candidates:
+                candidates.append(lens_name)
+                tier_candidates.append(lens_name)
+    return candidates
+
+def format_lens_candidates(candidates):
+    """Formats candidate lenses as prompt lines with shortened descriptions."""
+    lines = []
+    for lens_name in candidates:
+        description = " ".join((get_lens_description(lens_name) or "").split())
+        if len(description) > SMART_SELECTION_DESCRIPTION_CHARS:
+            description = description[:SMART_SELECTION_DESCRIPTION_CHARS].rsplit(" ", 1)[0] + "…"
+        lines.append(f"    - {lens_name}: {description}")
+    return "\n".join(lines)
+
+def build_available_lenses_context(query_text, status_container=None):
+    """
+    Returns the 'Available Lenses' prompt context for Smart Selection: pre-ranked candidates with
+    short descriptions when the work supports it, otherwise the full list of lens names.
+    """
+    if st.session_state.get("lens_preranking", True):
+        candidates = preselect_lens_candidates(query_text)
+        if candidates:
+            if status_container:
+                status_container.write(f"Pre-ranked {len(candidates)} candidate lenses locally (of {len(lens_catalog.SORTED_LENS_NAMES)}).")
+            return "Candidate Lenses (pre-selected for this work; choose ONLY from these):\n" + format_lens_candidates(candidates)
+    return f"Available Lenses: {json.dumps(lens_catalog.SORTED_LENS_NAMES)}"
+
+@functools.lru_cache(maxsize=8)
+def _cached_lens_candidates(query_text, catalog_version):
+    candidates = preselect_lens_candidates(query_text)
+    return tuple(candidates) if candidates else None
+
+def get_pairing_candidates(work_input: WorkInput):
+    """
+    v10.6: The lenses offline pairing suggestions are drawn from: the pre-ranked candidates for
+    the work when pre-ranking is on and the work gives enough signal, otherwise None (whole library).
+    """
+    if not st.session_state.get("lens_preranking", True):
+        return None
+    return _cached_lens_candidates(get_selection_query_text(work_input), get_catalog().version)
+
 # --- SMART SELECTION (Analyst-in-Chief) ---
 
 @retry_with_backoff(max_retries=3, base_delay=2)
-def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_container):
+async def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_container):
     # v10.1: Migrated to google-genai SDK - now accepts client instead of model
     # v9.4b: Updated prompt to remove the constraint about Zeitgeist, as it's no longer a lens.
     # v10.2: Added retry logic with exponential backoff
+    # v10.6: Async (client.aio), so run_analysis_pipeline can overlap it with context cache creation
     """
     The "Analyst-in-Chief" meta-call. Selects the most potent lenses.
     Uses JSON mode via response_mime_type config.
@@ -988,7 +1441,7 @@ def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_
     # 1. Handle Media Upload if necessary (and utilize cache)
     if work_input.modality in [M_IMAGE, M_AUDIO, M_VIDEO]:
         # This function handles upload/caching and stores the reference
-        gemini_file = upload_to_gemini(work_input)
+        gemini_file = await upload_to_gemini_async(work_input, status_container)
         if not gemini_file:
             status_container.update(label="Smart Selection failed due to upload error.", state="error")
             return None
@@ -1004,6 +1457,9 @@ def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_
              video_mode_context += " (Focus selection on lenses appropriate for analyzing sparse visual moments combined with the audio/transcript.)"
 
 
+    # v10.6: Offer locally pre-ranked candidates instead of the whole catalog when possible
+    available_lenses_context = build_available_lenses_context(get_selection_query_text(work_input), status_container)
+
     # 2. Construct the Prompt
     # v9.4b: Removed the constraint regarding the "Zeitgeist" lens.
     prompt = textwrap.dedent(f"""
@@ -1014,7 +1470,7 @@ def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_
     **Context:**
     1. Modality of the Work: `{work_input.modality}`
     2. The Creative Work: [Provided in the input context, analyze it deeply]
-    3. Available Lenses: {json.dumps(SORTED_LENS_NAMES)}
+    3. {available_lenses_context}
     4. Required Number of Lenses: {required_count}
     {video_mode_context}
 
@@ -1033,7 +1489,7 @@ def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_
       "justification": "The rationale for selecting these specific lenses..."
     }}
     
-    Ensure the lens names match the Available Lenses list exactly.
+    Ensure the lens names match the lens list above exactly.
     """)
     
     # Add prompt instructions
@@ -1046,7 +1502,7 @@ def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_
     # 3. Execute the API call with Pydantic schema
     try:
         # v10.2: Use Pydantic schema for automatic validation and parsing
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=MODEL_FLASH,  # Using flash for smart selection
             contents=content_input,
             config={
@@ -1090,7 +1546,7 @@ def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_
 
         # Ensure selected lenses exist in the master list
         for lens in selected_lenses:
-            if lens not in SORTED_LENS_NAMES:
+            if lens not in lens_catalog.SORTED_LENS_NAMES:
                     st.error(f"AI selected an unknown lens: '{lens}'. Please use manual selection.")
                     logging.error(f"Unknown lens selected: {lens}. Selected: {selected_lenses}")
                     return None
@@ -1114,9 +1570,10 @@ def analyst_in_chief(client, work_input: WorkInput, required_count: int, status_
 
 # v10.0.5: New function for Comparative Smart Selection
 @retry_with_backoff(max_retries=3, base_delay=2)
-def comparative_strategist(client, work_a: WorkInput, work_b: WorkInput, status_container):
+async def comparative_strategist(client, work_a: WorkInput, work_b: WorkInput, status_container):
     # v10.1: Migrated to google-genai SDK - now accepts client instead of model
     # v10.2: Added retry logic with exponential backoff
+    # v10.6: Async (client.aio), so the Comparative pipeline can overlap it with caching and triage
     """
     The "Comparative Strategist" meta-call. Selects a single potent lens for comparing two works.
     Uses JSON mode via response_mime_type config.
@@ -1134,12 +1591,19 @@ def comparative_strategist(client, work_a: WorkInput, work_b: WorkInput, status_
         upload_tasks.append(upload_to_gemini_async(work_b, status_container))
 
     if upload_tasks:
-        uploaded_files = run_async_tasks(upload_tasks)
+        uploaded_files = await asyncio.gather(*upload_tasks)
         if not all(uploaded_files):
             status_container.update(label="Smart Selection failed due to upload error.", state="error")
             return None
         # The file references are now cached in the work_input objects.
 
+    # v10.6: Offer locally pre-ranked candidates (shared by both works) instead of the whole catalog when possible.
+    # Only when both works have a text body; otherwise the media work would be represented by its title alone.
+    query_a, query_b = get_selection_query_text(work_a), get_selection_query_text(work_b)
+    available_lenses_context = build_available_lenses_context(
+        query_a + "\n" + query_b if query_a and query_b else None, status_container
+    )
+
     # 2. Construct the Prompt
     prompt = textwrap.dedent(f"""
     {JANUS_DIRECTIVES}
@@ -1149,7 +1613,7 @@ def comparative_strategist(client, work_a: WorkInput, work_b: WorkInput, status_
     **Context:**
     - Work A: Title '{work_a.get_display_title()}', Modality '{work_a.modality}'
     - Work B: Title '{work_b.get_display_title()}', Modality '{work_b.modality}'
-    - Available Lenses: {json.dumps(SORTED_LENS_NAMES)}
+    - {available_lenses_context}
 
     **Instructions:**
     1. **Analyze Both Works:** Examine the content, themes, style, and structure of both Work A and Work B.
@@ -1164,7 +1628,7 @@ def comparative_strategist(client, work_a: WorkInput, work_b: WorkInput, status_
       "justification": "The rationale for selecting this lens to bridge the two works..."
     }}
     
-    Ensure the lens name matches the Available Lenses list exactly.
+    Ensure the lens name matches the lens list above exactly.
     """)
     
     # Add prompt and work data to the content input
@@ -1180,7 +1644,7 @@ def comparative_strategist(client, work_a: WorkInput, work_b: WorkInput, status_
     # 3. Execute the API call with Pydantic schema
     try:
         # v10.2: Use Pydantic schema for automatic validation and parsing
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=MODEL_FLASH,
             contents=content_input,
             config={
@@ -1203,7 +1667,7 @@ def comparative_strategist(client, work_a: WorkInput, work_b: WorkInput, status_
         selected_lens = result.selected_lens
         justification = result.justification
 
-        if selected_lens and selected_lens in SORTED_LENS_NAMES:
+        if selected_lens and selected_lens in lens_catalog.SORTED_LENS_NAMES:
             status_container.write("Lens selected by Comparative Strategist.")
             st.success(f"**Janus Smart Selection:** {selected_lens}")
             with st.expander("View Justification"):
@@ -1223,6 +1687,103 @@ def comparative_strategist(client, work_a: WorkInput, work_b: WorkInput, status_
 # CORE GENERATION FUNCTIONS (v10.0: Generative & Adaptive Architecture)
 # =============================================================================
 
+# -----------------------------------------------------------------------------
+# STAGE 1 (LOCAL): HEURISTIC TRIAGE FOR TEXT WORKS (v10.6)
+# -----------------------------------------------------------------------------
+
+# Common English function words (used to measure lexical density)
+_FUNCTION_WORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being below between
+both but by can could did do does doing down during each few for from further had has have having he her
+here hers herself him himself his how i if in into is it its itself just me more most my myself no nor not
+now of off on once only or other our ours ourselves out over own same she should so some such than that the
+their theirs them themselves then there these they this those through to too under until up very was we
+were what when where which while who whom why will with would you your yours yourself yourselves
+""".split())
+
+# Surface markers of figurative language (simile, comparison, apostrophe, archaic/poetic diction)
+_FIGURATIVE_MARKERS = re.compile(
+    r"\b(like a|like an|like the|as if|as though|as a|seemed|seems|resembl\w*|becomes|became|o |thou|thee|thy|ye)\b",
+    re.IGNORECASE
+)
+
+def extract_triage_features(text: str):
+    """
+    Extracts the lexical and structural features used by the local Triage classifier.
+
+    Returns:
+        dict of raw features (lexical_density, avg_sentence_length, figurative_rate,
+        line_irregularity, vocabulary_richness, word_count, line_count, median_line_length)
+    """
+    words = re.findall(r"[A-Za-z']+", text.lower())
+    word_count = len(words)
+    if word_count == 0:
+        return None
+
+    content_words = [w for w in words if w not in _FUNCTION_WORDS]
+    sentences = [s for s in re.split(r"[.!?;]+", text) if re.search(r"[A-Za-z]", s)]
+    sentence_lengths = [len(re.findall(r"[A-Za-z']+", s)) for s in sentences] or [word_count]
+
+    # Structural irregularity: variation in line length plus lines that run on without punctuation
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    line_irregularity = 0.0
+    if len(lines) >= 3:
+        lengths = [len(line) for line in lines]
+        mean_length = sum(lengths) / len(lengths)
+        variance = sum((length - mean_length) ** 2 for length in lengths) / len(lengths)
+        coefficient_of_variation = math.sqrt(variance) / mean_length if mean_length else 0.0
+        run_on_ratio = sum(1 for line in lines if line[-1].isalpha()) / len(lines)
+        line_irregularity = coefficient_of_variation + 0.5 * run_on_ratio
+
+    return {
+        "lexical_density": len(content_words) / word_count,
+        "avg_sentence_length": sum(sentence_lengths) / len(sentence_lengths),
+        "figurative_rate": 100 * len(_FIGURATIVE_MARKERS.findall(text)) / word_count,
+        "line_irregularity": line_irregularity,
+        "vocabulary_richness": len(set(words)) / math.sqrt(word_count),  # Guiraud's index
+        "word_count": word_count,
+        "line_count": len(lines),
+        "median_line_length": sorted(len(line) for line in lines)[len(lines) // 2] if lines else 0,
+    }
+
+def score_triage_features(features: dict):
+    """Combines triage features into a complexity score between 0 (Simple) and 1 (Complex)."""
+    def clamp(value):
+        return max(0.0, min(1.0, value))
+
+    return (
+        0.25 * clamp((features["lexical_density"] - 0.45) / 0.20)
+        + 0.20 * clamp((features["avg_sentence_length"] - 12) / 18)
+        + 0.20 * clamp(features["figurative_rate"] / 3)
+        + 0.15 * clamp(features["line_irregularity"] / 1.0)
+        + 0.20 * clamp((features["vocabulary_richness"] - 5) / 5)
+    )
+
+def local_text_triage(text: str):
+    """
+    Classifies a text work locally as 'Simple' or 'Complex' when the heuristics are confident.
+    Short texts (under LOCAL_TRIAGE_MIN_WORDS) and verse-shaped texts are never rated Simple locally:
+    their length-dependent features understate the complexity of short, dense poems.
+
+    Returns:
+        (classification, score, features): classification is None when the case is uncertain
+        and should be escalated to the Triage Analyst.
+    """
+    features = extract_triage_features(text or "")
+    if not features:
+        return None, None, None
+
+    score = score_triage_features(features)
+    is_verse = (
+        features["line_count"] >= LOCAL_TRIAGE_VERSE_MIN_LINES
+        and features["median_line_length"] <= LOCAL_TRIAGE_VERSE_MAX_LINE_CHARS
+    )
+    if score <= LOCAL_TRIAGE_SIMPLE_THRESHOLD and features["word_count"] >= LOCAL_TRIAGE_MIN_WORDS and not is_verse:
+        return 'Simple', score, features
+    if score >= LOCAL_TRIAGE_COMPLEX_THRESHOLD:
+        return 'Complex', score, features
+    return None, score, features
+
 # -----------------------------------------------------------------------------
 # STAGE 1: TRIAGE ANALYST
 # -----------------------------------------------------------------------------
@@ -1236,7 +1797,15 @@ async def execute_triage_analyst(client, work_input: WorkInput, status_container
     Output: 'Simple' or 'Complex'.
     """
     status_container.write("Phase 1: Triage Analysis (Assessing Complexity)...")
-    
+
+    # v10.6: Decide clear-cut text works locally, skipping the API round trip (opt-in, see local_text_triage)
+    local_features = None
+    if work_input.modality == M_TEXT and st.session_state.get("local_triage", False):
+        local_classification, local_score, local_features = local_text_triage(work_input.data)
+        if local_classification:
+            status_container.write(f"Triage complete (local heuristics). Complexity: {local_classification}. (Score: {local_score:.2f})")
+            return local_classification
+
     content_input = []
 
     # 1. Prepare Input (Upload if necessary - handled asynchronously)
@@ -1307,6 +1876,9 @@ async def execute_triage_analyst(client, work_input: WorkInput, status_container
 
         if classification in ['Simple', 'Complex']:
             status_container.write(f"Triage complete. Complexity: {classification}. (Justification: {justification})")
+            # v10.6: Log escalated decisions with their local features (calibration data for the local classifier)
+            if local_features:
+                logging.info(f"Triage calibration: {json.dumps({'classification': classification, 'score': round(score_triage_features(local_features), 3), **local_features})}")
             return classification
         else:
             # Fallback if classification is invalid
@@ -1329,12 +1901,88 @@ async def execute_triage_analyst(client, work_input: WorkInput, status_container
 # STAGE 2: ADAPTIVE THEORETICIAN
 # -----------------------------------------------------------------------------
 
+# v10.6: Incremental parser for the streamed Theoretician response
+class IncrementalTaskParser:
+    """
+    Incrementally extracts completed entries of the "analytical_tasks" array from a
+    streamed JSON response, so each task can be dispatched before the response finishes.
+    The full response is still parsed normally once the stream ends.
+    """
+    def __init__(self, key="analytical_tasks"):
+        self.buffer = ""
+        self.key = f'"{key}"'
+        self.position = None  # Index just past the array's opening '[' once found
+        self.finished = False
+        self.tasks = []
+
+    def feed(self, text: str):
+        """Appends a chunk of streamed text. Returns the list of newly completed tasks."""
+        self.buffer += text
+        new_tasks = []
+        if self.finished:
+            return new_tasks
+
+        if self.position is None:
+            key_index = self.buffer.find(self.key)
+            if key_index == -1:
+                return new_tasks
+            bracket_index = self.buffer.find("[", key_index + len(self.key))
+            if bracket_index == -1:
+                return new_tasks
+            self.position = bracket_index + 1
+
+        while True:
+            i = self.position
+            while i < len(self.buffer) and self.buffer[i] in " \t\r\n,":
+                i += 1
+            self.position = i
+            if i >= len(self.buffer):
+                break
+            if self.buffer[i] == "]":
+                self.finished = True
+                break
+            if self.buffer[i] != '"':
+                # Unexpected content; leave the rest to the final full parse
+                self.finished = True
+                break
+
+            end_index = self._find_string_end(i)
+            if end_index is None:
+                break  # String still streaming in
+            try:
+                task = json.loads(self.buffer[i:end_index + 1])
+            except json.JSONDecodeError:
+                task = None
+            if not isinstance(task, str):
+                # Malformed entry; never dispatch it, leave the plan to the final validation
+                self.finished = True
+                break
+            self.tasks.append(task)
+            new_tasks.append(task)
+            self.position = end_index + 1
+
+        return new_tasks
+
+    def _find_string_end(self, start: int):
+        """Returns the index of the closing quote of the JSON string starting at `start`, or None."""
+        i = start + 1
+        while i < len(self.buffer):
+            char = self.buffer[i]
+            if char == "\\":
+                i += 2
+                continue
+            if char == '"':
+                return i
+            i += 1
+        return None
+
 @retry_with_backoff(max_retries=3, base_delay=2)
-async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_config: dict, status_container, cached_content_name=None, model=MODEL_FLASH):
+async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_config: dict, status_container, cached_content_name=None, model=MODEL_FLASH, on_task=None):
     # v10.1: Migrated to google-genai SDK - now accepts client instead of model
     # v10.2: Added cached_content_name parameter for context caching optimization
     # v10.2: Now returns framework_name for proper display labeling
     # v10.2: Added retry logic with exponential backoff
+    # v10.6: Added on_task callback for streamed, pipelined task dispatch
     """
     Dynamically generates a custom list of analytical concepts/tasks for the work
     within the chosen framework. Also determines the optimal persona strategy.
@@ -1342,6 +1990,8 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
 
     Args:
         cached_content_name: Optional cache name to use for cached context (file + system instructions)
+        on_task: Optional callback(index, task). If provided, the response is streamed and the
+                 callback fires as soon as each analytical task is complete in the stream.
     """
     status_container.write("Phase 2: Adaptive Theoretician (Generating Strategy)...")
 
@@ -1459,7 +2109,7 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
             if not selected_function or not lens_name:
                 return ""
 
-            from lenses import LENSES_FUNCTIONAL
+            from lens_catalog import LENSES_FUNCTIONAL
 
             # Find which functional tier(s) contain this lens
             lens_functions = []
@@ -1495,7 +2145,7 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
             if not selected_discipline or not lens_name:
                 return ""
 
-            from lenses import LENSES_HIERARCHY
+            from lens_catalog import LENSES_HIERARCHY
 
             # Find which discipline(s) contain this lens
             lens_disciplines = []
@@ -1544,7 +2194,7 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
             if not selected_era or not lens_name:
                 return ""
 
-            from lenses import LENS_DEFINITIONS
+            from lens_catalog import LENS_DEFINITIONS
 
             lens_data = LENS_DEFINITIONS.get(lens_name)
             if not lens_data:
@@ -1571,7 +2221,7 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
             if not selected_geography or not lens_name:
                 return ""
 
-            from lenses import LENSES_GEOGRAPHIC
+            from lens_catalog import LENSES_GEOGRAPHIC
 
             # Find which geographic region(s) contain this lens
             lens_geographies = []
@@ -1617,7 +2267,7 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
             era_instruction = get_era_weighting_instruction(lens_keyword, era_context)
             geographic_instruction = get_geographic_weighting_instruction(lens_keyword, geographic_context)
 
-            if user_persona == "(No Persona)" or lens_keyword not in PERSONA_POOL:
+            if user_persona == "(No Persona)" or lens_keyword not in lens_catalog.PERSONA_POOL:
                 persona_strategy_instruction = f"""
                 **Persona Strategy (Generic Title):**
                 {"The user has requested NO specific historical figure." if user_persona == "(No Persona)" else "This framework has no associated persona pool."}
@@ -1628,7 +2278,7 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
                 """
             else:
                 # AI has discretion to pick from the pool (pool exists at this point)
-                pool = PERSONA_POOL[lens_keyword]
+                pool = lens_catalog.PERSONA_POOL[lens_keyword]
                 pool_instruction = f"- **Available Pool (REQUIRED):** {', '.join(pool)}\n            - You MUST select one persona from this pool for the final analysis."
 
                 persona_strategy_instruction = f"""
@@ -1643,7 +2293,7 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
             # CASE 3: Persona only (no specific lens)
             # v10.4: Respect narrow vs broad scope_mode
             # v10.5: Enable smart-selection of unset filter dimensions in narrow mode
-            from lenses import PERSONA_METADATA
+            from lens_catalog import PERSONA_METADATA
             persona_meta = PERSONA_METADATA.get(user_persona, {})
             persona_lenses = persona_meta.get('lenses', [])
             lenses_str = ", ".join(persona_lenses) if persona_lenses else "their associated philosophical frameworks"
@@ -1791,24 +2441,64 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
         if cached_content_name:
             config_dict["cached_content"] = cached_content_name
 
-        response = await client.aio.models.generate_content(
-            model=model,  # Model selection based on analysis mode (matches cache model)
-            contents=content_input,
-            config=types.GenerateContentConfig(**config_dict)
-        )
+        if on_task:
+            # v10.6: Stream the strategy and dispatch each task as soon as it is complete
+            parser = IncrementalTaskParser()
+            full_text = ""
+            chunk = None
+            async for chunk in await client.aio.models.generate_content_stream(
+                model=model,  # Model selection based on analysis mode (matches cache model)
+                contents=content_input,
+                config=types.GenerateContentConfig(**config_dict)
+            ):
+                if chunk.text:
+                    full_text += chunk.text
+                    for task in parser.feed(chunk.text):
+                        on_task(len(parser.tasks) - 1, task)
 
-        # v10.2: Accumulate metadata
-        accumulate_metadata(work_input, response)
+            # Accumulate metadata from final chunk
+            if chunk is not None and hasattr(chunk, 'usage_metadata'):
+                # Create a pseudo-response object for metadata accumulation
+                class StreamResponse:
+                    def __init__(self, usage_metadata, text):
+                        self.usage_metadata = usage_metadata
+                        self.text = text
+                accumulate_metadata(work_input, StreamResponse(chunk.usage_metadata, full_text))
 
-        # Access validated parsed response
-        if not response.parsed:
-            status_container.write("Failed to parse Theoretician response.")
-            logging.error(f"Empty parsed response: {response.text}")
-            return None, None
+            # Validate against the same schema the non-streamed call enforces through response_schema
+            # (tasks already dispatched are cancelled by the pipeline if the plan is rejected)
+            try:
+                result = AdaptiveTheoryResponse.model_validate_json(full_text)
+            except ValidationError as e:
+                status_container.write("Failed to parse Theoretician response.")
+                logging.error(f"Invalid streamed Theoretician response ({e}): {full_text}")
+                return None, None, None
 
-        result = response.parsed
-        tasks = result.analytical_tasks
-        persona_instruction = result.persona_instruction
+            tasks = result.analytical_tasks
+            persona_instruction = result.persona_instruction
+
+            # Dispatch any tasks the incremental parser could not extract from the stream
+            for index in range(len(parser.tasks), len(tasks)):
+                on_task(index, tasks[index])
+        else:
+            response = await client.aio.models.generate_content(
+                model=model,  # Model selection based on analysis mode (matches cache model)
+                contents=content_input,
+                config=types.GenerateContentConfig(**config_dict)
+            )
+
+            # v10.2: Accumulate metadata
+            accumulate_metadata(work_input, response)
+
+            # Access validated parsed response
+            if not response.parsed:
+                status_container.write("Failed to parse Theoretician response.")
+                logging.error(f"Empty parsed response: {response.text}")
+                return None, None, None
+
+            result = response.parsed
+            tasks = result.analytical_tasks
+            persona_instruction = result.persona_instruction
 
         if tasks and persona_instruction:
             status_container.write(f"Theoretician complete. Generated {len(tasks)} analytical tasks.")
@@ -1816,7 +2506,7 @@ async def execute_adaptive_theoretician(client, work_input: WorkInput, lens_conf
             return tasks, persona_instruction, framework_name
         else:
             status_container.write("Theoretician failed to generate tasks or persona instruction.")
-            logging.error(f"Empty tasks or persona: {result}")
+            logging.error(f"Empty tasks or persona: tasks={tasks}, persona={persona_instruction}")
             return None, None, None
 
     except Exception as e:
@@ -1927,6 +2617,182 @@ async def execute_specialist(client, work_input: WorkInput, task_description: st
         # Return an error message so the synthesizer knows this part failed, but can continue.
         return f"[Error during specialist analysis for this concept: {e}]"
 
+# -----------------------------------------------------------------------------
+# STAGE 3: REQUEST HEDGING (v10.6)
+# -----------------------------------------------------------------------------
+
+# Running specialist latencies per model (process-wide, shared across sessions)
+_SPECIALIST_LATENCIES = {}
+
+def record_specialist_latency(model: str, seconds: float):
+    """
+    Records a specialist call's latency in the running history for its model.
+    A straggler cancelled by its hedge is recorded with its elapsed time at cancellation (a censored
+    sample: the true latency is at least this long), so the p90 threshold does not drift down.
+    """
+    history = _SPECIALIST_LATENCIES.setdefault(model, collections.deque(maxlen=HEDGE_HISTORY_SIZE))
+    history.append(seconds)
+
+def get_hedge_threshold(model: str):
+    """
+    Returns the running p90 specialist latency (seconds) for a model, or None
+    if there are not yet enough samples to hedge reliably.
+    """
+    history = _SPECIALIST_LATENCIES.get(model)
+    if not history or len(history) < HEDGE_MIN_SAMPLES:
+        return None
+    ordered = sorted(history)
+    index = min(len(ordered) - 1, int(len(ordered) * HEDGE_LATENCY_PERCENTILE))
+    return ordered[index]
+
+class HedgeBudget:
+    """Caps the number of duplicate requests a single swarm may issue."""
+    def __init__(self, total_tasks: int):
+        self.max_hedges = max(1, int(total_tasks * HEDGE_MAX_FRACTION))
+        self.hedges_issued = 0
+
+    def try_acquire(self):
+        if self.hedges_issued >= self.max_hedges:
+            return False
+        self.hedges_issued += 1
+        return True
+
+async def execute_specialist_hedged(client, work_input: WorkInput, task_description: str, status_container, cached_content_name=None, model=MODEL_FLASH, hedge_budget=None):
+    """
+    Runs execute_specialist with request hedging.
+    If the call exceeds the running p90 latency for its model, a duplicate request is issued
+    (subject to hedge_budget). The first successful result is used and the other request is
+    cancelled; an error report is returned only if both requests fail.
+
+    Args:
+        hedge_budget: Optional HedgeBudget shared by the swarm. If None, hedging is disabled.
+    """
+    ensure_metadata(work_input)
+    metadata = work_input.metadata
+    metadata["specialist_calls"] = metadata.get("specialist_calls", 0) + 1
+
+    start_time = time.monotonic()
+    primary = asyncio.ensure_future(
+        execute_specialist(client, work_input, task_description, status_container, cached_content_name, model)
+    )
+
+    threshold = get_hedge_threshold(model) if hedge_budget else None
+    if threshold is None:
+        result = await primary
+        if not result.startswith("[Error"):
+            record_specialist_latency(model, time.monotonic() - start_time)
+        return result
+
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+    except asyncio.CancelledError:
+        # asyncio.wait does not cancel its inputs (e.g., when a swarm quorum drops this task)
+        primary.cancel()
+        raise
+    if done or not hedge_budget.try_acquire():
+        result = await primary
+        if not result.startswith("[Error"):
+            record_specialist_latency(model, time.monotonic() - start_time)
+        return result
+
+    # Straggler detected: issue a duplicate request
+    metadata["hedge_requests"] = metadata.get("hedge_requests", 0) + 1
+    logging.info(f"Hedging specialist after {threshold:.1f}s (p90) for task '{task_description[:50]}...'")
+    hedge_start = time.monotonic()
+    hedge = asyncio.ensure_future(
+        execute_specialist(client, work_input, task_description, status_container, cached_content_name, model)
+    )
+
+    started_at = {primary: start_time, hedge: hedge_start}
+    pending = {primary, hedge}
+    winner = None
+    result = None
+    try:
+        # A request that fails (e.g., a 429 caused by the extra load) does not win the race
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    task_result = task.result()
+                except Exception as e:
+                    task_result = f"[Error during specialist analysis for this concept: {e}]"
+                if winner is None and not task_result.startswith("[Error"):
+                    winner, result = task, task_result
+                elif result is None:
+                    result = task_result  # Returned only if the other request fails too
+    except asyncio.CancelledError:
+        primary.cancel()
+        hedge.cancel()
+        raise
+
+    finished_at = time.monotonic()
+    for task in pending:
+        task.cancel()
+        # Censored sample for the cancelled straggler (see record_specialist_latency)
+        record_specialist_latency(model, finished_at - started_at[task])
+
+    if winner is not None:
+        if winner is hedge:
+            metadata["hedge_wins"] = metadata.get("hedge_wins", 0) + 1
+            if primary in pending:
+                # Measured lower bound on the savings: the primary had already run this long when it was
+                # cancelled (its true latency is longer), and the hedge delivered in the time it took
+                primary_elapsed = finished_at - start_time
+                hedge_elapsed = finished_at - hedge_start
+                metadata["hedge_time_saved"] = metadata.get("hedge_time_saved", 0.0) + max(0.0, primary_elapsed - hedge_elapsed)
+        record_specialist_latency(model, finished_at - started_at[winner])
+
+    return result
+
+# -----------------------------------------------------------------------------
+# STAGE 3: SWARM QUORUM (v10.6)
+# -----------------------------------------------------------------------------
+
+def get_swarm_quorum(analysis_mode: str):
+    """Returns the specialist quorum fraction (0-1] configured for the given analysis mode."""
+    quorum_settings = st.session_state.get("swarm_quorum", {})
+    return quorum_settings.get(analysis_mode, SWARM_QUORUM_BY_MODE.get(analysis_mode, 1.0))
+
+async def gather_with_quorum(coroutines: list, quorum_fraction: float, grace_seconds=SWARM_QUORUM_GRACE_SECONDS):
+    """
+    Runs coroutines concurrently and returns once a quorum of them has completed.
+    Once the quorum is reached, the remaining coroutines get a grace window; any still
+    running after it are cancelled.
+
+    Returns:
+        (results, excluded_indices): results is aligned with the input order, with None
+        for each excluded (cancelled) entry.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coroutines]
+    if not tasks:
+        return [], []
+
+    quorum = min(len(tasks), max(1, math.ceil(len(tasks) * quorum_fraction)))
+    pending = set(tasks)
+
+    try:
+        while len(tasks) - len(pending) < quorum:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        if pending and grace_seconds > 0:
+            _, pending = await asyncio.wait(pending, timeout=grace_seconds)
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    for task in pending:
+        task.cancel()
+
+    results = []
+    excluded_indices = []
+    for i, task in enumerate(tasks):
+        if task in pending:
+            results.append(None)
+            excluded_indices.append(i)
+        else:
+            results.append(task.result())
+    return results, excluded_indices
+
 # -----------------------------------------------------------------------------
 # STAGE 4A: MID SYNTHESIZER (Deep Dive Only)
 # -----------------------------------------------------------------------------
@@ -2152,7 +3018,7 @@ async def execute_master_synthesizer(client, work_input: WorkInput, lens_config:
 
 # v10.0: REWRITTEN (The main asynchronous pipeline)
 # v10.2: Added cache support for multi-lens optimization
-async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enforced_complexity=None, use_cache=False, strategy_container=None, stream_container=None):
+async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enforced_complexity=None, use_cache=False, strategy_container=None, stream_container=None, cache_task=None):
     """
     The main engine pipeline (v10.0: Generative & Adaptive).
     Manages Triage, Theoretician, Swarm, and Synthesizer stages.
@@ -2164,6 +3030,8 @@ async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enfo
         use_cache: If True, will use cached content (work_input must have cache_ref set)
         strategy_container: Optional container for displaying strategy during execution
         stream_container: Optional container for streaming synthesis output
+        cache_task: Optional asyncio task creating the context cache concurrently. Triage and the
+            Theoretician run uncached; only the specialists wait for it (see await_context_cache).
     """
     api_key = st.session_state.get("api_key")
     if not api_key:
@@ -2193,7 +3061,12 @@ async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enfo
     status_text += f" [{analysis_mode}]"
 
     status_container = st.status(status_text, expanded=False)
-    
+
+    # v10.6: Specialists are dispatched while the Theoretician is still streaming, and a speculative
+    # Theoretician may run alongside Triage; both are cancelled on every exit path (see finally below).
+    swarm_futures = []
+    speculative_task = None
+
     with status_container as status:
         try:
             # v10.1: Initialize API Client
@@ -2208,6 +3081,27 @@ async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enfo
             # v10.2: Extract cache name if using cached content
             cache_name = work_input.cache_ref.name if (use_cache and work_input.cache_ref) else None
 
+            # v10.6: Specialist dispatch for the pipelined Stage 2 -> Stage 3 (see Theoretician below).
+            # v10.3: Deep Dive now uses Flash-Lite specialists for cost efficiency
+            specialist_model = MODEL_FLASH
+            hedging_enabled = st.session_state.get("hedge_specialists", True)
+
+            async def run_specialist(task, hedge_budget):
+                # v10.6: Specialists wait for a cache still being created (uncached if it fails)
+                specialist_cache_name = cache_name
+                if cache_task is not None:
+                    specialist_cache_name = await await_context_cache(cache_task)
+                return await execute_specialist_hedged(client, work_input, task, status, specialist_cache_name, specialist_model, hedge_budget)
+
+            def make_specialist_dispatcher(futures, expected_task_count):
+                # v10.6: Hedge straggling specialists (budget shared across this swarm)
+                hedge_budget = HedgeBudget(expected_task_count) if hedging_enabled else None
+                def dispatch_specialist(index, task):
+                    futures.append(asyncio.ensure_future(run_specialist(task, hedge_budget)))
+                return dispatch_specialist
+
+            theoretician_result = None
+
             # --- STAGE 1: TRIAGE ANALYST (Adaptive Mode Only) ---
             # v10.0.6: Support enforced complexity for comparative rigor
             if enforced_complexity:
@@ -2220,8 +3114,45 @@ async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enfo
                         status.update(label="Analysis failed due to upload error (pre-load).", state="error")
                         return None
             elif analysis_mode == MODE_ADAPTIVE:
-                # Standard Adaptive mode: Run triage
-                complexity = await execute_triage_analyst(client, work_input, status)
+                # v10.6: Speculative execution - start the cheap Flash Theoretician alongside Triage.
+                # Only when the work needs no upload, so the two calls never race to upload the same file.
+                speculate = (
+                    st.session_state.get("speculative_theoretician", True)
+                    and (work_input.modality == M_TEXT or work_input.gemini_file_ref is not None)
+                )
+
+                if speculate:
+                    status.write("Speculatively starting the Flash-Lite Theoretician during Triage...")
+                    # Tasks streamed before Triage confirms are held back, so a discarded
+                    # speculation costs only the one Flash-Lite call.
+                    held_tasks = []
+                    speculative_dispatch = {"dispatch": None}
+                    def hold_or_dispatch(index, task):
+                        if speculative_dispatch["dispatch"]:
+                            speculative_dispatch["dispatch"](index, task)
+                        else:
+                            held_tasks.append((index, task))
+
+                    speculative_task = asyncio.ensure_future(execute_adaptive_theoretician(
+                        client, work_input, lens_config, status, cache_name, MODEL_FLASH, on_task=hold_or_dispatch
+                    ))
+                    complexity = await execute_triage_analyst(client, work_input, status)
+
+                    if complexity == 'Simple':
+                        status.write("Triage confirmed 'Simple'. Using the speculative Flash-Lite strategy.")
+                        dispatch = make_specialist_dispatcher(swarm_futures, 6)
+                        for index, task in held_tasks:
+                            dispatch(index, task)
+                        speculative_dispatch["dispatch"] = dispatch
+                        theoretician_result = await speculative_task
+                    else:
+                        speculative_task.cancel()
+                        if complexity is not None:
+                            status.write("Triage returned 'Complex'. Discarding the speculative strategy.")
+                else:
+                    # Standard Adaptive mode: Run triage
+                    complexity = await execute_triage_analyst(client, work_input, status)
+
                 if complexity is None:
                      # This typically means the upload failed within Triage.
                      status.update(label="Analysis failed during Triage (likely upload error).", state="error")
@@ -2237,15 +3168,23 @@ async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enfo
 
 
             # --- STAGE 2: ADAPTIVE THEORETICIAN ---
-            # Determine model selection based on mode (must match cache model)
-            if deep_dive_mode or (analysis_mode == MODE_ADAPTIVE and complexity == 'Complex'):
-                status.write("Theoretician using Gemini Pro.")
-                theoretician_model = MODEL_PRO
-            else: # Adaptive (Simple) or Surface Scrape
-                status.write("Theoretician using Gemini Flash-Lite.")
-                theoretician_model = MODEL_FLASH
+            # v10.6: Pipelined Stage 2 -> Stage 3. The Theoretician's response is streamed and each
+            # analytical task is dispatched to a specialist as soon as it is complete.
+            if theoretician_result is None:
+                # Determine model selection based on mode (must match cache model)
+                if deep_dive_mode or (analysis_mode == MODE_ADAPTIVE and complexity == 'Complex'):
+                    status.write("Theoretician using Gemini Pro.")
+                    theoretician_model = MODEL_PRO
+                else: # Adaptive (Simple) or Surface Scrape
+                    status.write("Theoretician using Gemini Flash-Lite.")
+                    theoretician_model = MODEL_FLASH
+
+                theoretician_result = await execute_adaptive_theoretician(
+                    client, work_input, lens_config, status, cache_name, theoretician_model,
+                    on_task=make_specialist_dispatcher(swarm_futures, 10 if theoretician_model == MODEL_PRO else 6)
+                )
 
-            analytical_tasks, persona_instruction, framework_name = await execute_adaptive_theoretician(client, work_input, lens_config, status, cache_name, theoretician_model)
+            analytical_tasks, persona_instruction, framework_name = theoretician_result
 
             if not analytical_tasks or not persona_instruction:
                 status.update(label="Analysis failed during Theoretician stage.", state="error")
@@ -2273,18 +3212,22 @@ async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enfo
             status.write("Phase 3: Specialist Swarm (Executing Parallel Tasks)...")
 
             # Determine model selection message and model based on mode
-            # v10.3: Deep Dive now uses Flash-Lite specialists for cost efficiency
             status.write("Swarm using Gemini Flash-Lite.")
-            specialist_model = MODEL_FLASH
-
-            # Create async tasks for the swarm with appropriate model
-            swarm_tasks = [
-                execute_specialist(client, work_input, task, status, cache_name, specialist_model)
-                for task in analytical_tasks
-            ]
-            
-            # Execute concurrently
-            specialist_reports = await asyncio.gather(*swarm_tasks)
+            status.write(f"{len(swarm_futures)} specialists dispatched (pipelined with strategy generation).")
+
+            # Execute concurrently (specialists are already running)
+            # v10.6: Synthesis may start once the mode's quorum of specialists has reported
+            specialist_reports, excluded_indices = await gather_with_quorum(swarm_futures, get_swarm_quorum(analysis_mode))
+            strategy_data["excluded_tasks"] = [analytical_tasks[i] for i in excluded_indices]
+
+            if excluded_indices:
+                specialist_reports = [report for report in specialist_reports if report is not None]
+                status.write(f"Quorum reached: {len(specialist_reports)}/{len(analytical_tasks)} specialists reported. {len(excluded_indices)} late report(s) excluded.")
+                if strategy_container:
+                    with strategy_container:
+                        st.caption(f"⏱️ {strategy_data['framework_name']}: excluded late task(s) " + "; ".join(
+                            f"#{i + 1}" for i in excluded_indices
+                        ))
             status.write("Swarm execution complete.")
 
             # --- STAGE 4: SYNTHESIS ---
@@ -2311,6 +3254,13 @@ async def async_generate_analysis(lens_config: dict, work_input: WorkInput, enfo
             logging.error(f"Pipeline error: {e}", exc_info=True)
             status.update(label="Analysis pipeline failed.", state="error")
             return None, None
+        finally:
+            # Stop work still in flight after a failure, an early return or cancellation
+            # (no-op for tasks that already finished)
+            if speculative_task is not None:
+                speculative_task.cancel()
+            for future in swarm_futures:
+                future.cancel()
 
 # v10.0: REWRITTEN (Synchronous wrapper for the async pipeline)
 def generate_analysis(lens_config: dict, work_input: WorkInput):
@@ -2336,10 +3286,13 @@ def generate_analysis(lens_config: dict, work_input: WorkInput):
 
 # v10.0: Updated Refinement Loop (Maintains functionality, ensures Pro model usage)
 @retry_with_backoff(max_retries=3, base_delay=2)
-def generate_refined_analysis(work_input: WorkInput, previous_analysis: str, refinement_instruction: str):
+def generate_refined_analysis(work_input: WorkInput, previous_analysis: str, refinement_instruction: str, stream_container=None):
     """
     Refines a previous analysis based on user feedback.
     Refinement always uses the Pro model.
+
+    Args:
+        stream_container: v10.6: Optional Streamlit container; the revised analysis streams into it as it is generated.
     """
     # v10.0: Internal Model Management
     api_key = st.session_state.get("api_key")
@@ -2347,9 +3300,9 @@ def generate_refined_analysis(work_input: WorkInput, previous_analysis: str, ref
         st.error("API Key missing for refinement.")
         return None
 
-    # Refinement always uses the Pro model.
-    model = get_model(api_key, MODEL_PRO, json_mode=False)
-    if not model:
+    # Refinement always uses the Pro model (selected per call, see stream_generate_content).
+    client = get_client(api_key)
+    if not client:
         return None
     
     if not refinement_instruction or not previous_analysis:
@@ -2413,14 +3366,13 @@ def generate_refined_analysis(work_input: WorkInput, previous_analysis: str, ref
             # --- Step 2: Execute Refinement ---
             status.write("Phase 2: Generating revised analysis...")
 
-            # Execute the Refiner API call
-            response_refiner = model.generate_content(content_input_refiner, request_options={"timeout": 900})
-
-            # v10.2: Accumulate metadata for Refinement
-            accumulate_metadata(work_input, response_refiner)
+            # v10.6: Execute the Refiner API call as a stream (metadata is accumulated from the final chunk)
+            refined_text = run_async_tasks([
+                stream_generate_content(client, content_input_refiner, [work_input], stream_container)
+            ])[0]
 
             status.update(label="Refinement complete!", state="complete")
-            return response_refiner.text
+            return refined_text
 
         except Exception as e:
             st.error(f"An error occurred during refinement: {e}")
@@ -2438,20 +3390,23 @@ def generate_refined_analysis(work_input: WorkInput, previous_analysis: str, ref
 
 # v10.2: Refinement function for comparative synthesis
 @retry_with_backoff(max_retries=3, base_delay=2)
-def generate_refined_comparative_synthesis(work_a: WorkInput, work_b: WorkInput, previous_synthesis: str, refinement_instruction: str):
+def generate_refined_comparative_synthesis(work_a: WorkInput, work_b: WorkInput, previous_synthesis: str, refinement_instruction: str, stream_container=None):
     """
     Refines a previous comparative synthesis based on user feedback.
     Refinement always uses the Pro model.
-    """
+
+    Args:
+        stream_container: v10.6: Optional Streamlit container; the revised synthesis streams into it as it is generated.
+    """
     # v10.2: Internal Model Management
     api_key = st.session_state.get("api_key")
     if not api_key:
         st.error("API Key missing for refinement.")
         return None
 
-    # Refinement always uses the Pro model.
-    model = get_model(api_key, MODEL_PRO, json_mode=False)
-    if not model:
+    # Refinement always uses the Pro model (selected per call, see stream_generate_content).
+    client = get_client(api_key)
+    if not client:
         return None
 
     if not refinement_instruction or not previous_synthesis:
@@ -2529,15 +3484,13 @@ def generate_refined_comparative_synthesis(work_a: WorkInput, work_b: WorkInput,
             # --- Step 2: Execute Refinement ---
             status.write("Phase 2: Generating revised comparative synthesis...")
 
-            # Execute the Refiner API call
-            response_refiner = model.generate_content(content_input_refiner, request_options={"timeout": 900})
-
-            # v10.2: Accumulate metadata for Comparative Refinement (to both works)
-            accumulate_metadata(work_a, response_refiner)
-            accumulate_metadata(work_b, response_refiner)
+            # v10.6: Execute the Refiner API call as a stream (metadata is accumulated to both works)
+            refined_text = run_async_tasks([
+                stream_generate_content(client, content_input_refiner, [work_a, work_b], stream_container)
+            ])[0]
 
             status.update(label="Refinement complete!", state="complete")
-            return response_refiner.text
+            return refined_text
 
         except Exception as e:
             st.error(f"An error occurred during refinement: {e}")
@@ -2561,7 +3514,8 @@ def run_analysis_pipeline(
     smart_select_count: int,
     page_key_prefix: str,
     stream_container=None,
-    strategy_container=None
+    strategy_container=None,
+    results_container=None
 ):
     """
     A centralized function to run the entire analysis pipeline for any page.
@@ -2574,6 +3528,8 @@ def run_analysis_pipeline(
         page_key_prefix: A unique prefix for session state keys (e.g., 'single', 'dialectic').
         stream_container: Optional Streamlit container for streaming synthesis output.
         strategy_container: Optional Streamlit container for displaying strategies during execution.
+        results_container: Optional Streamlit container where each perspective's analysis is shown
+            as soon as it completes (one slot per perspective, in selection order).
 
     Returns:
         A tuple of (synthesis_result, raw_analyses, strategies) or (None, None, None) on failure.
@@ -2588,75 +3544,53 @@ def run_analysis_pipeline(
         st.warning("Please provide the creative work to be analyzed.")
         return None, None, None
 
-    final_execution_configs = []
-
     # --- 2. Determine Execution Configs (Smart vs. Manual) ---
-    if not manual_configs and smart_select_count > 0:
-        # Smart Selection: Call analyst_in_chief to select lenses
-        client = get_client(api_key)
+    # v10.6: Smart Selection runs in the analysis event loop (see run_swarm), overlapped with
+    # context cache creation instead of blocking the script before any preparation starts.
+    smart_selection = not manual_configs and smart_select_count > 0
+    client = get_client(api_key)
+    if smart_selection:
         if not client:
             st.error("Could not initialize API client for smart selection.")
             return None, None, None
-
-        with st.status("Running Smart Selection...", expanded=True) as smart_status:
-            selected_lenses = analyst_in_chief(client, work_input, smart_select_count, smart_status)
-            if not selected_lenses:
-                st.error("Smart Selection failed. Please try manual selection.")
-                return None, None, None
-
-            # Convert lens names to config dicts
-            final_execution_configs = [
-                {'lens': lens_name, 'persona': None, 'is_zeitgeist': False}
-                for lens_name in selected_lenses
-            ]
+        final_execution_configs = [] # Filled in by run_swarm from analyst_in_chief's selection
+        num_tasks = smart_select_count
     else:
         # Manual selection: use provided configs
         final_execution_configs = manual_configs
-
-    if not final_execution_configs or len(final_execution_configs) < smart_select_count:
-        st.warning(f"Configuration is incomplete. Please select at least {smart_select_count} perspective(s).")
-        return None, None, None
+        if not final_execution_configs or len(final_execution_configs) < smart_select_count:
+            st.warning(f"Configuration is incomplete. Please select at least {smart_select_count} perspective(s).")
+            return None, None, None
+        num_tasks = len(final_execution_configs)
 
     # --- 3. Context Caching Setup (for multi-lens optimization) ---
     # v10.2: Create context cache for media files when running multiple analyses
-    use_cache = False
-    num_tasks = len(final_execution_configs)
+    # v10.6: The cache is created concurrently with Smart Selection, Triage and the Theoretician
+    # (which run uncached); only the specialist swarm waits for it.
+    cache_model = None
+    cache_status = None
 
     # Check if cache needs to be invalidated due to mode change
     current_analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE)
     if invalidate_cache_if_mode_changed(work_input, current_analysis_mode, api_key):
         st.info("Cache invalidated due to analysis mode change. A new cache will be created.")
 
-    if num_tasks > 1:  # Only cache for multi-lens
+    # v10.6: Incremental recomputation - in multi-perspective runs, perspectives whose dependency
+    # fingerprint is unchanged reuse their stored analysis (see analysis_cache_key)
+    def perspective_key(config):
+        return analysis_cache_key(work_input, config, current_analysis_mode, None)
+
+    perspectives_to_compute = num_tasks
+    if num_tasks > 1 and not smart_selection:
+        perspectives_to_compute = sum(1 for config in final_execution_configs if not get_cached_analysis(work_input, perspective_key(config)))
+
+    if perspectives_to_compute > 1 and client:  # Only cache for multi-lens
         if work_input.modality in [M_IMAGE, M_AUDIO, M_VIDEO]:
-            with st.status("Preparing context cache for multi-lens analysis...", expanded=False) as cache_status:
-                try:
-                    client = get_client(api_key)
-                    if client:
-                        # Upload file first if not already uploaded
-                        if not work_input.gemini_file_ref:
-                            if not run_async_tasks([upload_to_gemini_async(work_input, cache_status)])[0]:
-                                cache_status.update(label="File upload failed", state="error")
-                            else:
-                                cache_status.write("File uploaded successfully")
-
-                        # Create cache with appropriate model based on analysis mode
-                        if work_input.gemini_file_ref:
-                            # Determine cache model based on analysis mode
-                            analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE)
-                            cache_model = MODEL_PRO if analysis_mode == MODE_DEEP_DIVE else MODEL_FLASH
-
-                            cache_result = run_async_tasks([
-                                create_context_cache_async(client, work_input, cache_model, cache_status, analysis_mode=analysis_mode)
-                            ])[0]
-                            if cache_result:
-                                use_cache = True
-                                cache_status.update(label="Context cache created successfully", state="complete")
-                            else:
-                                cache_status.update(label="Cache creation skipped (will proceed without caching)", state="complete")
-                except Exception as e:
-                    logging.warning(f"Cache setup failed: {e}. Proceeding without cache.")
-                    cache_status.update(label="Cache creation failed (proceeding without cache)", state="complete")
+            # Determine cache model based on analysis mode
+            cache_model = MODEL_PRO if current_analysis_mode == MODE_DEEP_DIVE else MODEL_FLASH
+            cache_status = st.status("Preparing context cache for multi-lens analysis...", expanded=False)
+
+    smart_status = st.status("Running Smart Selection...", expanded=True) if smart_selection else None
 
     # --- 4. Run Concurrent Analyses ---
     analysis_label = "analysis" if num_tasks == 1 else "concurrent analyses"
@@ -2664,9 +3598,82 @@ def run_analysis_pipeline(
 
     # v10.2: Pass strategy_container so strategies display during execution
     # Pass stream_container only for single-lens analysis (not multi-lens, which has separate synthesis)
-    single_lens = (len(final_execution_configs) == 1)
-    tasks = [async_generate_analysis(config, work_input, use_cache=use_cache, strategy_container=strategy_container, stream_container=stream_container if single_lens else None) for config in final_execution_configs]
-    results = run_async_tasks(tasks) # Returns list of (analysis_text, strategy_data) tuples
+    single_lens = (num_tasks == 1)
+
+    async def run_swarm():
+        cache_task = None
+        if cache_model:
+            # Upload file first if not already uploaded (every stage needs it; the cache does not block them)
+            if not work_input.gemini_file_ref:
+                if not await upload_to_gemini_async(work_input, cache_status):
+                    cache_status.update(label="File upload failed", state="error")
+                else:
+                    cache_status.write("File uploaded successfully")
+            if work_input.gemini_file_ref:
+                cache_status.update(label="Creating context cache in the background...")
+                cache_task = asyncio.ensure_future(create_context_cache_in_background(
+                    client, work_input, cache_model, cache_status, analysis_mode=current_analysis_mode
+                ))
+        try:
+            if smart_selection:
+                selected_lenses = await analyst_in_chief(client, work_input, smart_select_count, smart_status)
+                if not selected_lenses:
+                    smart_status.update(label="Smart Selection failed", state="error")
+                    return None
+                smart_status.update(label="Smart Selection complete", state="complete")
+                # Convert lens names to config dicts
+                final_execution_configs.extend(
+                    {'lens': lens_name, 'persona': None, 'is_zeitgeist': False}
+                    for lens_name in selected_lenses
+                )
+
+            # v10.6: Analyses are consumed as they complete, so finished perspectives are shown
+            # while slower ones are still running (results keep the selection order)
+            slots = [results_container.empty() for _ in final_execution_configs] if results_container is not None else []
+            for i, slot in enumerate(slots):
+                slot.caption(f"⏳ {get_perspective_label(final_execution_configs[i], i)}: analyzing...")
+
+            # Large symposia: bound the perspective pipelines in flight (each runs its own swarm)
+            analysis_slots = asyncio.Semaphore(MAX_CONCURRENT_PERSPECTIVES)
+
+            async def analyze(i, config):
+                if not single_lens:
+                    cached = get_cached_analysis(work_input, perspective_key(config))
+                    if cached:
+                        return i, cached, True
+                async with analysis_slots:
+                    result = await async_generate_analysis(config, work_input, strategy_container=strategy_container, stream_container=stream_container if single_lens else None, cache_task=cache_task)
+                if not single_lens and result and result[0]:
+                    store_cached_analysis(work_input, perspective_key(config), result)
+                return i, result, False
+
+            results = [None] * len(final_execution_configs)
+            tasks = [asyncio.ensure_future(analyze(i, config)) for i, config in enumerate(final_execution_configs)]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    i, result, reused = await next_done
+                    results[i] = result
+                    if slots:
+                        label = get_perspective_label(final_execution_configs[i], i)
+                        if result and result[0]:
+                            with slots[i].container():
+                                with st.expander(f"♻️ {label} (unchanged, reused)" if reused else f"✅ {label}"):
+                                    st.markdown(result[0])
+                        else:
+                            slots[i].warning(f"{label}: analysis failed.")
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return results
+        finally:
+            if cache_task is not None:
+                # Let creation settle so the cache is recorded on work_input (and cleaned up with it)
+                await asyncio.wait([cache_task])
+
+    results = run_async_tasks([run_swarm()])[0] # List of (analysis_text, strategy_data) tuples
+    if results is None:
+        st.error("Smart Selection failed. Please try manual selection.")
+        return None, None, None
 
     # --- 5. Process Results ---
     successful_analyses = [] # List of (config, analysis_text)
@@ -2701,7 +3708,7 @@ def run_analysis_pipeline(
         if page_key_prefix == 'dialectic':
             synthesis_result = generate_dialectical_synthesis(client, successful_analyses[0][0], successful_analyses[0][1], successful_analyses[1][0], successful_analyses[1][1], work_input.get_display_title(), work_input, stream_container)
         elif page_key_prefix == 'symposium':
-            synthesis_result = generate_symposium_synthesis(client, successful_analyses, work_input.get_display_title(), work_input, stream_container)
+            synthesis_result = generate_hierarchical_symposium_synthesis(client, successful_analyses, work_input.get_display_title(), work_input, stream_container)
         else: # Add other synthesis types here if needed
             synthesis_result = "Synthesis type not implemented for this page."
     else:
@@ -2709,12 +3716,18 @@ def run_analysis_pipeline(
             if page_key_prefix == 'dialectic':
                 synthesis_result = generate_dialectical_synthesis(client, successful_analyses[0][0], successful_analyses[0][1], successful_analyses[1][0], successful_analyses[1][1], work_input.get_display_title(), work_input)
             elif page_key_prefix == 'symposium':
-                synthesis_result = generate_symposium_synthesis(client, successful_analyses, work_input.get_display_title(), work_input)
+                synthesis_result = generate_hierarchical_symposium_synthesis(client, successful_analyses, work_input.get_display_title(), work_input)
             else: # Add other synthesis types here if needed
                 synthesis_result = "Synthesis type not implemented for this page."
 
     return synthesis_result, successful_analyses, strategies
 
+def get_perspective_label(lens_config: dict, index: int):
+    """Short display label for a perspective (lens, persona, Zeitgeist or its position)."""
+    if lens_config.get('is_zeitgeist'):
+        return f"Zeitgeist Perspective {index + 1}"
+    return lens_config.get('lens') or lens_config.get('persona') or f"Perspective {index + 1}"
+
 # v10.0.6: New helper for Comparative Rigor
 async def run_comparative_triage(client, work_a: WorkInput, work_b: WorkInput, status_container):
     # v10.1: Migrated to google-genai SDK - now accepts client instead of model
@@ -2722,18 +3735,30 @@ async def run_comparative_triage(client, work_a: WorkInput, work_b: WorkInput, s
     Runs Triage on two works concurrently and returns the highest complexity level.
     Ensures both works are analyzed with the same rigor.
     """
+    return await run_corpus_triage(client, [work_a, work_b], status_container)
+
+# v10.6: Comparative Rigor for any number of works (Corpus mode)
+async def run_corpus_triage(client, works: list, status_container):
+    """
+    Runs Triage on every work concurrently and returns the highest complexity level.
+    A work's verdict is kept on the WorkInput (triage_cache) and reused while its content is unchanged.
+    """
     status_container.write("Phase 1: Comparative Triage (Assessing Complexity for Rigor)...")
-    
-    triage_tasks = [
-        execute_triage_analyst(client, work_a, status_container),
-        execute_triage_analyst(client, work_b, status_container)
-    ]
-    
-    results = await asyncio.gather(*triage_tasks)
-    complexity_a, complexity_b = results
 
-    # If either analysis is deemed complex, the entire comparison must be run at high rigor.
-    if 'Complex' in (complexity_a, complexity_b):
+    async def triage(work):
+        ensure_reuse_caches(work)
+        fingerprint = work.content_fingerprint()
+        if work.triage_cache and work.triage_cache[0] == fingerprint:
+            return work.triage_cache[1]
+        complexity = await execute_triage_analyst(client, work, status_container)
+        if complexity:
+            work.triage_cache = (fingerprint, complexity)
+        return complexity
+
+    results = await asyncio.gather(*[triage(work) for work in works])
+
+    # If any analysis is deemed complex, the entire comparison must be run at high rigor.
+    if 'Complex' in results:
         status_container.update(label="Comparative Triage complete. Rigor level: Complex.", state="complete")
         return 'Complex'
 
@@ -2775,129 +3800,110 @@ def run_comparative_analysis_pipeline(
         st.warning("Please provide the second creative work (Work B).")
         return None, None, None, None, None
 
+    client = get_client(api_key)
+    if not client:
+        return None, None, None, None, None
+
     # --- 2. Determine Execution Config (Smart vs. Manual) ---
-    final_lens_config = None
+    # v10.6: The Comparative Strategist runs in the preparation loop below, alongside rigor triage
+    smart_status = None
     if selection_method == SELECT_SMART:
-        client = get_client(api_key)
-        if not client:
-            return None, None, None, None, None
-
-        with st.status("Executing Smart Selection...", expanded=False) as status:
-            smart_lens = comparative_strategist(client, work_a, work_b, status)
-
-        if smart_lens:
-            final_lens_config = {'lens': smart_lens, 'persona': None, 'is_zeitgeist': False}
-        else:
-            st.error("Smart Selection failed to return a valid lens.")
-            return None, None, None, None, None
+        final_lens_config = None # Chosen by comparative_strategist in run_comparative_swarm
+        smart_status = st.status("Executing Smart Selection...", expanded=False)
     else: # Manual Selection
         final_lens_config = manual_lens_config
 
-
-    # --- 3. Enforce Comparative Rigor (v10.0.6) ---
-    # In comparative mode, both analyses must run at the same complexity level
-    # to ensure a fair comparison. We triage both and take the highest complexity.
-    enforced_complexity = None
-    analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE) # Default to Adaptive
-    if analysis_mode == MODE_ADAPTIVE:
-        # Max Depth mode skips triage entirely, so we only run this for Adaptive mode.
-        client = get_client(api_key)
-        if not client:
-            return None, None, None, None, None
-
-        # This is an async function, so we need to wrap it to run it here.
-        async def get_rigor_level():
-            return await run_comparative_triage(client, work_a, work_b, st.status("Enforcing Comparative Rigor...", expanded=False))
-
-        # run_async_tasks returns a list, so we get the first element.
-        enforced_complexity = run_async_tasks([get_rigor_level()])[0]
-        if not enforced_complexity:
-            st.error("Failed to determine comparative rigor level.")
-            return None, None, None, None, None
-
-
-    # --- 4. Context Caching Setup (for comparative analysis optimization) ---
-    # v10.2: Create context caches for both media files
-    use_cache_a = False
-    use_cache_b = False
+    # --- 3. Concurrent Preparation (v10.6) ---
+    # Both works are uploaded in parallel, then their context caches are created in the background
+    # while Smart Selection and Comparative Rigor triage run; each analysis's specialists wait for
+    # its own cache (see run_analysis_pipeline). Setup time is roughly max(A, B) instead of A + B.
 
     # Check if caches need to be invalidated due to mode change
-    current_analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE)
-    invalidated_a = invalidate_cache_if_mode_changed(work_a, current_analysis_mode, api_key)
-    invalidated_b = invalidate_cache_if_mode_changed(work_b, current_analysis_mode, api_key)
+    analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE) # Default to Adaptive
+    invalidated_a = invalidate_cache_if_mode_changed(work_a, analysis_mode, api_key)
+    invalidated_b = invalidate_cache_if_mode_changed(work_b, analysis_mode, api_key)
     if invalidated_a or invalidated_b:
         st.info("Cache(s) invalidated due to analysis mode change. New caches will be created.")
 
-    # Cache for Work A
-    if work_a.modality in [M_IMAGE, M_AUDIO, M_VIDEO]:
-        with st.status("Preparing context cache for Work A...", expanded=False) as cache_status_a:
-            try:
-                client = get_client(api_key)
-                if client:
-                    # Upload file first if not already uploaded
-                    if not work_a.gemini_file_ref:
-                        if not run_async_tasks([upload_to_gemini_async(work_a, cache_status_a)])[0]:
-                            cache_status_a.update(label="File upload failed for Work A", state="error")
-                        else:
-                            cache_status_a.write("File uploaded successfully")
-
-                    # Create cache with appropriate model based on analysis mode
-                    if work_a.gemini_file_ref:
-                        # Determine cache model based on analysis mode
-                        analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE)
-                        cache_model = MODEL_PRO if analysis_mode == MODE_DEEP_DIVE else MODEL_FLASH
-
-                        cache_result = run_async_tasks([
-                            create_context_cache_async(client, work_a, cache_model, cache_status_a, analysis_mode=analysis_mode)
-                        ])[0]
-                        if cache_result:
-                            use_cache_a = True
-                            cache_status_a.update(label="Context cache created for Work A", state="complete")
-                        else:
-                            cache_status_a.update(label="Cache creation skipped for Work A", state="complete")
-            except Exception as e:
-                logging.warning(f"Cache setup failed for Work A: {e}")
-                cache_status_a.update(label="Cache creation failed for Work A (proceeding without cache)", state="complete")
-
-    # Cache for Work B
-    if work_b.modality in [M_IMAGE, M_AUDIO, M_VIDEO]:
-        with st.status("Preparing context cache for Work B...", expanded=False) as cache_status_b:
-            try:
-                client = get_client(api_key)
-                if client:
-                    # Upload file first if not already uploaded
-                    if not work_b.gemini_file_ref:
-                        if not run_async_tasks([upload_to_gemini_async(work_b, cache_status_b)])[0]:
-                            cache_status_b.update(label="File upload failed for Work B", state="error")
-                        else:
-                            cache_status_b.write("File uploaded successfully")
-
-                    # Create cache with appropriate model based on analysis mode
-                    if work_b.gemini_file_ref:
-                        # Determine cache model based on analysis mode
-                        analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE)
-                        cache_model = MODEL_PRO if analysis_mode == MODE_DEEP_DIVE else MODEL_FLASH
-
-                        cache_result = run_async_tasks([
-                            create_context_cache_async(client, work_b, cache_model, cache_status_b, analysis_mode=analysis_mode)
-                        ])[0]
-                        if cache_result:
-                            use_cache_b = True
-                            cache_status_b.update(label="Context cache created for Work B", state="complete")
-                        else:
-                            cache_status_b.update(label="Cache creation skipped for Work B", state="complete")
-            except Exception as e:
-                logging.warning(f"Cache setup failed for Work B: {e}")
-                cache_status_b.update(label="Cache creation failed for Work B (proceeding without cache)", state="complete")
+    # Determine cache model based on analysis mode
+    cache_model = MODEL_PRO if analysis_mode == MODE_DEEP_DIVE else MODEL_FLASH
+    media_works = [
+        (work, label) for work, label in [(work_a, "Work A"), (work_b, "Work B")]
+        if work.modality in [M_IMAGE, M_AUDIO, M_VIDEO]
+    ]
+    cache_statuses = {
+        label: st.status(f"Preparing context cache for {label}...", expanded=False)
+        for _, label in media_works
+    }
+    # In comparative mode, both analyses must run at the same complexity level
+    # to ensure a fair comparison. We triage both and take the highest complexity.
+    # Max Depth mode skips triage entirely, so we only run this for Adaptive mode.
+    rigor_status = st.status("Enforcing Comparative Rigor...", expanded=False) if analysis_mode == MODE_ADAPTIVE else None
 
-    # --- 5. Run Concurrent Analyses ---
     st.subheader(f"Step 1/2: Analyzing Work A and Work B concurrently...")
 
-    tasks = [
-        async_generate_analysis(final_lens_config, work_a, enforced_complexity=enforced_complexity, use_cache=use_cache_a, strategy_container=strategy_container),
-        async_generate_analysis(final_lens_config, work_b, enforced_complexity=enforced_complexity, use_cache=use_cache_b, strategy_container=strategy_container)
-    ]
-    results = run_async_tasks(tasks)
+    async def prepare_work(work, label):
+        cache_status = cache_statuses[label]
+        # Upload file first if not already uploaded
+        if not work.gemini_file_ref:
+            if not await upload_to_gemini_async(work, cache_status):
+                cache_status.update(label=f"File upload failed for {label}", state="error")
+                return None
+            cache_status.write("File uploaded successfully")
+        cache_status.update(label=f"Creating context cache for {label} in the background...", state="running")
+        return asyncio.ensure_future(create_context_cache_in_background(
+            client, work, cache_model, cache_status, analysis_mode=analysis_mode, work_label=label
+        ))
+
+    async def run_comparative_swarm():
+        # Uploads run in parallel; Smart Selection and Triage need the uploaded files, the caches do not block them
+        prepared = await asyncio.gather(*[prepare_work(work, label) for work, label in media_works])
+        cache_tasks = {label: task for (_, label), task in zip(media_works, prepared)}
+        smart_task = None
+        if smart_status is not None:
+            smart_task = asyncio.ensure_future(comparative_strategist(client, work_a, work_b, smart_status))
+        try:
+            enforced_complexity = None
+            if rigor_status is not None:
+                enforced_complexity = await run_comparative_triage(client, work_a, work_b, rigor_status)
+                if not enforced_complexity:
+                    return None, None, "Failed to determine comparative rigor level."
+
+            lens_config = final_lens_config
+            if smart_task is not None:
+                smart_lens = await smart_task
+                if not smart_lens:
+                    smart_status.update(label="Smart Selection failed", state="error")
+                    return None, None, "Smart Selection failed to return a valid lens."
+                smart_status.update(label="Smart Selection complete", state="complete")
+                lens_config = {'lens': smart_lens, 'persona': None, 'is_zeitgeist': False}
+
+            # v10.6: Incremental recomputation - a work whose fingerprint is unchanged reuses its stored analysis
+            async def analyze(work, label):
+                key = analysis_cache_key(work, lens_config, analysis_mode, enforced_complexity)
+                cached = get_cached_analysis(work, key)
+                if cached:
+                    st.caption(f"♻️ {label} is unchanged: reusing its stored analysis.")
+                    return cached
+                result = await async_generate_analysis(lens_config, work, enforced_complexity=enforced_complexity, strategy_container=strategy_container, cache_task=cache_tasks.get(label))
+                if result and result[0]:
+                    store_cached_analysis(work, key, result)
+                return result
+
+            results = await asyncio.gather(analyze(work_a, "Work A"), analyze(work_b, "Work B"))
+            return lens_config, results, None
+        finally:
+            if smart_task is not None and not smart_task.done():
+                smart_task.cancel()
+            # Let creation settle so each cache is recorded on its work (and cleaned up with it)
+            pending_caches = [task for task in cache_tasks.values() if task is not None]
+            if pending_caches:
+                await asyncio.wait(pending_caches)
+
+    final_lens_config, results, preparation_error = run_async_tasks([run_comparative_swarm()])[0]
+    if preparation_error:
+        st.error(preparation_error)
+        return None, None, None, None, None
 
     # v10.2: Unpack results, capturing both analysis text and strategy data
     analysis_a_text, strategy_a = results[0] if results and results[0] else (None, None)
@@ -2907,18 +3913,537 @@ def run_comparative_analysis_pipeline(
         st.error("One or both of the initial analyses failed. Cannot proceed to comparison.")
         return None, None, None, None, None
 
-    # --- 5. Synthesize Results ---
+    # --- 4. Synthesize Results ---
     st.subheader("Step 2/2: Comparative Synthesis")
     client = get_client(api_key)
     if not client:
         return None, None, None, None, None
 
     st.info(f"**Synthesizing Comparison Between:** '{work_a.get_display_title()}' **and** '{work_b.get_display_title()}'")
-    with st.spinner("Generating comparative synthesis..."):
-        synthesis_result = generate_comparative_synthesis(client, final_lens_config, analysis_a_text, work_a.get_display_title(), analysis_b_text, work_b.get_display_title(), work_a, work_b)
+    # v10.6: The synthesis streams in; the page then renders the final text with its export and refinement controls
+    synthesis_stream = st.empty()
+    synthesis_result = generate_comparative_synthesis(client, final_lens_config, analysis_a_text, work_a.get_display_title(), analysis_b_text, work_b.get_display_title(), work_a, work_b, stream_container=synthesis_stream)
+    synthesis_stream.empty()
 
     return synthesis_result, analysis_a_text, analysis_b_text, strategy_a, strategy_b
 
+# v10.6: Corpus Comparative Mode
+def corpus_work_label(index: int):
+    """Display label of the index-th work in a corpus (Work A, Work B, ...)."""
+    return f"Work {chr(ord('A') + index)}"
+
+# v10.6: Incremental recomputation
+def analysis_cache_key(work_input: WorkInput, lens_config: dict, analysis_mode: str, complexity):
+    """
+    Dependency fingerprint of a single-lens analysis: work content, lens configuration, analysis mode,
+    enforced rigor (None when each pipeline triages itself) and model routing (models and specialist quorum).
+    """
+    return (
+        work_input.content_fingerprint(),
+        json.dumps(lens_config, sort_keys=True, default=str),
+        analysis_mode,
+        complexity,
+        (MODEL_PRO, MODEL_FLASH, get_swarm_quorum(analysis_mode)),
+    )
+
+def get_cached_analysis(work_input: WorkInput, key):
+    """Returns the stored (analysis_text, strategy_data) for a fingerprint, or None (also when reuse is turned off)."""
+    if not st.session_state.get("reuse_perspectives", True):
+        return None
+    ensure_reuse_caches(work_input)
+    return work_input.analysis_cache.get(key)
+
+def store_cached_analysis(work_input: WorkInput, key, result):
+    """Stores a successful analysis; entries for earlier contents of the work and the oldest beyond ANALYSIS_CACHE_MAX_ENTRIES are dropped."""
+    ensure_reuse_caches(work_input)
+    fingerprint = key[0]
+    for stale_key in [cached_key for cached_key in work_input.analysis_cache if cached_key[0] != fingerprint]:
+        del work_input.analysis_cache[stale_key]
+    work_input.analysis_cache.pop(key, None)
+    work_input.analysis_cache[key] = result
+    while len(work_input.analysis_cache) > ANALYSIS_CACHE_MAX_ENTRIES:
+        del work_input.analysis_cache[next(iter(work_input.analysis_cache))]
+
+def run_corpus_comparative_pipeline(works: list, lens_config: dict, strategy_container=None):
+    """
+    Compares every pair of works through the same lens.
+    Each work is analyzed once per lens/rigor (cached on the WorkInput and reused across pairs and
+    re-runs); only generate_comparative_synthesis runs per pair, as soon as both of its analyses
+    are ready, bounded by CORPUS_SYNTHESIS_CONCURRENCY. Cost is n analyses + n(n-1)/2 syntheses
+    instead of n(n-1) full pipelines.
+
+    Args:
+        works: The WorkInput objects (2 to CORPUS_MAX_WORKS).
+        lens_config: The lens_config dict applied to every work (Smart Selection is not supported).
+        strategy_container: Optional Streamlit container for displaying strategies during execution.
+
+    Returns:
+        A dict with 'lens_config', 'complexity', 'analyses' (per work: (analysis_text, strategy_data) or None)
+        and 'pairs' (list of (index_a, index_b, synthesis_text or None)), or None on failure.
+    """
+    api_key = st.session_state.get("api_key")
+
+    # --- 1. Validation ---
+    if not api_key:
+        st.error("API Key is not configured. Please enter it on the Home page.")
+        return None
+    if len(works) < 2:
+        st.warning("Please provide at least two works for a corpus comparison.")
+        return None
+    for index, work in enumerate(works):
+        if not work.is_ready():
+            st.warning(f"Please provide {corpus_work_label(index)}.")
+            return None
+
+    client = get_client(api_key)
+    if not client:
+        return None
+
+    analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE) # Default to Adaptive
+    rigor_status = st.status("Enforcing Comparative Rigor...", expanded=False) if analysis_mode == MODE_ADAPTIVE else None
+    pairs = [(i, j) for i in range(len(works)) for j in range(i + 1, len(works))]
+
+    st.subheader(f"Step 1/2: Analyzing {len(works)} works (one analysis per work)...")
+    analysis_status = st.status("Analyzing corpus...", expanded=False)
+    synthesis_status = st.status(f"Step 2/2: Comparing {len(pairs)} pairs...", expanded=False)
+
+    async def run_corpus():
+        # --- 2. Comparative Rigor (highest complexity across the corpus) ---
+        enforced_complexity = None
+        if rigor_status is not None:
+            enforced_complexity = await run_corpus_triage(client, works, rigor_status)
+            if not enforced_complexity:
+                return None
+
+        # --- 3. One analysis per work (reused from the WorkInput cache when available) ---
+        analysis_slots = asyncio.Semaphore(CORPUS_ANALYSIS_CONCURRENCY)
+
+        async def analyze(index, work):
+            key = analysis_cache_key(work, lens_config, analysis_mode, enforced_complexity)
+            cached = get_cached_analysis(work, key)
+            if cached:
+                analysis_status.write(f"{corpus_work_label(index)}: reusing the cached analysis.")
+                return cached
+            async with analysis_slots:
+                result = await async_generate_analysis(lens_config, work, enforced_complexity=enforced_complexity, strategy_container=strategy_container)
+            if result and result[0]:
+                store_cached_analysis(work, key, result)
+                analysis_status.write(f"{corpus_work_label(index)}: analysis complete.")
+                return result
+            analysis_status.write(f"{corpus_work_label(index)}: analysis failed.")
+            return None
+
+        analysis_tasks = [asyncio.ensure_future(analyze(index, work)) for index, work in enumerate(works)]
+
+        # --- 4. Pairwise syntheses (each starts once both of its analyses are ready) ---
+        synthesis_slots = asyncio.Semaphore(CORPUS_SYNTHESIS_CONCURRENCY)
+
+        async def compare(i, j):
+            result_a, result_b = await asyncio.gather(analysis_tasks[i], analysis_tasks[j])
+            if not result_a or not result_b:
+                return None
+            async with synthesis_slots:
+                synthesis = await generate_comparative_synthesis_async(
+                    client, lens_config,
+                    result_a[0], works[i].get_display_title(),
+                    result_b[0], works[j].get_display_title(),
+                    works[i], works[j]
+                )
+            synthesis_status.write(f"{corpus_work_label(i)} × {corpus_work_label(j)}: {'complete' if synthesis else 'failed'}.")
+            return synthesis
+
+        try:
+            syntheses = await asyncio.gather(*[compare(i, j) for i, j in pairs])
+        finally:
+            for task in analysis_tasks:
+                task.cancel()
+        analyses = [task.result() for task in analysis_tasks]
+        return enforced_complexity, analyses, syntheses
+
+    outcome = run_async_tasks([run_corpus()])[0]
+    if outcome is None:
+        st.error("Failed to determine comparative rigor level.")
+        return None
+
+    enforced_complexity, analyses, syntheses = outcome
+    failed_analyses = sum(1 for result in analyses if not result)
+    analysis_status.update(
+        label=f"Corpus analyzed ({len(works) - failed_analyses}/{len(works)} works).",
+        state="error" if failed_analyses == len(works) else "complete"
+    )
+    completed_pairs = sum(1 for synthesis in syntheses if synthesis)
+    synthesis_status.update(
+        label=f"Step 2/2: {completed_pairs}/{len(pairs)} pairs compared.",
+        state="error" if not completed_pairs else "complete"
+    )
+    if not completed_pairs:
+        st.error("No pair could be compared. Check the failed analyses above.")
+        return None
+
+    return {
+        "lens_config": lens_config,
+        "complexity": enforced_complexity,
+        "analyses": analyses,
+        "pairs": [(i, j, synthesis) for (i, j), synthesis in zip(pairs, syntheses)],
+    }
+
+def format_corpus_report(corpus_result: dict, works: list):
+    """Formats a corpus comparison as one Markdown document (pair syntheses, in pair order)."""
+    lens_config = corpus_result["lens_config"]
+    framework = "Zeitgeist Simulation (Common Context)" if lens_config.get('is_zeitgeist') else (lens_config.get('lens') or "Filter-based Selection")
+    sections = [f"# Corpus Comparison: {framework}", ""]
+    for index, work in enumerate(works):
+        sections.append(f"- **{corpus_work_label(index)}:** {work.get_display_title()}")
+    for i, j, synthesis in corpus_result["pairs"]:
+        sections += ["", f"## {corpus_work_label(i)} × {corpus_work_label(j)}: {works[i].get_display_title()} / {works[j].get_display_title()}", ""]
+        sections.append(synthesis if synthesis else "_Comparison unavailable (analysis or synthesis failed)._")
+    return "\n".join(sections)
+
+# v10.6: Lens Sweep Mode
+def get_sweep_lenses(discipline="All Disciplines", function="All Functions", era="All Eras", region="All Regions"):
+    """The lenses a sweep covers: the whole catalog, or the lenses matching every given filter."""
+    return get_catalog().index.filter_lenses(discipline, function, era, region)
+
+def order_sweep_lenses(work_input: WorkInput, lens_names):
+    """
+    Orders a sweep by local pre-ranking relevance to the work (best first, unmatched lenses
+    alphabetically after), so the most promising lenses are analyzed and shown first.
+    Media works have no text to rank on and are swept alphabetically.
+    Returns (ordered lens names, {lens_name: relevance score}).
+    """
+    query_text = get_selection_query_text(work_input)
+    scores = dict(_build_lens_retriever(get_catalog()).rank(query_text)) if query_text else {}
+    ordered = sorted(lens_names, key=lambda lens_name: (-scores.get(lens_name, 0.0), lens_name))
+    return ordered, {lens_name: scores.get(lens_name, 0.0) for lens_name in lens_names}
+
+def rank_sweep_results(analyses: dict, relevance: dict):
+    """
+    Cheap local ranking of sweep results (no API call). Each analysis scores on:
+    - relevance: TF-IDF similarity of its lens to the work (0 for media works), scaled to the best lens
+    - distinctiveness: 1 - its highest cosine similarity to any other analysis in the sweep
+      (analyses that say what the others do not)
+    Returns [(lens_name, score)] best first; score is the mean of the two components (0-1).
+
+    Each analysis is reduced to its SWEEP_DISTINCTIVENESS_TERMS heaviest terms and the pairwise
+    similarities are accumulated through an inverted index (as in LensRetriever), so only pairs
+    sharing a term are ever touched.
+    """
+    postings = collections.defaultdict(list)  # term -> [(lens_name, normalized weight)]
+    for lens_name, analysis_text in analyses.items():
+        counts = collections.Counter(_retrieval_terms(analysis_text))
+        top_terms = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:SWEEP_DISTINCTIVENESS_TERMS]
+        weights = {term: 1 + math.log(tf) for term, tf in top_terms}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        for term, weight in weights.items():
+            postings[term].append((lens_name, weight / norm))
+
+    similarities = collections.defaultdict(float)  # (lens_name, other_name) -> cosine
+    for entries in postings.values():
+        for i, (lens_name, weight) in enumerate(entries):
+            for other_name, other_weight in entries[i + 1:]:
+                similarities[lens_name, other_name] += weight * other_weight
+    closest = dict.fromkeys(analyses, 0.0)
+    for (lens_name, other_name), similarity in similarities.items():
+        closest[lens_name] = max(closest[lens_name], similarity)
+        closest[other_name] = max(closest[other_name], similarity)
+
+    max_relevance = max((relevance.get(lens_name, 0.0) for lens_name in analyses), default=0.0) or 1.0
+    ranking = []
+    for lens_name in analyses:
+        score = 0.5 * relevance.get(lens_name, 0.0) / max_relevance + 0.5 * (1.0 - closest[lens_name])
+        ranking.append((lens_name, score))
+    return sorted(ranking, key=lambda item: (-item[1], item[0]))
+
+def run_batch_pipeline(work_input: WorkInput, batch_configs: list, results_container, batch_label: str, max_concurrent: int):
+    """
+    Runs one work through many lens configurations with a single upload, context cache and Triage.
+    Analyses run concurrently under max_concurrent and each result is rendered in results_container
+    as it completes. Shared by Lens Sweep and Zeitgeist Batch modes.
+
+    Args:
+        batch_configs: List of (name, lens_config) in start order; names must be unique.
+        batch_label: Plural noun for status messages (e.g., 'lenses', 'witnesses').
+
+    Returns:
+        (complexity, {name: analysis_text}, [failed names]), or None on failure.
+    """
+    api_key = st.session_state.get("api_key")
+
+    # --- 1. Validation ---
+    if not api_key:
+        st.error("API Key is not configured. Please enter it on the Home page.")
+        return None
+    if not work_input.is_ready():
+        st.warning("Please provide the creative work to be analyzed.")
+        return None
+    if not batch_configs:
+        st.warning(f"No {batch_label} to analyze.")
+        return None
+
+    client = get_client(api_key)
+    if not client:
+        return None
+
+    analysis_mode = st.session_state.get("analysis_mode", MODE_ADAPTIVE) # Default to Adaptive
+    if invalidate_cache_if_mode_changed(work_input, analysis_mode, api_key):
+        st.info("Cache invalidated due to analysis mode change. A new cache will be created.")
+
+    is_media = work_input.modality in [M_IMAGE, M_AUDIO, M_VIDEO]
+
+    # --- 2. Shared preparation: one upload, one context cache, one Triage ---
+    prep_status = st.status(f"Preparing {len(batch_configs)} {batch_label}...", expanded=False)
+    cache_status = st.status("Preparing a shared context cache...", expanded=False) if is_media and len(batch_configs) > 1 else None
+    batch_status = st.status(f"Analyzing {len(batch_configs)} {batch_label}...", expanded=False)
+    st.caption("Per-analysis pipeline progress:")
+    progress_area = st.container(height=SWEEP_PROGRESS_HEIGHT)
+
+    analyses = {}
+    failed = []
+
+    async def run_batch():
+        cache_task = None
+        if is_media:
+            if not await upload_to_gemini_async(work_input, prep_status):
+                prep_status.update(label="Preparation failed due to upload error.", state="error")
+                return None
+            if cache_status is not None:
+                cache_model = MODEL_PRO if analysis_mode == MODE_DEEP_DIVE else MODEL_FLASH
+                cache_status.update(label="Creating context cache in the background...")
+                cache_task = asyncio.ensure_future(create_context_cache_in_background(
+                    client, work_input, cache_model, cache_status, analysis_mode=analysis_mode
+                ))
+        try:
+            # Adaptive mode: Triage once and enforce its verdict on every analysis
+            enforced_complexity = None
+            if analysis_mode == MODE_ADAPTIVE:
+                enforced_complexity = await execute_triage_analyst(client, work_input, prep_status)
+                if not enforced_complexity:
+                    prep_status.update(label="Preparation failed during Triage.", state="error")
+                    return None
+            prep_status.update(label=f"Shared preparation complete (rigor: {enforced_complexity or analysis_mode}).", state="complete")
+
+            analysis_slots = asyncio.Semaphore(max_concurrent)
+
+            async def analyze(name, lens_config):
+                async with analysis_slots:
+                    result = await async_generate_analysis(lens_config, work_input, enforced_complexity=enforced_complexity, cache_task=cache_task)
+                return name, result
+
+            # Results are rendered as they complete (the pipelines' own status widgets go to progress_area)
+            tasks = [asyncio.ensure_future(analyze(name, lens_config)) for name, lens_config in batch_configs]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    name, result = await next_done
+                    if result and result[0]:
+                        analyses[name] = result[0]
+                        with results_container:
+                            with st.expander(f"✅ {name}"):
+                                st.markdown(result[0])
+                    else:
+                        failed.append(name)
+                    batch_status.update(label=f"Analyzing {batch_label}: {len(analyses) + len(failed)}/{len(batch_configs)} complete ({len(failed)} failed)...")
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return enforced_complexity
+        finally:
+            if cache_task is not None:
+                # Let creation settle so the cache is recorded on work_input (and cleaned up with it)
+                await asyncio.wait([cache_task])
+
+    # Streamlit's container stack is a context variable, so every task started by the batch renders here
+    with progress_area:
+        enforced_complexity = run_async_tasks([run_batch()])[0]
+    if not analyses:
+        batch_status.update(label=f"Failed: none of the {batch_label} produced an analysis.", state="error")
+        return None
+    batch_status.update(label=f"Complete: {len(analyses)}/{len(batch_configs)} {batch_label} analyzed.", state="complete")
+    return enforced_complexity, analyses, failed
+
+def estimate_sweep_calls(lens_count: int, analysis_mode: str):
+    """
+    Upper-bound estimate of the API calls a sweep makes, by model. Each analysis runs a Theoretician,
+    its specialists and a Pro synthesis; Adaptive assumes the Complex path for every lens, since the
+    shared Triage only decides once the sweep has started. Uploads and cache creation are not counted.
+
+    Returns:
+        {'pro': int, 'flash': int, 'hedges': int, 'total': int}; 'hedges' is the most extra
+        specialist calls hedging may add (0 when hedging is off) and is included in 'total'.
+    """
+    if analysis_mode == MODE_SURFACE_SCRAPE:
+        pro_calls, specialist_calls, flash_calls = 1, 6, 7  # Flash-Lite Theoretician (4-6 tasks) + specialists
+    else:
+        pro_calls, specialist_calls, flash_calls = 2, 10, 10  # Pro Theoretician (10 tasks) + Flash-Lite specialists
+    hedges = max(1, int(specialist_calls * HEDGE_MAX_FRACTION)) if st.session_state.get("hedge_specialists", True) else 0
+    estimate = {
+        "pro": lens_count * pro_calls,
+        "flash": lens_count * (flash_calls + hedges) + (1 if analysis_mode == MODE_ADAPTIVE else 0),  # + one shared Triage
+        "hedges": lens_count * hedges,
+    }
+    estimate["total"] = estimate["pro"] + estimate["flash"]
+    return estimate
+
+def run_lens_sweep_pipeline(work_input: WorkInput, lens_names: list, results_container):
+    """
+    Runs one work through many lenses (see run_batch_pipeline), most relevant lenses first,
+    and ranks the results locally.
+
+    Returns:
+        A dict with 'complexity', 'analyses' ({lens_name: analysis_text}), 'failed' (lens names)
+        and 'ranking' (see rank_sweep_results), or None on failure.
+    """
+    if not lens_names:
+        st.warning("No lenses match the sweep filters.")
+        return None
+
+    ordered_lenses, relevance = order_sweep_lenses(work_input, lens_names)
+    batch_configs = [(lens_name, {'lens': lens_name, 'persona': None, 'is_zeitgeist': False}) for lens_name in ordered_lenses]
+    outcome = run_batch_pipeline(work_input, batch_configs, results_container, "lenses", SWEEP_MAX_CONCURRENT_ANALYSES)
+    if not outcome:
+        return None
+
+    enforced_complexity, analyses, failed = outcome
+    return {
+        "complexity": enforced_complexity,
+        "analyses": analyses,
+        "failed": failed,
+        "ranking": rank_sweep_results(analyses, relevance),
+    }
+
+def format_sweep_report(sweep_result: dict, work_input: WorkInput):
+    """Formats a lens sweep as one Markdown document, lenses in ranking order."""
+    sections = [f"# Lens Sweep: {work_input.get_display_title()}", ""]
+    for position, (lens_name, score) in enumerate(sweep_result["ranking"], 1):
+        sections += [f"## {position}. {lens_name} (relevance {score:.2f})", "", sweep_result["analyses"][lens_name], ""]
+    if sweep_result["failed"]:
+        sections.append("**Lenses without a result:** " + ", ".join(sweep_result["failed"]))
+    return "\n".join(sections)
+
+# v10.6: Zeitgeist Batch Mode
+def default_zeitgeist_witnesses():
+    """One witness per era in ERA_ORDER (the era label as context, a generic contemporary as persona)."""
+    return [
+        {"moment": era, "zeitgeist_context": era, "zeitgeist_persona": ZEITGEIST_DEFAULT_WITNESS}
+        for era in get_catalog().era_order
+    ]
+
+def order_zeitgeist_witnesses(witnesses: list):
+    """Chronological order: witnesses named after an ERA_ORDER era first (by era), then the others as given."""
+    era_position = {era: position for position, era in enumerate(get_catalog().era_order)}
+    return sorted(witnesses, key=lambda witness: era_position.get(witness["moment"], len(era_position)))
+
+def run_zeitgeist_batch_pipeline(work_input: WorkInput, witnesses: list, results_container, stream_container=None):
+    """
+    Simulates the work as perceived at several historical moments (see run_batch_pipeline), then
+    compares the receptions in chronological order with one synthesis call.
+
+    Args:
+        witnesses: List of dicts with 'moment' (a unique label, e.g. an ERA_ORDER era),
+            'zeitgeist_context' and 'zeitgeist_persona'.
+        stream_container: Optional Streamlit container for streaming the era comparison.
+
+    Returns:
+        A dict with 'complexity', 'witnesses' (chronological), 'analyses' ({moment: analysis_text}),
+        'failed' (moments) and 'comparison' (text or None), or None on failure.
+    """
+    witnesses = order_zeitgeist_witnesses([
+        witness for witness in witnesses
+        if witness.get("moment") and witness.get("zeitgeist_context") and witness.get("zeitgeist_persona")
+    ])
+    moments = [witness["moment"] for witness in witnesses]
+    if len(set(moments)) != len(moments):
+        st.warning("Each historical moment must have a unique label.")
+        return None
+    if not witnesses:
+        st.warning("Define at least one historical moment with a context and a witness persona.")
+        return None
+
+    batch_configs = [
+        (witness["moment"], {
+            'lens': None, 'persona': None, 'is_zeitgeist': True,
+            'zeitgeist_context': witness["zeitgeist_context"],
+            'zeitgeist_persona': witness["zeitgeist_persona"],
+        })
+        for witness in witnesses
+    ]
+    outcome = run_batch_pipeline(work_input, batch_configs, results_container, "witnesses", ZEITGEIST_BATCH_CONCURRENCY)
+    if not outcome:
+        return None
+
+    enforced_complexity, analyses, failed = outcome
+    comparison = None
+    if len(analyses) > 1:
+        client = get_client(st.session_state.get("api_key"))
+        if client:
+            witness_results = [(witness, analyses[witness["moment"]]) for witness in witnesses if witness["moment"] in analyses]
+            if stream_container:
+                comparison = generate_zeitgeist_era_comparison(client, witness_results, work_input.get_display_title(), work_input, stream_container)
+            else:
+                with st.spinner("Comparing the receptions across eras..."):
+                    comparison = generate_zeitgeist_era_comparison(client, witness_results, work_input.get_display_title(), work_input)
+
+    return {
+        "complexity": enforced_complexity,
+        "witnesses": witnesses,
+        "analyses": analyses,
+        "failed": failed,
+        "comparison": comparison,
+    }
+
+@retry_with_backoff(max_retries=3, base_delay=2)
+def generate_zeitgeist_era_comparison(client, witness_results, work_title, work_input, stream_container=None):
+    """
+    Compares Zeitgeist simulations of the same work across historical moments, in chronological order.
+
+    Args:
+        witness_results: List of (witness dict, analysis_text) in chronological order.
+        stream_container: Optional Streamlit container for streaming output.
+    """
+    prompt_parts = [textwrap.dedent(f"""
+    You are tasked with writing a "Reception History" of the creative work titled "{work_title}".
+    The Janus engine has simulated how witnesses from different historical moments would perceive this work.
+    The simulations are provided in chronological order.
+
+    IMPORTANT: The witnesses are personas adopted BY JANUS. Discuss what each simulation reveals, not what real historical people said.
+
+    --- Provided Simulations ---
+    """)]
+    for idx, (witness, analysis_text) in enumerate(witness_results):
+        prompt_parts.append(f"<simulation id='{idx+1}' moment='{witness['moment']}'>\n{analysis_text}\n</simulation>\n")
+
+    prompt_parts.append(textwrap.dedent("""
+    --- Instructions ---
+    1. **Chronological Survey:** For each historical moment, in the order provided, summarize in a few sentences how the work is perceived: what is valued, what is condemned, and what goes unnoticed.
+    2. **Shifts and Continuities:** Trace how the reception changes between consecutive moments and what remains constant across all of them. Tie every claim to the provided simulations.
+    3. **Comparison Table:** Provide a markdown table with one row per moment (chronological) and the columns: Moment, Dominant Reading, Key Objection, What It Reveals About the Work.
+    4. **Synthesis:** Conclude with a section titled "## What the Eras Reveal" on what the sequence of receptions shows about the work itself.
+    """))
+    synthesis_prompt = "\n".join(prompt_parts)
+
+    try:
+        # Streamed through the shared helper (metadata is accumulated from the final chunk)
+        return run_async_tasks([
+            stream_generate_content(client, synthesis_prompt, [work_input], stream_container)
+        ])[0]
+    except google_exceptions.ResourceExhausted:
+        st.error("⏱️ **Rate Limit Reached** - You've made too many requests in a short time. Please wait 1-2 minutes and try again, or check your Google Cloud quota.")
+        return None
+    except Exception as e:
+        st.error(f"An error occurred during the era comparison: {e}")
+        return None
+
+def format_zeitgeist_batch_report(batch_result: dict, work_input: WorkInput):
+    """Formats a Zeitgeist batch as one Markdown document (era comparison, then witnesses in chronological order)."""
+    sections = [f"# Zeitgeist Across Eras: {work_input.get_display_title()}", ""]
+    if batch_result.get("comparison"):
+        sections += [batch_result["comparison"], ""]
+    for witness in batch_result["witnesses"]:
+        analysis_text = batch_result["analyses"].get(witness["moment"])
+        sections += [f"## {witness['moment']}", "", f"*Witness:* {witness['zeitgeist_persona']}", ""]
+        sections.append(analysis_text if analysis_text else "_Simulation unavailable._")
+        sections.append("")
+    return "\n".join(sections)
+
 
 # --- SYNTHESIS FUNCTIONS ---
 
@@ -3040,7 +4565,7 @@ def generate_dialectical_synthesis(client, data_a, analysis_a, data_b, analysis_
 
 # v9.4b: Updated signature and implementation for Symposium.
 @retry_with_backoff(max_retries=3, base_delay=2)
-def generate_symposium_synthesis(client, analyses_results, work_title, work_input, stream_container=None):
+def generate_symposium_synthesis(client, analyses_results, work_title, work_input, stream_container=None, panel_briefs=None):
     # v10.1: Migrated to google-genai SDK - now accepts client instead of model
     # v9.4b: Updated to handle the new is_zeitgeist flag and the structure of analyses_results.
     # v10.2: Added streaming support via optional stream_container
@@ -3051,6 +4576,9 @@ def generate_symposium_synthesis(client, analyses_results, work_title, work_inpu
     Args:
         work_input: WorkInput object for metadata tracking
         stream_container: Optional Streamlit container for streaming output. If provided, text streams in real-time.
+        panel_briefs: v10.6: Optional list of (panel, brief_text) from group_symposium_panels and
+            generate_symposium_panel_brief. The briefs replace the full analyses in the prompt
+            (a panel whose brief is None contributes its full analyses).
     """
     # analyses_results: List of (lens_config, analysis_text) tuples (to handle potential duplicate lenses/Zeitgeist entries)
 
@@ -3064,9 +4592,17 @@ def generate_symposium_synthesis(client, analyses_results, work_title, work_inpu
 
     # Add the analyses
     # v9.4b: Iterate over the results list which contains tuples of (config, text)
-    for idx, (config, analysis_text) in enumerate(analyses_results):
-        display_name = config.get('lens') or "Zeitgeist Simulation"
-        prompt_parts.append(f"<analysis id='{idx+1}' perspective='{display_name}'>\n{analysis_text}\n</analysis>\n")
+    if panel_briefs is None:
+        panel_briefs = [([(idx, config, analysis_text) for idx, (config, analysis_text) in enumerate(analyses_results)], None)]
+    for panel_number, (panel, brief_text) in enumerate(panel_briefs, 1):
+        if brief_text:
+            # v10.6: Hierarchical Symposium - the panel's condensed positions stand in for its analyses
+            member_ids = ", ".join(str(idx+1) for idx, _, _ in panel)
+            prompt_parts.append(f"<panel id='{panel_number}' analyses='{member_ids}'>\n{brief_text}\n</panel>\n")
+            continue
+        for idx, config, analysis_text in panel:
+            display_name = config.get('lens') or "Zeitgeist Simulation"
+            prompt_parts.append(f"<analysis id='{idx+1}' perspective='{display_name}'>\n{analysis_text}\n</analysis>\n")
 
     # Generate speaker instructions
     speaker_instructions_parts = []
@@ -3157,15 +4693,90 @@ def generate_symposium_synthesis(client, analyses_results, work_title, work_inpu
         st.error(f"An error occurred during symposium synthesis: {e}")
         return None
 
+# v10.6: Hierarchical Symposium for large perspective counts
+def group_symposium_panels(analyses_results: list, panel_size: int = SYMPOSIUM_PANEL_SIZE):
+    """
+    Splits a Symposium into contiguous sub-panels of near-equal size (selection order is kept).
+    Returns a list of panels, each a list of (analysis_index, lens_config, analysis_text).
+    """
+    indexed = [(idx, config, analysis_text) for idx, (config, analysis_text) in enumerate(analyses_results)]
+    panel_count = max(1, math.ceil(len(indexed) / panel_size))
+    return [
+        indexed[panel * len(indexed) // panel_count:(panel + 1) * len(indexed) // panel_count]
+        for panel in range(panel_count)
+    ]
 
 @retry_with_backoff(max_retries=3, base_delay=2)
-def generate_comparative_synthesis(client, lens_config, analysis_a, work_a_title, analysis_b, work_b_title, work_a, work_b):
-    # v10.1: Migrated to google-genai SDK - now accepts client instead of model
-    # v9.4b: Updated to accept lens_config instead of just lens_name.
-    # v10.2: Added work_a and work_b parameters for metadata tracking
-    # v10.2: Added retry logic with exponential backoff
-    """Synthesizes two analyses of DIFFERENT works using the SAME lens/configuration."""
+async def generate_symposium_panel_brief(client, panel: list, panel_number: int, work_title: str, work_input: WorkInput):
+    """
+    Condenses one sub-panel of a large Symposium into a brief for the final dialogue.
+    Each participant keeps its speaker header, core thesis and key evidence; within-panel tensions are noted.
+
+    Args:
+        panel: List of (analysis_index, lens_config, analysis_text) from group_symposium_panels.
+    """
+    prompt_parts = [textwrap.dedent(f"""
+    You are preparing a briefing for a large "Symposium Dialogue" on the creative work titled "{work_title}".
+    You are responsible for Sub-Panel {panel_number}. Condense its analyses faithfully so that a final moderator
+    can stage the dialogue from your brief alone.
+
+    --- Sub-Panel Analyses ---
+    """)]
+    for idx, config, analysis_text in panel:
+        display_name = config.get('lens') or "Zeitgeist Simulation"
+        prompt_parts.append(f"<analysis id='{idx+1}' perspective='{display_name}'>\n{analysis_text}\n</analysis>\n")
+
+    prompt_parts.append(textwrap.dedent(f"""
+    --- Instructions ---
+    1. **One Section per Analysis:** In the order provided, write one section per analysis. Each section MUST begin with the analysis's own H3 speaker header copied exactly (e.g., '### Analysis by Jean-Paul Sartre'), followed by its id in parentheses (e.g., '(Analysis 3)').
+    2. **Condensed Position:** In about {SYMPOSIUM_BRIEF_WORDS} words per analysis, state its core thesis, its main arguments, the most important textual evidence it cites, and its distinctive concepts or vocabulary. Preserve the speaker's voice and any direct quotations from the work.
+    3. **Panel Tensions:** End with a section titled "### Panel Tensions" listing the key agreements and disagreements among these analyses.
+    4. **Fidelity:** Do not introduce claims that are not in the analyses, and do not stage a dialogue.
+    """))
+
+    response = await client.aio.models.generate_content(
+        model=MODEL_PRO,
+        contents="\n".join(prompt_parts)
+    )
+    accumulate_metadata(work_input, response)
+    return response.text
+
+def generate_hierarchical_symposium_synthesis(client, analyses_results, work_title, work_input, stream_container=None):
+    """
+    Symposium synthesis that scales with the number of perspectives.
+    Up to SYMPOSIUM_PANEL_THRESHOLD perspectives are synthesized directly. Larger symposia are grouped into
+    sub-panels that are briefed in parallel, and the final dialogue (streamed if stream_container is given)
+    is written from the briefs, so its input no longer grows with every full analysis.
+    """
+    if len(analyses_results) <= SYMPOSIUM_PANEL_THRESHOLD:
+        return generate_symposium_synthesis(client, analyses_results, work_title, work_input, stream_container)
+
+    panels = group_symposium_panels(analyses_results)
+    panel_status = st.status(f"Briefing {len(panels)} sub-panels ({len(analyses_results)} perspectives)...", expanded=False)
+    panel_slots = asyncio.Semaphore(SYMPOSIUM_PANEL_CONCURRENCY)
+
+    async def brief(panel_number, panel):
+        async with panel_slots:
+            try:
+                brief_text = await generate_symposium_panel_brief(client, panel, panel_number, work_title, work_input)
+            except Exception as e:
+                logging.warning(f"Symposium sub-panel {panel_number} brief failed: {e}")
+                brief_text = None
+        if brief_text:
+            panel_status.write(f"Sub-panel {panel_number} briefed ({len(panel)} perspectives)")
+        else:
+            panel_status.write(f"⚠️ Sub-panel {panel_number} brief failed; its full analyses will be used")
+        return brief_text
+
+    briefs = run_async_tasks([brief(panel_number, panel) for panel_number, panel in enumerate(panels, 1)])
+    briefed = sum(1 for brief_text in briefs if brief_text)
+    panel_status.update(label=f"Sub-panels briefed: {briefed}/{len(panels)}", state="complete" if briefed == len(panels) else "error")
+
+    return generate_symposium_synthesis(client, analyses_results, work_title, work_input, stream_container, panel_briefs=list(zip(panels, briefs)))
 
+
+def build_comparative_synthesis_prompt(lens_config, analysis_a, work_a_title, analysis_b, work_b_title):
+    """Builds the Comparative Synthesis prompt (shared by the sync and async synthesis calls)."""
     # v9.4b: Determine the display name for the comparison
     if lens_config.get('is_zeitgeist', False):
         comparison_framework = "Zeitgeist Simulation (Common Context)"
@@ -3196,16 +4807,33 @@ def generate_comparative_synthesis(client, lens_config, analysis_a, work_a_title
     4. **Structure:** Format your response as a cohesive essay with clear sections for comparison, contrast, and synthesis.
     5. **Attribution:** When discussing the analyses, refer to them as "the analysis of Work A" and "the analysis of Work B" rather than attributing them to persona figures who may have been adopted stylistically.
     """)
+    return synthesis_prompt
+
+def generate_comparative_synthesis(client, lens_config, analysis_a, work_a_title, analysis_b, work_b_title, work_a, work_b, stream_container=None):
+    # v10.1: Migrated to google-genai SDK - now accepts client instead of model
+    # v9.4b: Updated to accept lens_config instead of just lens_name.
+    # v10.2: Added work_a and work_b parameters for metadata tracking
+    # v10.2: Added retry logic with exponential backoff
+    # v10.6: Streams through client.aio (see generate_comparative_synthesis_async)
+    """
+    Synthesizes two analyses of DIFFERENT works using the SAME lens/configuration.
+
+    Args:
+        stream_container: Optional Streamlit container for streaming output. If provided, text streams in real-time.
+    """
+    return run_async_tasks([generate_comparative_synthesis_async(
+        client, lens_config, analysis_a, work_a_title, analysis_b, work_b_title, work_a, work_b, stream_container
+    )])[0]
+
+# v10.6: Async variant for corpus comparison (many pairwise syntheses in one event loop)
+@retry_with_backoff(max_retries=3, base_delay=2)
+async def generate_comparative_synthesis_async(client, lens_config, analysis_a, work_a_title, analysis_b, work_b_title, work_a, work_b, stream_container=None):
+    """Asynchronous, streamed version of generate_comparative_synthesis (client.aio)."""
+    synthesis_prompt = build_comparative_synthesis_prompt(lens_config, analysis_a, work_a_title, analysis_b, work_b_title)
 
     try:
-        response = client.models.generate_content(
-            model=MODEL_PRO,
-            contents=synthesis_prompt
-        )
-        # v10.2: Accumulate metadata for synthesis (both works)
-        accumulate_metadata(work_a, response)
-        accumulate_metadata(work_b, response)
-        return response.text
+        # Metadata for synthesis is accumulated to both works
+        return await stream_generate_content(client, synthesis_prompt, [work_a, work_b], stream_container)
     except google_exceptions.ResourceExhausted:
         st.error("⏱️ **Rate Limit Reached** - You've made too many requests in a short time. Please wait 1-2 minutes and try again, or check your Google Cloud quota.")
         return None
@@ -3225,6 +4853,25 @@ def run_async_tasks(tasks):
 
     return asyncio.run(run_all())
 
+# v10.6: Fragment-scoped reruns for the analysis pages
+# Input, configuration and results areas run as st.fragment, so a widget change reruns only its own area.
+# A fragment escalates to a full page rerun when it changes something the rest of the page depends on.
+def begin_page_run(page_prefix: str):
+    """Marks a full run of a page script (fragment reruns do not execute the page body)."""
+    st.session_state[f'{page_prefix}_page_run'] = st.session_state.get(f'{page_prefix}_page_run', 0) + 1
+
+def rerun_page_if_changed(page_prefix: str, name: str, value):
+    """
+    Called inside a fragment with a value the rest of the page is rendered from. The value seen
+    by the latest full run is recorded; if a fragment rerun produces a different one, the whole page reruns.
+    """
+    page_run = st.session_state.get(f'{page_prefix}_page_run', 0)
+    rendered_run, rendered_value = st.session_state.get(f'{page_prefix}_{name}_rendered', (None, None))
+    if rendered_run != page_run:
+        st.session_state[f'{page_prefix}_{name}_rendered'] = (page_run, value)
+    elif rendered_value != value:
+        st.rerun()
+
 # v10.0.15: Centralized state reset function
 def reset_page_state(page_prefix: str):
     """
@@ -3255,12 +4902,43 @@ def reset_page_state(page_prefix: str):
             st.session_state.work_input_comparative_a.cleanup_gemini_file()
         if 'work_input_comparative_b' in st.session_state:
             st.session_state.work_input_comparative_b.cleanup_gemini_file()
+        # v10.6: Additional corpus works
+        for work_input in st.session_state.get('work_input_comparative_extra', []):
+            work_input.cleanup_gemini_file()
     else:
         # Other pages have single WorkInput
         work_input_key = f'work_input_{page_prefix.split("_")[0]}' # e.g., 'work_input_single'
         if work_input_key in st.session_state:
             st.session_state[work_input_key].cleanup_gemini_file()
 
+# v10.6: Background proactive upload UI
+@st.fragment(run_every=PROACTIVE_UPLOAD_POLL_SECONDS)
+def render_upload_progress(work_input: WorkInput, media_label):
+    """Polls a pending background upload; reruns the page once when it settles."""
+    if work_input.upload_pending():
+        elapsed = time.time() - (work_input.upload_started_at or time.time())
+        st.info(f"⏳ Uploading {media_label.lower()} to Gemini in the background ({elapsed:.0f}s). You can configure your analysis meanwhile.")
+        return
+    work_input.collect_background_upload()
+    st.rerun()
+
+def render_proactive_upload(work_input: WorkInput, media_label):
+    """Starts the background upload for a newly selected file and shows its status."""
+    work_input.collect_background_upload()
+    if work_input.gemini_file_ref is None and work_input.uploaded_file_obj is not None and work_input.upload_future is None and not work_input.upload_error:
+        client = get_client(st.session_state.get("api_key"))
+        if client:
+            work_input.start_background_upload(client)
+        else:
+            work_input.upload_error = "API client unavailable."
+
+    if work_input.upload_pending():
+        render_upload_progress(work_input, media_label)
+    elif work_input.gemini_file_ref is not None:
+        st.success(f"✓ {media_label} ready for analysis")
+    else:
+        st.warning("Upload will be retried when you execute analysis")
+
 def handle_input_ui(work_input: WorkInput, container, ui_key_prefix, on_change_callback=None):
     # (Implementation remains the same as v9.4a)
     """
@@ -3308,36 +4986,28 @@ def handle_input_ui(work_input: WorkInput, container, ui_key_prefix, on_change_c
                 # Check if this is a genuinely new file (compare by metadata to avoid re-upload loop)
                 file_changed = (
                     work_input.uploaded_file_name != uploaded_file.name or
-                    work_input.uploaded_file_size != uploaded_file.size
+                    work_input.uploaded_file_size != uploaded_file.size or
+                    getattr(work_input, "uploaded_file_digest", None) != get_upload_digest(uploaded_file)
                 )
 
                 if file_changed:
-                    # Clean up old file from Gemini if one exists
-                    if work_input.gemini_file_ref is not None:
+                    # Clean up old file from Gemini if one exists (v10.6: or is still uploading)
+                    if work_input.gemini_file_ref is not None or work_input.upload_future is not None:
                         work_input.cleanup_gemini_file()
 
                     work_input.uploaded_file_obj = uploaded_file
                     work_input.uploaded_file_name = uploaded_file.name
                     work_input.uploaded_file_size = uploaded_file.size
+                    work_input.uploaded_file_digest = get_upload_digest(uploaded_file)
+                    work_input.upload_error = None
                     # gemini_file_ref already cleared by cleanup_gemini_file() or was None
                 elif work_input.uploaded_file_obj is None:
                     # File hasn't changed but uploaded_file_obj was freed - restore it
                     work_input.uploaded_file_obj = uploaded_file
 
                 # PROACTIVE UPLOAD: Upload to Gemini if not already uploaded
-                if work_input.gemini_file_ref is None and work_input.uploaded_file_obj is not None:
-                    upload_placeholder = st.empty()
-                    try:
-                        with upload_placeholder.container():
-                            with st.spinner("Uploading image to Gemini..."):
-                                upload_result = upload_to_gemini(work_input)
-                        if upload_result:
-                            upload_placeholder.success("✓ Image ready for analysis")
-                        else:
-                            upload_placeholder.warning("Upload will be retried on execution")
-                    except Exception as e:
-                        upload_placeholder.warning("Upload will be retried when you execute analysis")
-                        logging.warning(f"Proactive upload failed: {e}")
+                # v10.6: Runs in the background so configuration overlaps with the upload
+                render_proactive_upload(work_input, "Image")
 
                 try:
                     # Display thumbnail preview with option for full size
@@ -3359,36 +5029,28 @@ def handle_input_ui(work_input: WorkInput, container, ui_key_prefix, on_change_c
                 # Check if this is a genuinely new file (compare by metadata to avoid re-upload loop)
                 file_changed = (
                     work_input.uploaded_file_name != uploaded_file.name or
-                    work_input.uploaded_file_size != uploaded_file.size
+                    work_input.uploaded_file_size != uploaded_file.size or
+                    getattr(work_input, "uploaded_file_digest", None) != get_upload_digest(uploaded_file)
                 )
 
                 if file_changed:
-                    # Clean up old file from Gemini if one exists
-                    if work_input.gemini_file_ref is not None:
+                    # Clean up old file from Gemini if one exists (v10.6: or is still uploading)
+                    if work_input.gemini_file_ref is not None or work_input.upload_future is not None:
                         work_input.cleanup_gemini_file()
 
                     work_input.uploaded_file_obj = uploaded_file
                     work_input.uploaded_file_name = uploaded_file.name
                     work_input.uploaded_file_size = uploaded_file.size
+                    work_input.uploaded_file_digest = get_upload_digest(uploaded_file)
+                    work_input.upload_error = None
                     # gemini_file_ref already cleared by cleanup_gemini_file() or was None
                 elif work_input.uploaded_file_obj is None:
                     # File hasn't changed but uploaded_file_obj was freed - restore it
                     work_input.uploaded_file_obj = uploaded_file
 
                 # PROACTIVE UPLOAD: Upload to Gemini if not already uploaded
-                if work_input.gemini_file_ref is None and work_input.uploaded_file_obj is not None:
-                    upload_placeholder = st.empty()
-                    try:
-                        with upload_placeholder.container():
-                            with st.spinner("Uploading audio to Gemini..."):
-                                upload_result = upload_to_gemini(work_input)
-                        if upload_result:
-                            upload_placeholder.success("✓ Audio ready for analysis")
-                        else:
-                            upload_placeholder.warning("Upload will be retried on execution")
-                    except Exception as e:
-                        upload_placeholder.warning("Upload will be retried when you execute analysis")
-                        logging.warning(f"Proactive upload failed: {e}")
+                # v10.6: Runs in the background so configuration overlaps with the upload
+                render_proactive_upload(work_input, "Audio")
 
                 # Display audio player (use local variable, not work_input.uploaded_file_obj)
                 st.audio(uploaded_file)
@@ -3404,36 +5066,28 @@ def handle_input_ui(work_input: WorkInput, container, ui_key_prefix, on_change_c
                 # Check if this is a genuinely new file (compare by metadata to avoid re-upload loop)
                 file_changed = (
                     work_input.uploaded_file_name != uploaded_file.name or
-                    work_input.uploaded_file_size != uploaded_file.size
+                    work_input.uploaded_file_size != uploaded_file.size or
+                    getattr(work_input, "uploaded_file_digest", None) != get_upload_digest(uploaded_file)
                 )
 
                 if file_changed:
-                    # Clean up old file from Gemini if one exists
-                    if work_input.gemini_file_ref is not None:
+                    # Clean up old file from Gemini if one exists (v10.6: or is still uploading)
+                    if work_input.gemini_file_ref is not None or work_input.upload_future is not None:
                         work_input.cleanup_gemini_file()
 
                     work_input.uploaded_file_obj = uploaded_file
                     work_input.uploaded_file_name = uploaded_file.name
                     work_input.uploaded_file_size = uploaded_file.size
+                    work_input.uploaded_file_digest = get_upload_digest(uploaded_file)
+                    work_input.upload_error = None
                     # gemini_file_ref already cleared by cleanup_gemini_file() or was None
                 elif work_input.uploaded_file_obj is None:
                     # File hasn't changed but uploaded_file_obj was freed - restore it
                     work_input.uploaded_file_obj = uploaded_file
 
                 # PROACTIVE UPLOAD: Upload to Gemini if not already uploaded
-                if work_input.gemini_file_ref is None and work_input.uploaded_file_obj is not None:
-                    upload_placeholder = st.empty()
-                    try:
-                        with upload_placeholder.container():
-                            with st.spinner("Uploading video to Gemini..."):
-                                upload_result = upload_to_gemini(work_input)
-                        if upload_result:
-                            upload_placeholder.success("✓ Video ready for analysis")
-                        else:
-                            upload_placeholder.warning("Upload will be retried on execution")
-                    except Exception as e:
-                        upload_placeholder.warning("Upload will be retried when you execute analysis")
-                        logging.warning(f"Proactive upload failed: {e}")
+                # v10.6: Runs in the background so configuration overlaps with the upload
+                render_proactive_upload(work_input, "Video")
 
                 # Display video player
                 st.video(uploaded_file)
@@ -3537,7 +5191,7 @@ def render_view_toggle_and_help(selection_key_prefix=""):
 
     # Determine which hierarchy and labels to use based on the view mode
     if view_mode == VIEW_LIBRARY:
-        current_hierarchy = LENSES_HIERARCHY
+        current_hierarchy = lens_catalog.LENSES_HIERARCHY
         labels = {
             "category_label_single": "1. Discipline Category:",
             "category_label_multi": "1. Select Discipline Categories:",
@@ -3545,7 +5199,7 @@ def render_view_toggle_and_help(selection_key_prefix=""):
             "placeholder_text_multi": "Select categories..."
         }
     elif view_mode == VIEW_WORKSHOP:
-        current_hierarchy = LENSES_FUNCTIONAL
+        current_hierarchy = lens_catalog.LENSES_FUNCTIONAL
         labels = {
             "category_label_single": "1. Functional Tier:",
             "category_label_multi": "1. Select Functional Tiers:",
@@ -3553,7 +5207,7 @@ def render_view_toggle_and_help(selection_key_prefix=""):
             "placeholder_text_multi": "Select tiers..."
         }
     else: # VIEW_ERA
-        current_hierarchy = LENSES_BY_ERA
+        current_hierarchy = lens_catalog.LENSES_BY_ERA
         labels = {
             "category_label_single": "1. Historical Era:",
             "category_label_multi": "1. Select Historical Eras:",
@@ -3567,17 +5221,56 @@ def render_view_toggle_and_help(selection_key_prefix=""):
 def get_lens_tooltip(lens_name):
     """Retrieves the description for a lens to be used as a tooltip."""
     if lens_name:
-        data = get_lens_data(lens_name)
-        if data and data.get("description"):
-            return data["description"]
+        # v10.6: Description-only lookup (does not materialize the lens primers)
+        return get_lens_description(lens_name) or None
     return None
 
-def get_all_entries():
+# v10.6: Maps the plural keys of an entry's 'related' dict to entry types
+RELATED_ENTRY_TYPES = {'lenses': 'lens', 'personas': 'persona', 'disciplines': 'discipline', 'functions': 'function', 'eras': 'era'}
+
+class LibraryEntries(collections.abc.Sequence):
+    """
+    v10.6: The Library's entry list with O(1) lookups: entries by name and by (type, name),
+    plus an adjacency graph linking every entry to its related entries across all five types.
+    Behaves as the ordered list of entries, so existing list consumers keep working.
+    """
+
+    def __init__(self, entries):
+        self._entries = entries
+        self.by_key = {(entry['type'], entry['name']): entry for entry in entries}
+        # Names are unique across types today; on a clash the first entry (list order) wins, as before
+        self.by_name = {}
+        for entry in entries:
+            self.by_name.setdefault(entry['name'], entry)
+        self.graph = {
+            key: [(RELATED_ENTRY_TYPES[group], name) for group, names in entry['related'].items()
+                  for name in names if (RELATED_ENTRY_TYPES[group], name) in self.by_key]
+            for key, entry in self.by_key.items()
+        }
+
+    def __getitem__(self, index):
+        return self._entries[index]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, name, entry_type=None):
+        """Returns the entry with this name (optionally of a given type), or None."""
+        if entry_type:
+            return self.by_key.get((entry_type, name))
+        return self.by_name.get(name)
+
+    def neighbors(self, entry):
+        """Returns the entries related to `entry`, grouped by type in 'related' order."""
+        return [self.by_key[key] for key in self.graph.get((entry['type'], entry['name']), [])]
+
+def get_all_entries(catalog=None):
     """
     Build a unified entry database containing all 5 types for the Library's wiki-style system.
 
     Returns:
-        list: A comprehensive list of entry dictionaries with structure:
+        LibraryEntries: A sequence of entry dictionaries (lenses, personas, disciplines, functions,
+        eras in that order) with name lookups and a relationship graph. Each entry has the structure:
         {
             'type': 'lens' | 'persona' | 'discipline' | 'function' | 'era',
             'name': str,
@@ -3593,11 +5286,25 @@ def get_all_entries():
             'tags': set  # For search functionality - all related names
         }
     """
-    from lenses import (
-        SORTED_LENS_NAMES, LENSES_HIERARCHY, LENSES_FUNCTIONAL,
-        LENSES_BY_ERA, PERSONA_POOL, PERSONA_METADATA, ERA_ORDER,
-        get_lens_data
-    )
+    # v10.6: Read every structure from a single catalog snapshot (consistent across hot reloads)
+    catalog = catalog or get_catalog()
+    SORTED_LENS_NAMES, ERA_ORDER = catalog.lens_names, catalog.era_order
+    LENSES_HIERARCHY, LENSES_FUNCTIONAL, LENSES_BY_ERA = catalog.hierarchy, catalog.functional, catalog.by_era
+    PERSONA_POOL, PERSONA_METADATA = catalog.persona_pool, catalog.persona_metadata
+    # v10.6: Per-lens category lookups from the catalog's LensIndex (replaces nested membership scans)
+    lens_disciplines, lens_functions, lens_eras = catalog.index.lens_disciplines, catalog.index.lens_functions, catalog.index.lens_eras
+
+    def related_categories(category_lenses, lens_categories):
+        related = set()
+        for lens_name in category_lenses:
+            related.update(lens_categories.get(lens_name, []))
+        return related
+
+    def related_personas_for(category_lenses):
+        related = set()
+        for lens_name in category_lenses:
+            related.update(PERSONA_POOL.get(lens_name, []))
+        return related
 
     all_entries = []
 
@@ -3605,20 +5312,14 @@ def get_all_entries():
     # 1. LENSES (📖)
     # ============================================================
     for lens_name in SORTED_LENS_NAMES:
-        lens_data = get_lens_data(lens_name)
-        if not lens_data:
+        # v10.6: Description-only lookup (does not materialize every lens's primers)
+        description = catalog.get_description(lens_name)
+        if description is None:
             continue
 
-        # Find related disciplines
-        related_disciplines = [disc for disc, lenses in LENSES_HIERARCHY.items() if lens_name in lenses]
-
-        # Find related functions
-        related_functions = [func for func, lenses in LENSES_FUNCTIONAL.items() if lens_name in lenses]
-
-        # Find related eras
-        related_eras = lens_data.get('eras', [])
-
-        # Find related personas
+        related_disciplines = lens_disciplines.get(lens_name, [])
+        related_functions = lens_functions.get(lens_name, [])
+        related_eras = lens_eras.get(lens_name, [])
         related_personas = PERSONA_POOL.get(lens_name, [])
 
         # Build tags for search (all related terms)
@@ -3632,11 +5333,11 @@ def get_all_entries():
             'type': 'lens',
             'name': lens_name,
             'icon': '📖',
-            'description': lens_data.get('description', 'No description available'),
+            'description': description or 'No description available',
             'related': {
                 'disciplines': sorted(related_disciplines),
                 'functions': sorted(related_functions),
-                'eras': related_eras,  # Keep original order
+                'eras': list(related_eras),  # Keep original order
                 'personas': sorted(related_personas),
                 'lenses': []  # Lenses don't relate to other lenses directly
             },
@@ -3690,23 +5391,10 @@ def get_all_entries():
         lens_count = len(discipline_lenses)
         desc = f"Academic discipline containing {lens_count} analytical framework{'s' if lens_count != 1 else ''}"
 
-        # Find all personas associated with this discipline's lenses
-        related_personas = set()
-        for lens_name in discipline_lenses:
-            if lens_name in PERSONA_POOL:
-                related_personas.update(PERSONA_POOL[lens_name])
-
-        # Find all functions that contain any of this discipline's lenses
-        related_functions = set()
-        for func_name, func_lenses in LENSES_FUNCTIONAL.items():
-            if any(lens in func_lenses for lens in discipline_lenses):
-                related_functions.add(func_name)
-
-        # Find all eras that contain any of this discipline's lenses
-        related_eras = set()
-        for era_name, era_lenses in LENSES_BY_ERA.items():
-            if any(lens in era_lenses for lens in discipline_lenses):
-                related_eras.add(era_name)
+        # Personas, functions and eras associated with this discipline's lenses
+        related_personas = related_personas_for(discipline_lenses)
+        related_functions = related_categories(discipline_lenses, lens_functions)
+        related_eras = related_categories(discipline_lenses, lens_eras)
 
         # Build tags for search
         tags = {discipline_name.lower()}
@@ -3731,32 +5419,19 @@ def get_all_entries():
     # ============================================================
     # 4. FUNCTIONS (⚙️)
     # ============================================================
+    tier_descriptions = {
+        "Tier 1: Contextual (What/Who/When)": "Analytical frameworks focused on contextual grounding: historical setting, biographical context, and temporal factors",
+        "Tier 2: Mechanical (How it Works)": "Analytical frameworks focused on structural analysis: formal properties, mechanisms, and systematic operations",
+        "Tier 3: Interpretive (Why it Matters)": "Analytical frameworks focused on meaning-making: philosophical implications, cultural significance, and interpretive depth"
+    }
     for function_name, function_lenses in LENSES_FUNCTIONAL.items():
         # Build description based on tier
-        tier_descriptions = {
-            "Tier 1: Contextual (What/Who/When)": "Analytical frameworks focused on contextual grounding: historical setting, biographical context, and temporal factors",
-            "Tier 2: Mechanical (How it Works)": "Analytical frameworks focused on structural analysis: formal properties, mechanisms, and systematic operations",
-            "Tier 3: Interpretive (Why it Matters)": "Analytical frameworks focused on meaning-making: philosophical implications, cultural significance, and interpretive depth"
-        }
         desc = tier_descriptions.get(function_name, f"Function tier containing {len(function_lenses)} analytical frameworks")
 
-        # Find all personas associated with this function's lenses
-        related_personas = set()
-        for lens_name in function_lenses:
-            if lens_name in PERSONA_POOL:
-                related_personas.update(PERSONA_POOL[lens_name])
-
-        # Find all disciplines that contain any of this function's lenses
-        related_disciplines = set()
-        for disc_name, disc_lenses in LENSES_HIERARCHY.items():
-            if any(lens in disc_lenses for lens in function_lenses):
-                related_disciplines.add(disc_name)
-
-        # Find all eras that contain any of this function's lenses
-        related_eras = set()
-        for era_name, era_lenses in LENSES_BY_ERA.items():
-            if any(lens in era_lenses for lens in function_lenses):
-                related_eras.add(era_name)
+        # Personas, disciplines and eras associated with this function's lenses
+        related_personas = related_personas_for(function_lenses)
+        related_disciplines = related_categories(function_lenses, lens_disciplines)
+        related_eras = related_categories(function_lenses, lens_eras)
 
         # Build tags for search
         tags = {function_name.lower()}
@@ -3786,23 +5461,10 @@ def get_all_entries():
         lens_count = len(era_lenses)
         desc = f"Historical period containing {lens_count} analytical framework{'s' if lens_count != 1 else ''}"
 
-        # Find all personas associated with this era's lenses
-        related_personas = set()
-        for lens_name in era_lenses:
-            if lens_name in PERSONA_POOL:
-                related_personas.update(PERSONA_POOL[lens_name])
-
-        # Find all disciplines that contain any of this era's lenses
-        related_disciplines = set()
-        for disc_name, disc_lenses in LENSES_HIERARCHY.items():
-            if any(lens in disc_lenses for lens in era_lenses):
-                related_disciplines.add(disc_name)
-
-        # Find all functions that contain any of this era's lenses
-        related_functions = set()
-        for func_name, func_lenses in LENSES_FUNCTIONAL.items():
-            if any(lens in func_lenses for lens in era_lenses):
-                related_functions.add(func_name)
+        # Personas, disciplines and functions associated with this era's lenses
+        related_personas = related_personas_for(era_lenses)
+        related_disciplines = related_categories(era_lenses, lens_disciplines)
+        related_functions = related_categories(era_lenses, lens_functions)
 
         # Build tags for search
         tags = {era_name.lower()}
@@ -3824,7 +5486,163 @@ def get_all_entries():
             'tags': tags
         })
 
-    return all_entries
+    return LibraryEntries(all_entries)
+
+# v10.6: Ranked inverted-index search shared by the Lens Library and the lens pickers
+SEARCH_FIELD_WEIGHTS = {"name": 3.0, "tags": 1.5, "description": 1.0, "sub_primers": 0.75}
+SEARCH_PREFIX_PENALTY = 0.8   # Score multiplier for prefix (as-you-type) term matches
+SEARCH_FUZZY_PENALTY = 0.5    # Score multiplier for typo-tolerant term matches
+SEARCH_NAME_BOOST = 2.0       # Score multiplier when every query term matches the entry's name
+SEARCH_BM25_K1 = 1.2
+SEARCH_BM25_B = 0.75
+
+def _tokenize_search_text(text):
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+def _within_edit_distance(a, b, max_distance):
+    """Edit distance check (insertions, deletions, substitutions and adjacent transpositions)."""
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            if before_previous and i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, before_previous[j - 2] + 1)
+            current.append(cost)
+        if min(current) > max_distance:
+            return False
+        before_previous, previous = previous, current
+    return previous[-1] <= max_distance
+
+class LibrarySearchIndex:
+    """
+    Inverted index over Library entries with BM25-style ranking.
+
+    Each entry is indexed by (type, name) across its name, tags, description and (for lenses)
+    sub_primers, with per-field weights. Query terms match exactly, as prefixes of indexed terms,
+    or (for terms of 4+ characters) fuzzily via a character-trigram index over the vocabulary.
+    Every query term must match for an entry to be returned.
+    """
+
+    def __init__(self, entries, catalog=None):
+        catalog = catalog or get_catalog()
+        self.keys = []
+        self.postings = {}     # term -> {doc_id: weighted term frequency}
+        self.doc_lengths = []
+        self.name_terms = []   # doc_id -> set of terms in the entry's name
+        self.trigrams = {}     # trigram -> set of vocabulary terms
+
+        for entry in entries:
+            doc_id = len(self.keys)
+            self.keys.append((entry['type'], entry['name']))
+            self.name_terms.append(set(_tokenize_search_text(entry['name'])))
+            fields = {
+                "name": entry['name'],
+                "tags": " ".join(sorted(entry['tags'])),
+                "description": entry['description'],
+            }
+            if entry['type'] == 'lens':
+                sub_primers = (catalog.get_lens_data(entry['name']) or {}).get('sub_primers') or {}
+                fields["sub_primers"] = " ".join(f"{title} {text}" for title, text in sub_primers.items())
+
+            length = 0.0
+            for field, text in fields.items():
+                weight = SEARCH_FIELD_WEIGHTS[field]
+                for term in _tokenize_search_text(text):
+                    doc_postings = self.postings.setdefault(term, {})
+                    doc_postings[doc_id] = doc_postings.get(doc_id, 0.0) + weight
+                    length += weight
+            self.doc_lengths.append(length)
+
+        self.average_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 1.0
+        self.vocabulary = sorted(self.postings)
+        for term in self.vocabulary:
+            for gram in self._trigrams(term):
+                self.trigrams.setdefault(gram, set()).add(term)
+
+        document_count = len(self.keys)
+        self.idf = {
+            term: math.log(1 + (document_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    @staticmethod
+    def _trigrams(term):
+        padded = f" {term} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _expand_term(self, query_term):
+        """Returns {indexed_term: multiplier} for exact, prefix and fuzzy matches of a query term."""
+        matches = {}
+        if query_term in self.postings:
+            matches[query_term] = 1.0
+
+        # Prefix matches (the vocabulary is sorted, so they are contiguous)
+        position = bisect.bisect_left(self.vocabulary, query_term)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(query_term):
+            matches.setdefault(self.vocabulary[position], SEARCH_PREFIX_PENALTY)
+            position += 1
+
+        # Typo-tolerant matches, only when nothing matched literally
+        if not matches and len(query_term) >= 4:
+            max_distance = 1 if len(query_term) < 8 else 2
+            query_grams = self._trigrams(query_term)
+            candidates = {}
+            for gram in query_grams:
+                for term in self.trigrams.get(gram, ()):
+                    candidates[term] = candidates.get(term, 0) + 1
+            for term, shared in candidates.items():
+                if shared * 3 >= len(query_grams) and _within_edit_distance(query_term, term, max_distance):
+                    matches[term] = SEARCH_FUZZY_PENALTY
+        return matches
+
+    def search(self, query, types=None):
+        """
+        Returns the (type, name) keys matching every query term, best match first.
+        types optionally restricts results to a collection of entry types.
+        """
+        query_terms = list(dict.fromkeys(_tokenize_search_text(query or "")))
+        if not query_terms:
+            return []
+
+        scores = None
+        expansions = []
+        for query_term in query_terms:
+            term_scores = {}
+            expanded = self._expand_term(query_term)
+            expansions.append(expanded.keys())
+            for term, multiplier in expanded.items():
+                idf = self.idf[term]
+                for doc_id, frequency in self.postings[term].items():
+                    norm = SEARCH_BM25_K1 * (1 - SEARCH_BM25_B + SEARCH_BM25_B * self.doc_lengths[doc_id] / self.average_length)
+                    score = multiplier * idf * frequency * (SEARCH_BM25_K1 + 1) / (frequency + norm)
+                    term_scores[doc_id] = max(term_scores.get(doc_id, 0.0), score)
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {doc_id: scores[doc_id] + score for doc_id, score in term_scores.items() if doc_id in scores}
+            if not scores:
+                return []
+
+        # Entries whose names contain every query term (e.g. the lens itself) outrank entries that merely mention it
+        for doc_id in scores:
+            if all(not self.name_terms[doc_id].isdisjoint(expanded) for expanded in expansions):
+                scores[doc_id] *= SEARCH_NAME_BOOST
+
+        ranked = sorted(scores, key=lambda doc_id: (-scores[doc_id], self.keys[doc_id]))
+        return [self.keys[doc_id] for doc_id in ranked if types is None or self.keys[doc_id][0] in types]
+
+@functools.lru_cache(maxsize=2)
+def _build_library_search_index(catalog):
+    return LibrarySearchIndex(get_all_entries(catalog), catalog)
+
+def get_library_search_index():
+    """Returns the shared Library search index (built once per process and catalog version)."""
+    return _build_library_search_index(get_catalog())
 
 def search_library_entries(all_entries, search_query, selected_types=None):
     """
@@ -3837,7 +5655,7 @@ def search_library_entries(all_entries, search_query, selected_types=None):
                        If None, includes all types. If empty list, includes nothing.
 
     Returns:
-        list: Filtered entries matching the search query and type filters
+        list: Filtered entries matching the search query and type filters (ranked by relevance when searching)
     """
     # If selected_types is an empty list, return nothing
     if selected_types is not None and len(selected_types) == 0:
@@ -3847,35 +5665,17 @@ def search_library_entries(all_entries, search_query, selected_types=None):
     if selected_types is None:
         selected_types = ['lens', 'persona', 'discipline', 'function', 'era']
 
-    filtered_entries = []
-    query_lower = search_query.lower() if search_query else ""
-
-    for entry in all_entries:
-        # Apply type filter - only include if type is in selected_types
-        if entry['type'] not in selected_types:
-            continue
-
-        # Apply search query (if provided)
-        if search_query:
-            # Search in name
-            if query_lower in entry['name'].lower():
-                filtered_entries.append(entry)
-                continue
-
-            # Search in description
-            if query_lower in entry['description'].lower():
-                filtered_entries.append(entry)
-                continue
-
-            # Search in tags (includes all related names)
-            if any(query_lower in tag for tag in entry['tags']):
-                filtered_entries.append(entry)
-                continue
-        else:
-            # No search query, just apply type filter
-            filtered_entries.append(entry)
+    # No search query, just apply type filter
+    if not search_query:
+        return [entry for entry in all_entries if entry['type'] in selected_types]
 
-    return filtered_entries
+    # v10.6: Ranked lookup in the shared inverted index (replaces per-entry substring scans)
+    if isinstance(all_entries, LibraryEntries):
+        entries_by_key = all_entries.by_key
+    else:
+        entries_by_key = {(entry['type'], entry['name']): entry for entry in all_entries}
+    ranked_keys = get_library_search_index().search(search_query, types=set(selected_types))
+    return [entries_by_key[key] for key in ranked_keys if key in entries_by_key]
 
 def get_cascading_filter_options(current_discipline, current_function, current_era, current_lens=None):
     """
@@ -3885,83 +5685,24 @@ def get_cascading_filter_options(current_discipline, current_function, current_e
     Returns: (available_disciplines, available_functions, available_eras, filtered_lenses, updated_discipline, updated_function, updated_era)
     The updated values reflect lens reverse-lookup if a lens is selected.
     """
-    from lenses import LENSES_HIERARCHY, LENSES_FUNCTIONAL, LENSES_BY_ERA, ERA_ORDER, SORTED_LENS_NAMES
-
-    # If a lens is selected, reverse-lookup its attributes by checking which categories contain it
+    # v10.6: Reverse lookups and option sets come from the precomputed LensIndex bitsets
+    LENS_INDEX = get_catalog().index
     updated_discipline = current_discipline
     updated_function = current_function
     updated_era = current_era
 
-    if current_lens:
-        # Find which discipline contains this lens
-        for disc_name, lenses in LENSES_HIERARCHY.items():
-            if current_lens in lenses:
-                updated_discipline = disc_name
-                break
+    if current_lens in LENS_INDEX.lens_ids:
+        updated_discipline = next(iter(LENS_INDEX.lens_disciplines[current_lens]), updated_discipline)
+        updated_function = next(iter(LENS_INDEX.lens_functions[current_lens]), updated_function)
+        updated_era = next(iter(LENS_INDEX.lens_eras[current_lens]), updated_era)
 
-        # Find which function contains this lens
-        for func_name, lenses in LENSES_FUNCTIONAL.items():
-            if current_lens in lenses:
-                updated_function = func_name
-                break
-
-        # Find which era contains this lens
-        for era_name, lenses in LENSES_BY_ERA.items():
-            if current_lens in lenses:
-                updated_era = era_name
-                break
-
-    # Use updated values for cascading calculation
-    work_discipline = updated_discipline
-    work_function = updated_function
-    work_era = updated_era
-
-    # Calculate which filter VALUES have at least one lens when combined with current selections
-    available_disciplines = set(["All Disciplines"])
-    available_functions = set(["All Functions"])
-    available_eras = set(["All Eras"])
-
-    # For each lens, check if it matches the current filters, and if so, add its categories as available
-    for lens_name in SORTED_LENS_NAMES:
-        # Check matches
-        func_match = (work_function == "All Functions" or lens_name in LENSES_FUNCTIONAL.get(work_function, []))
-        era_match = (work_era == "All Eras" or lens_name in LENSES_BY_ERA.get(work_era, []))
-        disc_match = (work_discipline == "All Disciplines" or lens_name in LENSES_HIERARCHY.get(work_discipline, []))
-
-        # If matches function+era, add its discipline
-        if func_match and era_match:
-            for disc_name, lenses in LENSES_HIERARCHY.items():
-                if lens_name in lenses:
-                    available_disciplines.add(disc_name)
-
-        # If matches discipline+era, add its function
-        if disc_match and era_match:
-            for func_name, lenses in LENSES_FUNCTIONAL.items():
-                if lens_name in lenses:
-                    available_functions.add(func_name)
-
-        # If matches discipline+function, add its era
-        if disc_match and func_match:
-            for era_name, lenses in LENSES_BY_ERA.items():
-                if lens_name in lenses:
-                    available_eras.add(era_name)
-
-    # Build filtered lens list
-    filtered_lenses = []
-    for lens_name in SORTED_LENS_NAMES:
-        if work_discipline != "All Disciplines" and lens_name not in LENSES_HIERARCHY.get(work_discipline, []):
-            continue
-        if work_function != "All Functions" and lens_name not in LENSES_FUNCTIONAL.get(work_function, []):
-            continue
-        if work_era != "All Eras" and lens_name not in LENSES_BY_ERA.get(work_era, []):
-            continue
-        filtered_lenses.append(lens_name)
+    cascade = LENS_INDEX.cascade(updated_discipline, updated_function, updated_era)
 
     return (
-        sorted(list(available_disciplines)),
-        sorted(list(available_functions)),
-        ["All Eras"] + [era for era in ERA_ORDER if era in available_eras and era != "All Eras"],
-        filtered_lenses,
+        cascade['disciplines'],
+        cascade['functions'],
+        cascade['eras'],
+        cascade['lenses'],
         updated_discipline,
         updated_function,
         updated_era
@@ -3977,20 +5718,13 @@ def render_lens_search(key_prefix):
     # Get current search query from session state
     search_query = st.session_state.get(f"{key_prefix}_search_input", "")
 
-    # Calculate matching lenses
+    # Calculate matching lenses (v10.6: ranked results from the shared Library search index)
     matching_lenses = []
-    if search_query and len(search_query) >= 1:
-        query_lower = search_query.lower()
-        for lens_name in SORTED_LENS_NAMES:
-            lens_data = get_lens_data(lens_name)
-            if lens_data:
-                name_match = query_lower in lens_name.lower()
-                desc_match = query_lower in lens_data.get("description", "").lower()
-                if name_match or desc_match:
-                    matching_lenses.append(lens_name)
+    if search_query and len(search_query) >= 2:
+        matching_lenses = [name for _, name in get_library_search_index().search(search_query, types={'lens'})]
 
     # Dynamic label with result counter
-    total_lenses = len(SORTED_LENS_NAMES)
+    total_lenses = len(lens_catalog.SORTED_LENS_NAMES)
     if search_query and len(search_query) >= 2:
         # Show results count
         if matching_lenses:
@@ -4045,9 +5779,9 @@ def render_persona_selector(lens_keyword, key_prefix):
     - "(No Persona)" if user wants generic archetypal title
     - Specific persona name if user selects one
     """
-    if lens_keyword and lens_keyword in PERSONA_POOL:
+    if lens_keyword and lens_keyword in lens_catalog.PERSONA_POOL:
         # Ensure the pool is sorted for consistent UI
-        pool = sorted(PERSONA_POOL[lens_keyword])
+        pool = sorted(lens_catalog.PERSONA_POOL[lens_keyword])
         # v10.1: Add three-tier options
         options = ["(All Personas - AI Decides)", "(No Persona - Generic Title)"] + pool
 
@@ -4110,6 +5844,11 @@ def cleanup_other_pages_files(current_page):
             work_input = st.session_state.work_input_comparative_b
             work_input.cleanup_gemini_file()
             st.session_state.work_input_comparative_b = WorkInput()
+        # v10.6: Additional corpus works (Work C onwards)
+        if 'work_input_comparative_extra' in st.session_state:
+            for work_input in st.session_state.work_input_comparative_extra:
+                work_input.cleanup_gemini_file()
+            st.session_state.work_input_comparative_extra = []
 
 
 def initialize_page_config(title):
@@ -4182,6 +5921,18 @@ def render_sidebar_settings():
     # v10.2: Initialize Analysis Mode state (API key now initialized in render_api_configuration)
     if 'analysis_mode' not in st.session_state:
         st.session_state.analysis_mode = MODE_ADAPTIVE
+    if 'hedge_specialists' not in st.session_state:
+        st.session_state.hedge_specialists = True
+    if 'speculative_theoretician' not in st.session_state:
+        st.session_state.speculative_theoretician = True
+    if 'local_triage' not in st.session_state:
+        st.session_state.local_triage = False
+    if 'swarm_quorum' not in st.session_state:
+        st.session_state.swarm_quorum = dict(SWARM_QUORUM_BY_MODE)
+    if 'lens_preranking' not in st.session_state:
+        st.session_state.lens_preranking = True
+    if 'reuse_perspectives' not in st.session_state:
+        st.session_state.reuse_perspectives = True
 
     with st.sidebar:
         st.header("🏛️ Janus Settings")
@@ -4193,4 +5944,52 @@ def render_sidebar_settings():
                 ANALYSIS_MODES,
                 key="analysis_mode",
                 help=f"**{MODE_ADAPTIVE}:** {get_tooltip('adaptive_analysis')}  \n\n**{MODE_SURFACE_SCRAPE}:** {get_tooltip('surface_scrape')}  \n\n**{MODE_DEEP_DIVE}:** {get_tooltip('deep_dive')}"
-            )
\ No newline at end of file
+            )
+
+            # v10.6: Speculative Theoretician toggle (Adaptive mode only)
+            if st.session_state.analysis_mode == MODE_ADAPTIVE:
+                st.checkbox(
+                    "Speculative strategy during Triage",
+                    key="speculative_theoretician",
+                    help=get_tooltip("speculative_theoretician")
+                )
+                # v10.6: Local heuristic Triage (opt-in)
+                st.checkbox(
+                    "Local Triage for clear-cut texts",
+                    key="local_triage",
+                    help=get_tooltip("local_triage")
+                )
+
+            # v10.6: Request hedging toggle for the Specialist Swarm
+            st.checkbox(
+                "Hedge slow specialists",
+                key="hedge_specialists",
+                help=get_tooltip("request_hedging")
+            )
+
+            # v10.6: Local lens pre-ranking for Smart Selection
+            st.checkbox(
+                "Pre-rank lenses for Smart Selection",
+                key="lens_preranking",
+                help=get_tooltip("lens_preranking")
+            )
+
+            # v10.6: Incremental recomputation toggle
+            st.checkbox(
+                "Reuse unchanged perspectives",
+                key="reuse_perspectives",
+                help=get_tooltip("reuse_perspectives")
+            )
+
+            # v10.6: Specialist quorum knob (stored per analysis mode)
+            current_mode = st.session_state.analysis_mode
+            quorum_pct = st.slider(
+                f"Specialist Quorum ({current_mode}):",
+                min_value=50,
+                max_value=100,
+                value=int(get_swarm_quorum(current_mode) * 100),
+                step=10,
+                format="%d%%",
+                help=get_tooltip("swarm_quorum")
+            )
+            st.session_state.swarm_quorum[current_mode] = quorum_pct / 100
\ No newline at end of file